@@ -10,6 +10,8 @@ Architecture:
    - Source of truth for all default settings
    - Used when no per-app profile exists (upstream behavior)
    - Keys: cropUp, cropLeft, cropRight, cropDown, target, threshold, interval
+     (upstream), plus targets, targetIntervals, maxInFlight, targetMaxInFlight
+     (see PROFILE_KEYS)
    - Single rectangle management system using main crop settings only
 
 2. Per-App Profiles (JSON files in PROFILES_DIR):
@@ -43,34 +45,43 @@ Key Methods:
 - _normalizeProfileToOverrides(data): Migration helper for legacy profiles
 """
 
+import time
+# Start of the module import, reported with the addon's load times
+_importStart = time.perf_counter()
 import globalPluginHandler
 import addonHandler
 import scriptHandler
 import api
-import contentRecog, contentRecog.uwpOcr
+import contentRecog
 import screenBitmap
+import winGDI
 import logHandler
 import gui
 import tones
 import textInfos
 import ui
-import time
 import queueHandler
 import threading
 import config
 import wx
 import locationHelper
-try:
-	from . import lionGui
-except Exception:
-	lionGui = None
-	logHandler.log.error("LionEvolutionPro: Failed to import lionGui", exc_info=True)
 from scriptHandler import getLastScriptRepeatCount, script
+from . import lionPerf
+from . import lionRecorder
+from . import lionMemory
+from . import lionGovernor
+from . import lionBackends
+from . import lionTuning
+from . import lionFilters
+from . import lionHistory
+from . import lionMosaic
+from . import lionCapture
 
 from difflib import SequenceMatcher
 import ctypes
 import os
 import json
+import concurrent.futures
 import globalVars
 
 
@@ -78,13 +89,38 @@ addonHandler.initTranslation()
 
 ADDON_NAME = "LionEvolutionPro"
 PROFILES_DIR = os.path.join(globalVars.appArgs.configPath, "addons", ADDON_NAME, "profiles")
+RECORDINGS_DIR = os.path.join(globalVars.appArgs.configPath, "addons", ADDON_NAME, "recordings")
+# Seconds after loading before the profile summary is built (keeps it out of NVDA startup)
+PROFILE_SCAN_DELAY = 10.0
+
+# Settings GUI (wx frames), imported by _loadGui() when first needed
+lionGui = None
+
+
+def _loadGui():
+	"""Import lionGui on first use.
+	
+	Returns:
+		module or None: lionGui, None if it failed to import
+	"""
+	global lionGui
+	if lionGui is None:
+		try:
+			from . import lionGui as module
+			lionGui = module
+		except Exception:
+			logHandler.log.error(f"{ADDON_NAME}: Failed to import lionGui", exc_info=True)
+	return lionGui
 
-if not os.path.exists(PROFILES_DIR):
-	try:
-		os.makedirs(PROFILES_DIR)
-		logHandler.log.info(f"{ADDON_NAME}: Profiles directory created at {PROFILES_DIR}")
-	except Exception as e:
-		logHandler.log.error(f"{ADDON_NAME}: Failed to create profiles directory: {e}")
+
+def _ensureProfilesDir():
+	"""Create PROFILES_DIR before the first profile is written."""
+	if not os.path.isdir(PROFILES_DIR):
+		try:
+			os.makedirs(PROFILES_DIR, exist_ok=True)
+			logHandler.log.info(f"{ADDON_NAME}: Profiles directory created at {PROFILES_DIR}")
+		except Exception as e:
+			logHandler.log.error(f"{ADDON_NAME}: Failed to create profiles directory: {e}")
 
 
 confspec={
@@ -94,10 +130,60 @@ confspec={
 	"cropDown": "integer(0,100,default=0)",
 	"target": "integer(0,3,default=1)",
 	"threshold": "float(0.0,1.0,default=0.5)",
-	"interval": "float(0.0,10.0,default=1.0)"
+	"interval": "float(0.0,10.0,default=1.0)",
+	"targets": "int_list(default=list())",
+	"targetIntervals": "float_list(default=list())",
+	"maxInFlight": "integer(1,4,default=1)",
+	"targetMaxInFlight": "int_list(default=list())",
+	"rescanOnFocus": "boolean(default=True)",
+	"perfStats": "boolean(default=False)",
+	"recordPixels": "boolean(default=False)",
+	"memTraceSeconds": "integer(5,3600,default=60)",
+	"idleAfter": "integer(0,86400,default=0)",
+	"idleInterval": "float(1.0,60.0,default=5.0)",
+	"cpuBudget": "integer(0,100,default=0)",
+	"backend": "string(default=uwp)",
+	"language": "string(default='')",
+	"roiLearnSeconds": "integer(10,3600,default=120)",
+	"roiAutoApply": "boolean(default=False)",
+	"calibrationFrames": "integer(5,1000,default=30)",
+	"filters": "string_list(default=list('line:Play'))",
+	"historyBytes": "integer(0,67108864,default=1048576)",
+	"minWordConfidence": "float(0.0,1.0,default=0.0)",
+	"minWordHeight": "integer(0,100,default=0)",
+	"dropEdgeWords": "boolean(default=False)",
+	"stableFrames": "integer(0,100,default=0)",
+	"stableMs": "integer(0,10000,default=0)",
+	"mosaic": "boolean(default=False)"
 }
 config.conf.spec["lion"]=confspec
 
+# Placeholder object passed to makeTextInfo; created once instead of a new
+# class per recognition result (classes are cyclic and only freed by gc)
+_RESULT_OWNER = type('NVDAObjects.NVDAObject', (), {})()
+
+# OCR lifecycle states (GlobalPlugin.ocrState)
+OCR_STOPPED = "stopped"
+OCR_STARTING = "starting"
+OCR_RUNNING = "running"
+OCR_STOPPING = "stopping"
+
+# Keys a per-app profile may override; missing keys fall back to config.conf["lion"]
+PROFILE_KEYS = (
+	"cropLeft", "cropRight", "cropUp", "cropDown", "target", "threshold", "interval",
+	"targets", "targetIntervals", "maxInFlight", "targetMaxInFlight", "cpuBudget", "backend", "language", "filters",
+	"minWordConfidence", "minWordHeight", "dropEdgeWords", "stableFrames", "stableMs", "mosaic",
+)
+
+# OCR targets: 0=navigator object, 1=whole screen, 2=foreground window, 3=focus object
+TARGET_INDEXES = (0, 1, 2, 3)
+# api getter used to resolve each object-based target (whole screen needs none)
+TARGET_OBJECT_GETTERS = {
+	0: "getNavigatorObject",
+	2: "getForegroundObject",
+	3: "getFocusObject",
+}
+
 class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	"""LION Evolution Pro global plugin.
 	
@@ -108,42 +194,256 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 	currentAppProfile = "global"
 	currentProfileData = {}
 	
-	user32 = ctypes.windll.user32
-	resX, resY= user32.GetSystemMetrics(0), user32.GetSystemMetrics(1)
+	# Screen size in pixels, read on first use and again whenever scanning starts
+	_screenMetrics = None
 	
 	def __init__(self):
+		initStart = time.perf_counter()
 		super(GlobalPlugin, self).__init__()
 		self.settingsDialog = None
 		self._stateLock = threading.Lock()
 		self._ocrState = {}
 		self._cleanupInProgress = False  # Prevent race condition in cache cleanup
 		self._profileLock = threading.Lock()
-		# OCR thread lifecycle management
+		# OCR thread lifecycle management (state machine guarded by _ocrLock).
+		# Each start/stop bumps _ocrGeneration; a loop, scan job or recognizer
+		# callback belonging to an older generation is abandoned and ignored.
 		self._ocrThread = None
-		self._ocrActive = threading.Event()  # Thread-safe control flag
-		self._ocrLock = threading.Lock()  # Prevent duplicate starts
+		self.ocrState = OCR_STOPPED
+		self._ocrGeneration = 0
+		self._ocrActive = threading.Event()  # Set while starting/running
+		self._ocrWake = threading.Event()  # Set to interrupt the wait between scans
+		# Immediate rescan requests from focus/foreground/profile events
+		self._rescanLock = threading.Lock()
+		self._rescanTargets = set()
+		self._lastForcedScan = 0.0
+		# Keys whose immediate rescan found a recognition in flight: rescanned on its callback
+		self._rescanWhenIdle = set()
+		self._ocrLock = threading.Lock()  # Serializes lifecycle transitions
 		# OCR state cache limits to prevent memory leak
 		self.MAX_STATE_ENTRIES_PER_APP = 10
 		self.MAX_TOTAL_STATE_ENTRIES = 100
+		# A recognition without callback after IN_FLIGHT_TIMEOUT seconds is abandoned
+		self.IN_FLIGHT_TIMEOUT = 15.0
+		# Worker threads capturing/submitting scans of concurrently enabled targets
+		self.SCAN_WORKERS = 4
+		# Minimum seconds between event-triggered immediate rescans (storm protection)
+		self.RESCAN_MIN_INTERVAL = 0.5
+		# Re-query a cached target location at least this often (seconds)
+		self.TARGET_GEOMETRY_MAX_AGE = 5.0
+		# Idle/lock governor consulted by the scan loop every tick
+		try:
+			conditions = lionGovernor.WindowsConditions(self._isSleepMode)
+		except Exception as e:
+			logHandler.log.warning(f"{ADDON_NAME}: Idle detection unavailable ({e}), scanning continuously")
+			conditions = lionGovernor.ActivityConditions()
+		self._governor = lionGovernor.ScanGovernor(conditions)
+		# Recognizer time accounting for the "cpuBudget" setting
+		self._cpuBudget = lionGovernor.CpuBudget()
+		# Unknown "backend" names already reported (logged once each)
+		self._unknownBackends = set()
+		# Region of interest learning: (appName, targetIndex, RoiLearner) while
+		# learning, and the (appName, crop) proposal awaiting confirmation
+		self._roiLearning = None
+		self._roiProposal = None
+		# Threshold calibration: (appName, targetIndex, ThresholdCalibrator) while sampling
+		self._calibration = None
+		# Compiled text filters by rule tuple (see _getTextFilter)
+		self._textFilters = {}
+		# Profile summary for the profile list: profile name -> has overrides. Built
+		# once off the GUI thread after loading (and on rescanProfiles), then updated
+		# in place by load, save, clear and delete, so listing profiles reads no files.
+		# While a scan runs, its callbacks and the updates made meanwhile are kept
+		self._profileSummaryLock = threading.Lock()
+		self._profileSummary = None
+		self._profileScanCallbacks = None
+		self._profileSummaryChanges = None
+		# Unsaved settings applied to the running scan loop: (appName, values) or None
+		self._liveOverrides = None
+		# Announcements queued on the event queue and not spoken yet
+		self._speechLock = threading.Lock()
+		self._speechBacklog = 0
+		# Announced text for review, and the entry id last reviewed (None: start at the newest)
+		self._history = lionHistory.AnnouncementHistory(config.conf["lion"]["historyBytes"], indexed=True)
+		self.historyDialog = None
+		self._historyCursor = None
 		# Initialize to global profile (no overrides)
 		self.loadGlobalProfile()
-		# Initialize last-valid targets to CROPPED screen (not raw)
-		# Use default/global config for initial crop (safe copy)
-		defaultCfg = {k: config.conf["lion"][k] for k in config.conf["lion"]}
-		screenRaw = locationHelper.RectLTWH(0, 0, 
-			ctypes.windll.user32.GetSystemMetrics(0), 
-			ctypes.windll.user32.GetSystemMetrics(1))
-		# Apply crop with default config
-		screenRect = self.cropRectLTWH(screenRaw, defaultCfg)
-		self._lastTargets = {0: screenRect, 1: screenRect, 2: screenRect, 3: screenRect}
+		# Last-valid target rectangles, filled when scanning starts (see _defaultTarget)
+		self._lastTargets = {}
+		# Object location reads performed by the current scan tick (instrumentation;
+		# reset by the loop thread and counted by resolving threads under _geometryLock)
+		self._a11yCallsThisTick = 0
+		# Event-invalidated geometry cache: target index -> {obj, location, time, dirty}
+		self._geometryLock = threading.Lock()
+		self._targetGeometry = {}
+		self._geometryCacheHits = 0
+		self._geometryCacheMisses = 0
+		# Per-stage latency histograms (no-op unless enabled)
+		self._perf = lionPerf.PerfStats(enabled=config.conf["lion"]["perfStats"])
+		# Session recorder (lionRecorder.SessionRecorder) while recording, else None
+		self._recorder = None
+		# Pixel buffers handed to the recognizer and not yet returned by its callback
+		self._inFlight = lionMemory.InFlightBuffers()
+		# Screen bitmaps and pixel buffers reused across scans (see lionCapture);
+		# idle ones are bounded in bytes and freed after lionCapture.IDLE_SECONDS
+		self._capturePool = lionCapture.CapturePool(screenBitmap.ScreenBitmap)
+		self._mosaicPool = lionCapture.CapturePool()
+		# Cleared if capturing into an existing buffer fails (then captureImage allocates)
+		self._reuseCaptureBuffers = True
+		# Opt-in tracemalloc trace (lionMemory.AllocationTrace) and its auto-stop timer
+		self._allocTrace = None
+		self._allocTraceTimer = None
+		self._profileScanTimer = threading.Timer(PROFILE_SCAN_DELAY, self.rescanProfiles)
+		self._profileScanTimer.daemon = True
+		self._profileScanTimer.start()
 		try:
 			self.createMenu()
 		except Exception:
 			logHandler.log.exception(f"{ADDON_NAME}: Failed to create menu")
+		self.loadTimes = {"import": IMPORT_SECONDS, "init": time.perf_counter() - initStart}
+		logHandler.log.info(f"{ADDON_NAME}: Loaded ({self.describeLoadTimes()})")
+	
+	def describeLoadTimes(self):
+		"""Module import and __init__ durations, e.g. "import 12.3 ms, init 0.8 ms"."""
+		return (f"import {self.loadTimes['import'] * 1000:.1f} ms, "
+			f"init {self.loadTimes['init'] * 1000:.1f} ms")
+	
+	@property
+	def resX(self):
+		return self._screenSize()[0]
+	
+	@property
+	def resY(self):
+		return self._screenSize()[1]
+	
+	def _screenSize(self, refresh=False):
+		"""Screen width and height in pixels, read on first use (or when refresh is set)."""
+		if refresh or self._screenMetrics is None:
+			user32 = ctypes.windll.user32
+			self._screenMetrics = (user32.GetSystemMetrics(0), user32.GetSystemMetrics(1))
+		return self._screenMetrics
+	
+	def _defaultTarget(self):
+		"""Whole screen cropped with the global settings: the target used until one resolves."""
+		defaultCfg = {k: config.conf["lion"][k] for k in config.conf["lion"]}
+		return self.cropRectLTWH(locationHelper.RectLTWH(0, 0, self.resX, self.resY), defaultCfg)
+	
+	def _profileName(self, appName):
+		"""Profile name as stored on disk (file name without .json)."""
+		return "".join(x for x in appName if x.isalnum() or x in "-_")
 	
 	def getProfilePath(self, appName):
-		safeName = "".join(x for x in appName if x.isalnum() or x in "-_")
-		return os.path.join(PROFILES_DIR, f"{safeName}.json")
+		return os.path.join(PROFILES_DIR, f"{self._profileName(appName)}.json")
+	
+	def _readProfileFile(self, path):
+		"""Read one profile file.
+		
+		Returns:
+			dict or None: Profile data, None if the file is unreadable or not a JSON object
+		"""
+		try:
+			with open(path, "r", encoding="utf-8") as f:
+				data = json.load(f)
+		except Exception as e:
+			logHandler.log.error(f"{ADDON_NAME}: Error reading profile {os.path.basename(path)}: {e}")
+			return None
+		return data if isinstance(data, dict) else None
+	
+	def _hasOverrides(self, profileData):
+		"""Whether stored profile data differs from the global configuration."""
+		return bool(profileData) and bool(self._normalizeProfileToOverrides(profileData))
+	
+	def rescanProfiles(self, onDone=None):
+		"""Rebuild the profile summary from the profile files in a background thread.
+		
+		Picks up profile files added or edited by hand; a rescan requested while
+		one runs is served by it.
+		
+		Args:
+			onDone: Called without arguments from the scanning thread once the summary is built
+		"""
+		with self._profileSummaryLock:
+			scanning = self._profileScanCallbacks is not None
+			if not scanning:
+				self._profileScanCallbacks = []
+				self._profileSummaryChanges = {}
+			if onDone is not None:
+				self._profileScanCallbacks.append(onDone)
+		if not scanning:
+			threading.Thread(target=self._scanProfiles, name=f"{ADDON_NAME}-profiles", daemon=True).start()
+	
+	def _scanProfiles(self):
+		"""Read every profile file into the summary (see rescanProfiles)."""
+		summary = {}
+		try:
+			fileNames = os.listdir(PROFILES_DIR)
+		except OSError:
+			fileNames = []
+		for fileName in fileNames:
+			if fileName.endswith(".json"):
+				data = self._readProfileFile(os.path.join(PROFILES_DIR, fileName))
+				summary[fileName[:-5]] = self._hasOverrides(data)
+		with self._profileSummaryLock:
+			# Loads, saves and deletions made while scanning are newer than the files read
+			for name, hasOverrides in self._profileSummaryChanges.items():
+				if hasOverrides is None:
+					summary.pop(name, None)
+				else:
+					summary[name] = hasOverrides
+			self._profileSummary = summary
+			self._profileSummaryChanges = None
+			callbacks, self._profileScanCallbacks = self._profileScanCallbacks, None
+		logHandler.log.debug(f"{ADDON_NAME}: Scanned {len(summary)} profiles")
+		for callback in callbacks:
+			try:
+				callback()
+			except Exception:
+				logHandler.log.exception(f"{ADDON_NAME}: Error in profile scan callback")
+	
+	def _updateProfileSummary(self, appName, hasOverrides):
+		"""Record a profile's state after it was read, written or deleted.
+		
+		Args:
+			appName: Application name
+			hasOverrides: bool, None after the profile was deleted
+		"""
+		name = self._profileName(appName)
+		with self._profileSummaryLock:
+			if self._profileSummaryChanges is not None:
+				self._profileSummaryChanges[name] = hasOverrides
+			if self._profileSummary is None:
+				return
+			if hasOverrides is None:
+				self._profileSummary.pop(name, None)
+			else:
+				self._profileSummary[name] = hasOverrides
+	
+	def getProfileSummary(self, onReady=None):
+		"""List profiles for display from the in-memory summary (no file I/O).
+		
+		Until the summary is built only "global" and the active profile are listed;
+		the scan is started then and onReady called when it completes.
+		
+		Args:
+			onReady: Called without arguments from the scanning thread if the summary was not built yet
+		
+		Returns:
+			list: (name, hasOverrides, isActive) tuples, "global" first, then by name
+		"""
+		active = self.currentAppProfile
+		activeName = self._profileName(active)
+		rows = [("global", False, active == "global")]
+		with self._profileSummaryLock:
+			items = None if self._profileSummary is None else sorted(self._profileSummary.items())
+		if items is None:
+			self.rescanProfiles(onReady)
+			if active != "global":
+				rows.append((activeName, bool(self.currentProfileData), True))
+			return rows
+		for name, hasOverrides in items:
+			rows.append((name, hasOverrides, active != "global" and name == activeName))
+		return rows
 	
 	def getEffectiveConfig(self, appName):
 		"""Get effective configuration by merging global config + per-app overrides.
@@ -155,15 +455,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			dict: Merged configuration (global base + profile overrides)
 		"""
 		# Start with global config as base
-		effective = {
-			"cropLeft": config.conf["lion"]["cropLeft"],
-			"cropRight": config.conf["lion"]["cropRight"],
-			"cropUp": config.conf["lion"]["cropUp"],
-			"cropDown": config.conf["lion"]["cropDown"],
-			"target": config.conf["lion"]["target"],
-			"threshold": config.conf["lion"]["threshold"],
-			"interval": config.conf["lion"]["interval"]
-		}
+		effective = {key: config.conf["lion"][key] for key in PROFILE_KEYS}
 		
 		# If not global and we have profile data, apply overrides
 		if appName != "global" and self.currentProfileData:
@@ -175,8 +467,15 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		"""Load global profile - resets to using config.conf["lion"] only."""
 		self.currentAppProfile = "global"
 		self.currentProfileData = {}
+		self._applyGlobalSettings()
 		logHandler.log.info(f"{ADDON_NAME}: Loaded Global Profile (no overrides)")
 	
+	def _applyGlobalSettings(self):
+		"""Apply global settings the scan loop does not snapshot (historyBytes)."""
+		historyBytes = config.conf["lion"]["historyBytes"]
+		if self._history.maxBytes != historyBytes:
+			self._history.setMaxBytes(historyBytes)
+	
 	def _normalizeProfileToOverrides(self, profileData):
 		"""Normalize profile data to contain only overrides (values that differ from global).
 		
@@ -190,10 +489,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		"""
 		overrides = {}
 		
-		# Define keys that should be checked against global config
-		standardKeys = ["cropLeft", "cropRight", "cropUp", "cropDown", "target", "threshold", "interval"]
-		
-		for key in standardKeys:
+		for key in PROFILE_KEYS:
 			if key in profileData:
 				# Only keep if different from global
 				if profileData[key] != config.conf["lion"][key]:
@@ -210,11 +506,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		Args:
 			appName: Application name to load profile for
 		"""
+		self._applyGlobalSettings()
 		path = self.getProfilePath(appName)
+		# Only this app's file is read, so profiles edited on disk apply on the next switch
 		if os.path.exists(path):
 			try:
-				with open(path, "r", encoding="utf-8") as f:
-					rawProfileData = json.load(f)
+				rawProfileData = self._readProfileFile(path)
+				if rawProfileData is None:
+					raise ValueError(f"unreadable profile file {path}")
 				
 				# Migrate/normalize: convert full config to overrides-only
 				profileData = self._normalizeProfileToOverrides(rawProfileData)
@@ -224,6 +523,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 					logHandler.log.info(f"{ADDON_NAME}: Profile for {appName} exists but is empty (same as global)")
 					self.currentAppProfile = appName
 					self.currentProfileData = {}
+					self._updateProfileSummary(appName, False)
 					# Save normalized/empty profile back to disk if migration occurred
 					if profileData != rawProfileData:
 						try:
@@ -245,12 +545,14 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				
 				self.currentProfileData = profileData
 				self.currentAppProfile = appName
+				self._updateProfileSummary(appName, True)
 				logHandler.log.info(f"{ADDON_NAME}: Loaded profile overrides for {appName}")
 				return
-			except json.JSONDecodeError as e:
-				logHandler.log.error(f"{ADDON_NAME}: Invalid JSON in profile for {appName}: {e}", exc_info=True)
 			except Exception as e:
 				logHandler.log.error(f"{ADDON_NAME}: Error loading profile for {appName}: {e}", exc_info=True)
+				self._updateProfileSummary(appName, False)
+		else:
+			self._updateProfileSummary(appName, None)
 		
 		# No profile exists or failed to load - fall back to global (upstream behavior)
 		self.currentAppProfile = "global"
@@ -265,11 +567,17 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			data: Profile data dict (should contain only overrides)
 		"""
 		path = self.getProfilePath(appName)
+		_ensureProfilesDir()
 		try:
 			with open(path, "w", encoding="utf-8") as f:
 				json.dump(data, f, indent=2)
 			self.currentAppProfile = appName
 			self.currentProfileData = data
+			self._updateProfileSummary(appName, self._hasOverrides(data))
+			live = self._liveOverrides
+			if live and live[0] == appName:
+				# Saved values replace the ones being tuned (callers may hold _profileLock)
+				self._liveOverrides = None
 			logHandler.log.info(f"{ADDON_NAME}: Saved profile for {appName} (overrides only)")
 		except Exception as e:
 			logHandler.log.error(f"{ADDON_NAME}: Error saving profile for {appName}: {e}")
@@ -282,10 +590,12 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				logHandler.log.info(f"{ADDON_NAME}: Deleted profile for {appName}")
 			except Exception as e:
 				logHandler.log.error(f"{ADDON_NAME}: Error deleting profile for {appName}: {e}")
+		if not os.path.exists(path):
+			self._updateProfileSummary(appName, None)
 		self.loadGlobalProfile()
 	
 	def profileExists(self, appName):
-		"""Check if a profile file exists for the given app.
+		"""Check if a profile exists for the given app.
 		
 		Args:
 			appName: Application name
@@ -293,31 +603,25 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		Returns:
 			bool: True if profile file exists, False otherwise
 		"""
-		path = self.getProfilePath(appName)
-		return os.path.exists(path)
+		return os.path.exists(self.getProfilePath(appName))
 	
 	def profileHasOverrides(self, appName):
 		"""Check if a profile has non-empty overrides.
 		
+		Answered from the profile summary once built, else by reading this app's profile.
+		
 		Args:
 			appName: Application name
 			
 		Returns:
 			bool: True if profile exists and has overrides, False if empty or doesn't exist
 		"""
-		if not self.profileExists(appName):
-			return False
-		
+		with self._profileSummaryLock:
+			if self._profileSummary is not None:
+				return self._profileSummary.get(self._profileName(appName), False)
 		path = self.getProfilePath(appName)
-		try:
-			with open(path, "r", encoding="utf-8") as f:
-				data = json.load(f)
-			# Normalize to check if it has any overrides
-			normalized = self._normalizeProfileToOverrides(data)
-			return bool(normalized)
-		except Exception as e:
-			logHandler.log.error(f"{ADDON_NAME}: Error checking overrides for {appName}: {e}", exc_info=True)
-			return False
+		data = self._readProfileFile(path) if os.path.exists(path) else None
+		return self._hasOverrides(data)
 	
 	def setActiveProfile(self, appName):
 		"""Set the active profile by loading the specified app profile.
@@ -330,6 +634,7 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		else:
 			self.loadProfileForApp(appName)
 		logHandler.log.info(f"{ADDON_NAME}: Active profile set to {self.currentAppProfile}")
+		self.requestRescan()
 	
 	def clearOverridesForApp(self, appName):
 		"""Clear all overrides for an app profile but keep it active.
@@ -346,9 +651,11 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		
 		# Write empty profile to disk (keep it persistent)
 		path = self.getProfilePath(appName)
+		_ensureProfilesDir()
 		try:
 			with open(path, "w", encoding="utf-8") as f:
 				json.dump({}, f, indent=2)
+			self._updateProfileSummary(appName, False)
 			logHandler.log.info(f"{ADDON_NAME}: Cleared overrides for {appName}, wrote empty profile")
 		except Exception as e:
 			logHandler.log.error(f"{ADDON_NAME}: Error writing empty profile for {appName}: {e}", exc_info=True)
@@ -371,14 +678,13 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			logHandler.log.exception(f"{ADDON_NAME}: Error in createMenu")
 
 	def terminate(self):
-		# Stop OCR thread first if it's running
-		if hasattr(self, '_ocrActive') and hasattr(self, '_ocrThread'):
-			if self._ocrThread and self._ocrThread.is_alive():
-				logHandler.log.info(f"{ADDON_NAME}: Stopping OCR thread in terminate()")
-				self._ocrActive.clear()
-				self._ocrThread.join(timeout=3.0)
-				if self._ocrThread.is_alive():
-					logHandler.log.warning(f"{ADDON_NAME}: OCR thread did not stop in terminate()")
+		self._profileScanTimer.cancel()
+		self.stopRecording()
+		self.stopAllocationTrace()
+		# Stop OCR without waiting: the daemon loop thread exits on its own and
+		# late recognizer callbacks are ignored by generation
+		if self.stopOcr():
+			logHandler.log.info(f"{ADDON_NAME}: Stopped OCR in terminate()")
 		
 		# Clean up UI components
 		try:
@@ -399,8 +705,8 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			logHandler.log.exception(f"{ADDON_NAME}: Error removing menu item in terminate")
 
 	def onSettings(self, evt):
-		# Check if lionGui module loaded successfully
-		if lionGui is None:
+		# Import the GUI on first use; check it loaded successfully
+		if _loadGui() is None:
 			logHandler.log.error(f"{ADDON_NAME}: Cannot open settings - lionGui module failed to load")
 			ui.message(_("Error: Settings module not available"))
 			return
@@ -431,57 +737,137 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			ui.message(_("Error opening settings"))
 
 	def script_ReadLiveOcr(self, gesture):
-		"""Toggle OCR with robust thread management"""
+		"""Toggle OCR. Never blocks: a stopping loop is abandoned, not joined"""
 		repeat = getLastScriptRepeatCount()
 #		if repeat>=2:
 #			ui.message("o sa vine profile")
 		
+		if self.ocrState in (OCR_STARTING, OCR_RUNNING):
+			if self.stopOcr():
+				tones.beep(222, 333)
+				queueHandler.queueFunction(queueHandler.eventQueue, ui.message, _("lion stopped"))
+		elif self.startOcr():
+			tones.beep(444, 333)
+			queueHandler.queueFunction(queueHandler.eventQueue, ui.message, _("lion started"))
+	
+	def startOcr(self):
+		"""Start a new OCR loop generation (stopped/stopping -> starting).
+		
+		A loop still winding down from a previous stop is not waited for; it
+		sees its generation is stale and exits on its own.
+		
+		Returns:
+			bool: True if a loop was started, False if one was already starting/running
+		"""
 		with self._ocrLock:
-			if self._ocrThread and self._ocrThread.is_alive():
-				# Stop existing thread
-				self._ocrActive.clear()
-				logHandler.log.info(f"{ADDON_NAME}: Stopping OCR thread...")
+			if self.ocrState in (OCR_STARTING, OCR_RUNNING):
+				return False
+			self._ocrGeneration += 1
+			generation = self._ocrGeneration
+			self.ocrState = OCR_STARTING
+			# Screen geometry is read when scanning starts (and may have changed since the last start)
+			self._screenSize(refresh=True)
+			defaultTarget = self._defaultTarget()
+			for index in TARGET_INDEXES:
+				self._lastTargets.setdefault(index, defaultTarget)
+			self._ocrActive.set()
+			self._ocrWake.clear()
+			self._ocrThread = threading.Thread(target=self.ocrLoop, args=(generation,),
+				name=f"{ADDON_NAME}Ocr{generation}", daemon=True)
+			self._ocrThread.start()
+		logHandler.log.info(f"{ADDON_NAME}: OCR generation {generation} starting")
+		return True
+	
+	def stopOcr(self):
+		"""Stop the current OCR loop generation (starting/running -> stopping).
 		
-		# Wait outside lock to allow thread to finish
-		if self._ocrThread and self._ocrThread.is_alive():
-			self._ocrThread.join(timeout=2.0)
-			if self._ocrThread.is_alive():
-				logHandler.log.warning(f"{ADDON_NAME}: OCR thread did not stop gracefully")
+		Returns immediately; the loop thread moves the state to stopped when it
+		exits, unless a newer generation was started meanwhile.
 		
+		Returns:
+			bool: True if a loop was asked to stop, False if none was active
+		"""
 		with self._ocrLock:
-			if self._ocrThread and self._ocrThread.is_alive():
-				# Still alive - user is stopping
-				tones.beep(222, 333)
-				queueHandler.queueFunction(queueHandler.eventQueue, ui.message, _("lion stopped"))
+			if self.ocrState not in (OCR_STARTING, OCR_RUNNING):
+				return False
+			self._ocrGeneration += 1
+			self.ocrState = OCR_STOPPING
+			self._ocrActive.clear()
+			self._ocrWake.set()
+			self._ocrThread = None
+		logHandler.log.info(f"{ADDON_NAME}: Stopping OCR...")
+		return True
+	
+	def _isCurrentGeneration(self, generation):
+		"""True while the loop of `generation` has not been stopped or superseded."""
+		return generation == self._ocrGeneration
+	
+	def _ocrLoopExited(self, generation):
+		"""Record that the loop of `generation` exited (stopping -> stopped)."""
+		with self._ocrLock:
+			if generation == self._ocrGeneration:
+				# Exited on its own (errors): nobody called stopOcr
+				self._ocrGeneration += 1
+				self._ocrActive.clear()
 				self._ocrThread = None
-			else:
-				# Start new thread
-				self._ocrActive.set()
-				self._ocrThread = threading.Thread(target=self.ocrLoop, daemon=True)
-				self._ocrThread.start()
-				tones.beep(444, 333)
-				queueHandler.queueFunction(queueHandler.eventQueue, ui.message, _("lion started"))
-				logHandler.log.info(f"{ADDON_NAME}: OCR thread started")
+				self.ocrState = OCR_STOPPED
+			elif self.ocrState == OCR_STOPPING and generation == self._ocrGeneration - 1:
+				self.ocrState = OCR_STOPPED
 			
+	def requestRescan(self, targetIndexes=TARGET_INDEXES):
+		"""Wake the OCR loop to scan the given targets now instead of at their next tick.
+		
+		Requests are coalesced by the loop: at most one immediate rescan happens
+		per RESCAN_MIN_INTERVAL, later requests within it are deferred to its end.
+		
+		Args:
+			targetIndexes: Targets affected by the change (only enabled ones are scanned)
+		"""
+		if not self._ocrActive.is_set() or not config.conf["lion"]["rescanOnFocus"]:
+			return
+		with self._rescanLock:
+			self._rescanTargets.update(targetIndexes)
+		self._ocrWake.set()
+	
+	def _takeRescanRequest(self):
+		"""Return and clear the set of targets requested for immediate rescan."""
+		with self._rescanLock:
+			targets, self._rescanTargets = self._rescanTargets, set()
+		return targets
+
+	def event_foreground(self, obj, nextHandler):
+		"""Invalidate cached foreground window geometry on foreground change"""
+		try:
+			self._invalidateTargetGeometry((2,))
+			self.requestRescan()
+		except Exception:
+			logHandler.log.exception(f"{ADDON_NAME}: event_foreground failed")
+		finally:
+			nextHandler()
+
+	def event_locationChange(self, obj, nextHandler):
+		"""Invalidate cached geometry of any target resolved to the moved object"""
+		try:
+			self._invalidateTargetGeometry(obj=obj)
+		except Exception:
+			logHandler.log.exception(f"{ADDON_NAME}: event_locationChange failed")
+		finally:
+			nextHandler()
+
 	def event_gainFocus(self, obj, nextHandler):
-		"""Handle focus change with OCR pause during profile switch"""
+		"""Handle focus change: switch profile and trigger an immediate rescan"""
 		try:
+			# Focus (and the navigator, which follows it) moved: re-query their geometry
+			self._invalidateTargetGeometry((0, 3))
+			rescanTargets = (0, 3)
+			
 			# Safe access to appModule and appName
 			appMod = getattr(obj, "appModule", None)
 			newAppName = getattr(appMod, "appName", None) if appMod else None
 			
 			if newAppName and newAppName != self.currentAppProfile and newAppName != "nvda":
-				# Pause OCR during profile switch to prevent race condition
-				was_active = False
-				if hasattr(self, '_ocrActive'):
-					was_active = self._ocrActive.is_set()
-					if was_active:
-						self._ocrActive.clear()
-						logHandler.log.debug(f"{ADDON_NAME}: Paused OCR for profile switch to {newAppName}")
-						# Brief wait for current iteration to complete
-						time.sleep(0.3)
-				
-				# Load profile (I/O not blocking OCR anymore)
+				# Load profile. ocrLoop snapshots the config under _profileLock, so a
+				# scan never sees a half-loaded profile; no need to pause the loop
 				with self._profileLock:
 					self.loadProfileForApp(newAppName)
 				
@@ -492,10 +878,10 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 					for k in keys_to_remove:
 						del self._ocrState[k]
 				
-				# Resume OCR with new profile
-				if was_active and hasattr(self, '_ocrActive'):
-					self._ocrActive.set()
-					logHandler.log.debug(f"{ADDON_NAME}: Resumed OCR with profile {newAppName}")
+				# New app: every target may show something new
+				rescanTargets = TARGET_INDEXES
+			
+			self.requestRescan(rescanTargets)
 					
 		except Exception:
 			# Never crash NVDA on focus events
@@ -562,167 +948,437 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		
 		return locationHelper.RectLTWH(newX, newY, newWidth, newHeight)
 	
-	def rebuildTargets(self, cfg):
+	def _parseTargetIndex(self, cfg):
+		"""Parse the OCR target index from a config snapshot.
+		
+		Args:
+			cfg: Configuration dict snapshot
+		
+		Returns:
+			int: Target index (0-3), falls back to 1 (whole screen) when invalid
+		"""
+		try:
+			targetIndex = int(cfg.get("target", config.conf["lion"]["target"]))
+			if targetIndex not in TARGET_INDEXES:
+				logHandler.log.error(f"{ADDON_NAME}: Invalid target index {targetIndex}, using 1")
+				targetIndex = 1
+		except (ValueError, TypeError, KeyError) as e:
+			logHandler.log.error(f"{ADDON_NAME}: Error parsing target: {e}, using 1")
+			targetIndex = 1
+		return targetIndex
+	
+	def resolveTarget(self, cfg, targetIndex):
+		"""Resolve the cropped rectangle of a single target. Keeps last-valid rect on failure.
+		
+		Only the requested target is queried, so at most one object location
+		(a potentially cross-process accessibility call) is read per tick.
+		
+		Args:
+			cfg: Configuration dict with crop settings
+			targetIndex: Target index (0=navigator, 1=screen, 2=foreground, 3=focus)
+		
+		Returns:
+			RectLTWH: Cropped target rectangle
+		"""
+		try:
+			if targetIndex == 1:
+				# Whole screen: no accessibility call needed
+				rect = self.cropRectLTWH(locationHelper.RectLTWH(0, 0, self.resX, self.resY), cfg)
+			else:
+				obj = getattr(api, TARGET_OBJECT_GETTERS[targetIndex])()
+				loc = self._getCachedLocation(targetIndex, obj)
+				if not loc:
+					return self._lastTargets.get(targetIndex) or self._defaultTarget()
+				rect = self.cropRectLTWH(loc, cfg)
+			self._lastTargets[targetIndex] = rect
+			return rect
+		except Exception:
+			# On any error, use last-valid target
+			logHandler.log.exception(f"{ADDON_NAME}: resolveTarget({targetIndex}) failed, using last-valid")
+			return self._lastTargets.get(targetIndex) or self._defaultTarget()
+	
+	def _getCachedLocation(self, targetIndex, obj):
+		"""Return the location of a target object, re-querying it only when needed.
+		
+		The cached location is reused while the target still resolves to the same
+		object, no focus/foreground/location event marked it dirty and it is younger
+		than TARGET_GEOMETRY_MAX_AGE seconds.
+		
+		Args:
+			targetIndex: Object-based target index (0, 2 or 3)
+			obj: Object the target currently resolves to (may be None)
+		
+		Returns:
+			RectLTWH or None: Raw (uncropped) object location
+		"""
+		if obj is None:
+			return None
+		now = time.monotonic()
+		with self._geometryLock:
+			entry = self._targetGeometry.get(targetIndex)
+			if (entry and entry["obj"] is obj and not entry["dirty"]
+				and now - entry["time"] < self.TARGET_GEOMETRY_MAX_AGE):
+				self._geometryCacheHits += 1
+				return entry["location"]
+		# Cache miss: one (possibly cross-process) location read
+		loc = getattr(obj, "location", None)
+		with self._geometryLock:
+			self._a11yCallsThisTick += 1
+			self._geometryCacheMisses += 1
+			if loc:
+				self._targetGeometry[targetIndex] = {"obj": obj, "location": loc, "time": now, "dirty": False}
+			else:
+				self._targetGeometry.pop(targetIndex, None)
+		return loc
+	
+	def _invalidateTargetGeometry(self, targetIndexes=None, obj=None):
+		"""Mark cached target geometry dirty so the next scan re-queries it.
+		
+		Args:
+			targetIndexes: Target indexes to invalidate (all object targets if None)
+			obj: If given, only invalidate entries cached for this object
+		"""
+		with self._geometryLock:
+			for index, entry in self._targetGeometry.items():
+				if targetIndexes is not None and index not in targetIndexes:
+					continue
+				if obj is not None and entry["obj"] is not obj:
+					continue
+				entry["dirty"] = True
+	
+	def rebuildTargets(self, cfg, targetIndex=None):
 		"""Rebuild targets dict using provided config. Keeps last-valid rects on failure.
 		
+		Targets are resolved lazily: when targetIndex is given only that target is
+		computed, otherwise all four are (legacy behaviour).
+		
 		Args:
 			cfg: Configuration dict with crop/target settings
+			targetIndex: Optional single target index to resolve
 		
 		Returns:
 			dict: Target index -> RectLTWH
 		"""
-		targets = {}
+		indexes = TARGET_INDEXES if targetIndex is None else (targetIndex,)
+		return {index: self.resolveTarget(cfg, index) for index in indexes}
+	
+	def _getBackend(self, cfg):
+		"""Return the recognizer backend selected by a config snapshot.
+		
+		Unknown names fall back to lionBackends.DEFAULT_BACKEND.
+		"""
+		name = cfg.get("backend") or lionBackends.DEFAULT_BACKEND
+		backend = lionBackends.getBackend(name)
+		if backend is None:
+			if name not in self._unknownBackends:
+				self._unknownBackends.add(name)
+				logHandler.log.warning(f"{ADDON_NAME}: Unknown recognizer backend {name!r}, "
+					f"using {lionBackends.DEFAULT_BACKEND}")
+			backend = lionBackends.getBackend(lionBackends.DEFAULT_BACKEND)
+		return backend
+	
+	def _getTextFilter(self, cfg):
+		"""Return the compiled text filter of a config snapshot's "filters" rules.
+		
+		Rule lists are compiled once and cached; invalid rules are logged and ignored.
+		"""
+		rules = tuple(cfg.get("filters", config.conf["lion"]["filters"]) or ())
+		textFilter = self._textFilters.get(rules)
+		if textFilter is None:
+			textFilter, errors = lionFilters.compileFilters(rules)
+			for error in errors:
+				logHandler.log.warning(f"{ADDON_NAME}: Ignoring text filter {error}")
+			if len(self._textFilters) >= 32:
+				self._textFilters.clear()
+			self._textFilters[rules] = textFilter
+		return textFilter
+	
+	def _isSleepMode(self):
+		"""Sleep mode of the focused application (governor condition)."""
+		appMod = getattr(api.getFocusObject(), "appModule", None)
+		return bool(getattr(appMod, "sleepMode", False))
+	
+	def _enabledTargets(self, cfg):
+		"""Return the target indexes scanned concurrently for a config snapshot.
+		
+		The "targets" list enables several targets at once; when it is empty only
+		the single "target" is scanned (upstream behaviour).
+		"""
 		try:
-			# Compute screen rect with current crop settings
-			screenRect = self.cropRectLTWH(locationHelper.RectLTWH(0, 0, self.resX, self.resY), cfg)
-			
-			# Try to get each target location, fall back to last-valid if unavailable
-			# Target 0: Navigator object (with crop applied)
-			navObj = api.getNavigatorObject()
-			navLoc = getattr(navObj, "location", None) if navObj else None
-			if navLoc:
-				navCropped = self.cropRectLTWH(navLoc, cfg)
-				targets[0] = navCropped
-				self._lastTargets[0] = navCropped
-			else:
-				targets[0] = self._lastTargets[0]
-			
-			# Target 1: Whole screen (always use current screenRect)
-			targets[1] = screenRect
-			self._lastTargets[1] = screenRect
-			
-			# Target 2: Foreground object (with crop applied)
-			fgObj = api.getForegroundObject()
-			fgLoc = getattr(fgObj, "location", None) if fgObj else None
-			if fgLoc:
-				fgCropped = self.cropRectLTWH(fgLoc, cfg)
-				targets[2] = fgCropped
-				self._lastTargets[2] = fgCropped
-			else:
-				targets[2] = self._lastTargets[2]
-			
-			# Target 3: Focus object (with crop applied)
-			focusObj = api.getFocusObject()
-			focusLoc = getattr(focusObj, "location", None) if focusObj else None
-			if focusLoc:
-				focusCropped = self.cropRectLTWH(focusLoc, cfg)
-				targets[3] = focusCropped
-				self._lastTargets[3] = focusCropped
-			else:
-				targets[3] = self._lastTargets[3]
-				
-		except Exception:
-			# On any error, use last-valid targets
-			logHandler.log.exception(f"{ADDON_NAME}: rebuildTargets failed, using last-valid")
-			targets = dict(self._lastTargets)
+			enabled = sorted({int(t) for t in cfg.get("targets", ()) if int(t) in TARGET_INDEXES})
+		except (ValueError, TypeError):
+			logHandler.log.error(f"{ADDON_NAME}: Invalid targets list {cfg.get('targets')!r}, ignoring")
+			enabled = []
+		return enabled or [self._parseTargetIndex(cfg)]
+	
+	def _targetInterval(self, cfg, targetIndex):
+		"""Return the scan interval of one target.
 		
-		return targets
+		"targetIntervals" holds per-target intervals indexed by target index;
+		missing or zero entries use the profile "interval".
+		"""
+		try:
+			interval = float(cfg.get("interval", config.conf["lion"]["interval"]))
+		except (ValueError, TypeError, KeyError):
+			interval = float(config.conf["lion"]["interval"])
+		try:
+			targetIntervals = cfg.get("targetIntervals") or ()
+			if targetIndex < len(targetIntervals) and float(targetIntervals[targetIndex]) > 0:
+				interval = float(targetIntervals[targetIndex])
+		except (ValueError, TypeError):
+			logHandler.log.error(f"{ADDON_NAME}: Invalid targetIntervals {cfg.get('targetIntervals')!r}, ignoring")
+		return interval
+	
+	def _targetMaxInFlight(self, cfg, targetIndex):
+		"""Return how many recognitions of one target may be in flight at once.
+		
+		"targetMaxInFlight" holds per-target limits indexed by target index;
+		missing or zero entries use the profile "maxInFlight".
+		"""
+		try:
+			maxInFlight = max(1, int(cfg.get("maxInFlight", config.conf["lion"]["maxInFlight"])))
+		except (ValueError, TypeError, KeyError):
+			maxInFlight = 1
+		try:
+			targetLimits = cfg.get("targetMaxInFlight") or ()
+			if targetIndex < len(targetLimits) and int(targetLimits[targetIndex]) > 0:
+				maxInFlight = int(targetLimits[targetIndex])
+		except (ValueError, TypeError):
+			logHandler.log.error(f"{ADDON_NAME}: Invalid targetMaxInFlight {cfg.get('targetMaxInFlight')!r}, ignoring")
+		return maxInFlight
 	
-	def ocrLoop(self):
-		"""Main OCR loop with exception handling"""
-		logHandler.log.info(f"{ADDON_NAME}: OCR loop starting")
+	def ocrLoop(self, generation=None):
+		"""Main OCR loop with exception handling.
+		
+		Schedules every enabled target on its own interval. Due targets that
+		resolve to the same rectangle share one capture, and each capture group
+		is scanned on a small bounded worker pool so a slow capture or
+		recognition of one target does not delay the others.
+		
+		Args:
+			generation: Lifecycle generation this loop belongs to; it runs until
+				that generation is stopped or superseded (default: the current one)
+		"""
+		if generation is None:
+			generation = self._ocrGeneration
+		logHandler.log.info(f"{ADDON_NAME}: OCR loop starting (generation {generation})")
+		with self._ocrLock:
+			if self._isCurrentGeneration(generation) and self.ocrState == OCR_STARTING:
+				self.ocrState = OCR_RUNNING
 		consecutive_errors = 0
 		max_consecutive_errors = 5
+		nextDue = {}  # target index -> monotonic time of its next scan
+		jobs = {}  # capture rect -> future of the scan job using it
+		pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.SCAN_WORKERS,
+			thread_name_prefix=f"{ADDON_NAME}Scan")
 		
-		while self._ocrActive.is_set():
-			try:
-				# Snapshot config once per iteration
-				with self._profileLock:
-					appName = self.currentAppProfile
-					cfg = self.getEffectiveConfig(appName)
-				
-				# Rebuild targets with current config
-				targets = self.rebuildTargets(cfg)
-				
-				# Perform OCR scan
-				self.OcrScreen(cfg, appName, targets)
-				
-				# Reset error counter on success
-				consecutive_errors = 0
-				
-				# Use config snapshot for interval
+		try:
+			while self._isCurrentGeneration(generation):
 				try:
-					interval = float(cfg.get("interval", config.conf["lion"]["interval"]))
-				except (ValueError, TypeError, KeyError):
-					interval = float(config.conf["lion"]["interval"])
-				
-				# Use wait() instead of sleep() for immediate response to stop
-				self._ocrActive.wait(timeout=interval)
-				
-			except Exception:
-				consecutive_errors += 1
-				logHandler.log.exception(f"{ADDON_NAME}: Error in ocrLoop (attempt {consecutive_errors}/{max_consecutive_errors})")
-				
-				if consecutive_errors >= max_consecutive_errors:
-					logHandler.log.error(f"{ADDON_NAME}: Too many consecutive errors, stopping OCR")
-					self._ocrActive.clear()
-					queueHandler.queueFunction(queueHandler.eventQueue, ui.message, 
-						_("OCR stopped due to errors"))
-					break
-				
-				# Exponential backoff on errors
-				backoff = min(5.0, 0.5 * (2 ** consecutive_errors))
-				self._ocrActive.wait(timeout=backoff)
+					# Snapshot config once per iteration
+					with self._profileLock:
+						appName = self.currentAppProfile
+						cfg = self.getEffectiveConfig(appName)
+						live = self._liveOverrides
+						if live and live[0] == appName:
+							# Values being tuned in the settings dialog, not saved yet
+							cfg.update(live[1])
+					
+					# Idle/lock governor: slow down while idle, stop scanning while suspended
+					mode, changed = self._governor.evaluate(config.conf["lion"]["idleAfter"])
+					if changed:
+						logHandler.log.info(f"{ADDON_NAME}: Scan governor: {self._governor.describe()}")
+						self._perf.count(appName, f"governor:{mode}")
+						if mode == lionGovernor.ACTIVE:
+							# Back from idle or suspend: scan every target right away
+							nextDue.clear()
+					# Free capture buffers left unused (target resized, scanning suspended)
+					self._capturePool.trim()
+					self._mosaicPool.trim()
+					if mode == lionGovernor.SUSPENDED:
+						consecutive_errors = 0
+						self._ocrWake.wait(timeout=lionGovernor.GOVERNOR_POLL)
+						self._ocrWake.clear()
+						continue
+					idleInterval = config.conf["lion"]["idleInterval"]
+					try:
+						cpuBudget = int(cfg.get("cpuBudget", 0))
+					except (ValueError, TypeError):
+						cpuBudget = 0
+					
+					# Pick the targets whose interval elapsed
+					enabled = self._enabledTargets(cfg)
+					for index in list(nextDue):
+						if index not in enabled:
+							del nextDue[index]
+					now = time.monotonic()
+					
+					# Focus/foreground/profile changes pull affected targets forward,
+					# at most once per RESCAN_MIN_INTERVAL
+					rescan = [index for index in self._takeRescanRequest() if index in enabled]
+					if rescan:
+						earliest = self._lastForcedScan + self.RESCAN_MIN_INTERVAL
+						if now >= earliest:
+							self._lastForcedScan = now
+							self._perf.count(appName, "eventRescans")
+							for index in rescan:
+								nextDue[index] = now
+								# A frame captured before the change is still being recognized:
+								# scan again as soon as it returns
+								if self._inFlight.pending((appName, index), self.IN_FLIGHT_TIMEOUT):
+									with self._rescanLock:
+										self._rescanWhenIdle.add((appName, index))
+						else:
+							for index in rescan:
+								nextDue[index] = min(nextDue.get(index, earliest), earliest)
+					due = []
+					throttled = False
+					for index in enabled:
+						if nextDue.get(index, now) <= now:
+							due.append(index)
+							# CPU budget stretches the configured interval, never shortens it
+							interval = self._targetInterval(cfg, index)
+							budgeted = self._cpuBudget.interval(index, interval, cpuBudget, len(enabled))
+							if budgeted > interval:
+								throttled = True
+								self._perf.count(appName, "cpuThrottled")
+							nextDue[index] = now + self._governor.interval(budgeted, idleInterval)
+					if due and self._cpuBudget.setThrottling(throttled):
+						if throttled:
+							logHandler.log.info(f"{ADDON_NAME}: CPU budget: throttling scans "
+								f"({self._cpuBudget.describe(cpuBudget)})")
+						else:
+							logHandler.log.info(f"{ADDON_NAME}: CPU budget: no longer throttling")
+					
+					if due:
+						# Resolve only the due targets with current config
+						with self._geometryLock:
+							self._a11yCallsThisTick = 0
+						mark = self._perf.mark()
+						resolveCfg = cfg
+						learning = self._roiLearning
+						if learning and learning[0] == appName:
+							# Learn on the uncropped target
+							resolveCfg = dict(cfg, cropLeft=0, cropRight=0, cropUp=0, cropDown=0)
+						targets = {index: self.resolveTarget(resolveCfg, index) for index in due}
+						self._perf.record(appName, "target", mark)
+						
+						# Group targets with identical rectangles so they share one capture
+						groups = {}
+						for index, rect in targets.items():
+							groups.setdefault(tuple(rect), []).append(index)
+						# Small areas due together: one recognition of a mosaic of them
+						for batch in self._planMosaics(cfg, groups):
+							if any(jobs.get(rect) is not None and not jobs[rect].done() for rect in batch):
+								self._perf.count(appName, "busySkips")
+							else:
+								self._perf.count(appName, "scans", len(batch))
+								job = pool.submit(self.OcrMosaic, cfg, appName,
+									[({index: targets[index] for index in groups[rect]}, groups[rect]) for rect in batch],
+									generation)
+								for rect in batch:
+									jobs[rect] = job
+							for rect in batch:
+								del groups[rect]
+						for rect, indexes in groups.items():
+							job = jobs.get(rect)
+							if job is not None and not job.done():
+								# Previous capture of this area still running: keep the pool bounded
+								self._perf.count(appName, "busySkips")
+								continue
+							self._perf.count(appName, "scans")
+							jobs[rect] = pool.submit(self.OcrScreen, cfg, appName,
+								{index: targets[index] for index in indexes}, indexes, generation)
+						for rect in [r for r, job in jobs.items() if job.done()]:
+							del jobs[rect]
+					
+					# Reset error counter on success
+					consecutive_errors = 0
+					
+					# Sleep until the next target is due. Wait on the wake event (not
+					# _ocrActive, which is set while running and would return immediately)
+					# so stop requests still interrupt the sleep
+					timeout = max(0.0, min(nextDue.values()) - time.monotonic()) if nextDue else 0.1
+					if mode != lionGovernor.ACTIVE:
+						# Notice input promptly while idle
+						timeout = min(timeout, lionGovernor.GOVERNOR_POLL)
+					self._ocrWake.wait(timeout=timeout)
+					self._ocrWake.clear()
+					
+				except Exception:
+					consecutive_errors += 1
+					logHandler.log.exception(f"{ADDON_NAME}: Error in ocrLoop (attempt {consecutive_errors}/{max_consecutive_errors})")
+					
+					if consecutive_errors >= max_consecutive_errors:
+						logHandler.log.error(f"{ADDON_NAME}: Too many consecutive errors, stopping OCR")
+						queueHandler.queueFunction(queueHandler.eventQueue, ui.message, 
+							_("OCR stopped due to errors"))
+						break
+					
+					# Exponential backoff on errors
+					backoff = min(5.0, 0.5 * (2 ** consecutive_errors))
+					self._ocrWake.wait(timeout=backoff)
+					self._ocrWake.clear()
+		finally:
+			# Running scan jobs finish on their own; never block the loop thread on them
+			pool.shutdown(wait=False)
+			# Slots still in flight are released by their callbacks
+			self._capturePool.clear()
+			self._mosaicPool.clear()
+			self._ocrLoopExited(generation)
 		
-		logHandler.log.info(f"{ADDON_NAME}: OCR loop exited")
+		logHandler.log.info(f"{ADDON_NAME}: OCR loop exited (generation {generation})")
 
-	def OcrScreen(self, cfg, appName, targets):
+	def OcrScreen(self, cfg, appName, targets, targetIndexes=None, generation=None):
 		"""Perform OCR scan with robust error handling.
 		
+		All scanned targets must share the same rectangle: the area is captured
+		and recognized once and the result is fed to each target's anti-repeat key.
+		
 		Args:
 			cfg: Configuration dict snapshot
 			appName: Current app profile name
 			targets: Pre-computed target rectangles dict
+			targetIndexes: Targets to scan (default: the configured "target")
+			generation: Lifecycle generation of the loop that scheduled this scan;
+				the scan and its result are dropped once it is stale
 		"""
 		try:
-			# Parse target index from config
-			try:
-				targetIndex = int(cfg.get("target", config.conf["lion"]["target"]))
-				if targetIndex not in targets:
-					logHandler.log.error(f"{ADDON_NAME}: Invalid target index {targetIndex}, using 1")
-					targetIndex = 1
-			except (ValueError, TypeError, KeyError) as e:
-				logHandler.log.error(f"{ADDON_NAME}: Error parsing target: {e}, using 1")
-				targetIndex = 1
-			
-			# Parse threshold from config
-			try:
-				configuredThreshold = float(cfg.get("threshold", config.conf["lion"]["threshold"]))
-			except (ValueError, TypeError, KeyError):
-				configuredThreshold = float(config.conf["lion"]["threshold"])
-			
-			# Get interval for logging
-			try:
-				interval = float(cfg.get("interval", config.conf["lion"]["interval"]))
-			except (ValueError, TypeError, KeyError):
-				interval = float(config.conf["lion"]["interval"])
-			
-			key = (appName, targetIndex)
-			left, top, width, height = targets[targetIndex]
-			
-			# Validate dimensions before attempting OCR
-			MIN_OCR_SIZE = 10
-			if width < MIN_OCR_SIZE or height < MIN_OCR_SIZE:
-				logHandler.log.warning(f"{ADDON_NAME}: Target too small ({width}x{height}), skipping scan")
+			if generation is None:
+				generation = self._ocrGeneration
+			elif not self._isCurrentGeneration(generation):
 				return
+			if targetIndexes is None:
+				targetIndexes = (self._parseTargetIndex(cfg),)
+			missing = [index for index in targetIndexes if index not in targets]
+			if missing:
+				targets = dict(targets)
+				for index in missing:
+					targets.update(self.rebuildTargets(cfg, index))
 			
-			# Validate coordinates are on-screen
-			screenW = ctypes.windll.user32.GetSystemMetrics(0)
-			screenH = ctypes.windll.user32.GetSystemMetrics(1)
-			if left < 0 or top < 0 or left >= screenW or top >= screenH:
-				logHandler.log.warning(f"{ADDON_NAME}: Target off-screen ({left},{top}), skipping scan")
+			configuredThreshold = self._parseThreshold(cfg)
+			keys = self._keysToScan(cfg, appName, targetIndexes)
+			if not keys:
+				return
+			targetIndex = keys[0][1]
+			left, top, width, height = targets[targetIndex]
+			if not self._isScannableRect(left, top, width, height):
 				return
 			
 			# Debug log (validates settings are applied correctly)
-			logHandler.log.debug(f"{ADDON_NAME} Scan: app={appName}, target={targetIndex}, "
+			with self._geometryLock:
+				a11yCalls = self._a11yCallsThisTick
+			logHandler.log.debug(f"{ADDON_NAME} Scan: app={appName}, targets={[k[1] for k in keys]}, "
 				f"rect=({left},{top},{width}x{height}), threshold={configuredThreshold:.2f}, "
-				f"interval={interval:.1f}")
+				f"interval={self._targetInterval(cfg, targetIndex):.1f}, a11yCalls={a11yCalls} "
+				f"(saved {len(TARGET_OBJECT_GETTERS) - a11yCalls})")
 			
-			# Create OCR recognizer
+			# Create OCR recognizer with the profile's backend
+			backend = self._getBackend(cfg)
 			try:
-				recog = contentRecog.uwpOcr.UwpOcr()
+				recog = backend.create(cfg.get("language") or None)
 			except Exception:
-				logHandler.log.exception(f"{ADDON_NAME}: Failed to create UwpOcr recognizer")
+				logHandler.log.exception(f"{ADDON_NAME}: Failed to create {backend.name} recognizer")
 				return
 			
 			# Create image info
@@ -732,25 +1388,64 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 				logHandler.log.exception(f"{ADDON_NAME}: Failed to create RecogImageInfo")
 				return
 			
-			# Capture screen bitmap
+			# Built before a capture slot is taken, so a failure cannot leak the slot
+			textFilter = self._getTextFilter(cfg)
+			wordFilter = lionFilters.wordFilterFromConfig(cfg)
+			stabilityGate = lionFilters.stabilityGateFromConfig(cfg)
+			
+			# Capture screen bitmap into a pooled buffer, owned until the callback has run
+			slot = None
 			try:
-				sb = screenBitmap.ScreenBitmap(imgInfo.recogWidth, imgInfo.recogHeight)
-				pixels = sb.captureImage(left, top, width, height)
+				# Capture stamp: carried through recognition and diff to the speech stage
+				captureMark = self._perf.mark()
+				slot = self._capturePool.acquire(imgInfo.recogWidth, imgInfo.recogHeight)
+				pixels = self._capture(slot, left, top, width, height)
+				self._perf.record(appName, "capture", captureMark)
 			except Exception:
+				if slot is not None:
+					self._capturePool.release(slot)
 				logHandler.log.exception(f"{ADDON_NAME}: Failed to capture screen bitmap")
 				return
 			
+			# Session recording: describe this tick per target (completed in the callback)
+			recorder = self._recorder
+			ticks = None
+			if recorder:
+				try:
+					ticks = [self._makeRecordingTick(recorder, pixels, imgInfo, appName, key[1],
+						(left, top, width, height), configuredThreshold) for key in keys]
+				except Exception:
+					self._capturePool.release(slot)
+					raise
+			
 			# Define callback with error handling
 			def callback(result):
 				try:
-					self._handleOcrResult(result, key, configuredThreshold)
-				except Exception:
-					logHandler.log.exception(f"{ADDON_NAME}: Error in OCR callback")
+					if not self._recognitionDone(inFlightToken, keys, recognizeStart, backend, width, height,
+							generation):
+						return
+					try:
+						self._perf.record(appName, "recognize", recognizeMark)
+						self._handleOcrResult(result, keys, configuredThreshold, ticks, captureMark, textFilter,
+							wordFilter, imgInfo, stabilityGate)
+						if self._roiLearning:
+							self._learnFromResult(result, imgInfo, keys, (left, top, width, height))
+					except Exception:
+						logHandler.log.exception(f"{ADDON_NAME}: Error in OCR callback")
+					for tick in ticks or ():
+						recorder.record(tick)
+				finally:
+					self._capturePool.release(slot)
 			
-			# Perform OCR recognition
+			# Perform OCR recognition (the pixels are handed over, not copied)
+			inFlightToken = self._inFlight.add(pixels, keys)
 			try:
+				recognizeMark = self._perf.mark()
+				recognizeStart = time.monotonic()
 				recog.recognize(pixels, imgInfo, callback)
 			except Exception:
+				self._inFlight.release(inFlightToken)
+				self._capturePool.release(slot)
 				logHandler.log.exception(f"{ADDON_NAME}: OCR recognize() failed")
 				return
 				
@@ -758,6 +1453,247 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			# Catch-all to prevent thread crash
 			logHandler.log.exception(f"{ADDON_NAME}: Unexpected error in OcrScreen for {appName}")
 	
+	def _parseThreshold(self, cfg):
+		"""Similarity threshold of a config snapshot."""
+		try:
+			return float(cfg.get("threshold", config.conf["lion"]["threshold"]))
+		except (ValueError, TypeError, KeyError):
+			return float(config.conf["lion"]["threshold"])
+	
+	def _keysToScan(self, cfg, appName, targetIndexes):
+		"""Anti-repeat keys of the targets whose recognitions in flight leave room for another.
+		
+		Frames are not queued faster than the recognizer returns them: targets at
+		their in-flight limit (see _targetMaxInFlight) are skipped (and counted as
+		busy skips).
+		"""
+		keys = []
+		for index in targetIndexes:
+			key = (appName, index)
+			if self._inFlight.pending(key, self.IN_FLIGHT_TIMEOUT) >= self._targetMaxInFlight(cfg, index):
+				self._perf.count(appName, "busySkips")
+				continue
+			keys.append(key)
+		return keys
+	
+	def _isScannableRect(self, left, top, width, height):
+		"""Validate a target rectangle before capturing it (logs why not)."""
+		MIN_OCR_SIZE = 10
+		if width < MIN_OCR_SIZE or height < MIN_OCR_SIZE:
+			logHandler.log.warning(f"{ADDON_NAME}: Target too small ({width}x{height}), skipping scan")
+			return False
+		screenW = ctypes.windll.user32.GetSystemMetrics(0)
+		screenH = ctypes.windll.user32.GetSystemMetrics(1)
+		if left < 0 or top < 0 or left >= screenW or top >= screenH:
+			logHandler.log.warning(f"{ADDON_NAME}: Target off-screen ({left},{top}), skipping scan")
+			return False
+		return True
+	
+	def _capture(self, slot, left, top, width, height):
+		"""Capture a screen area into a capture slot.
+		
+		ScreenBitmap.captureImage allocates a new pixel buffer on every call. Once
+		the slot holds a buffer, the same GDI calls (StretchBlt into the bitmap's
+		memory DC, GetDIBits) fill that buffer instead. This deliberately relies on
+		the private ScreenBitmap attributes _memDC, _screenDC and _memBitmap, as
+		NVDA has no public API to capture into an existing buffer; captureImage is
+		the fallback. The first failure (e.g. those internals changed) is logged
+		and captureImage is used from then on.
+		
+		Returns:
+			object: The captured pixels (slot.pixels)
+		"""
+		sb = slot.bitmap
+		if slot.pixels is not None and self._reuseCaptureBuffers:
+			try:
+				gdi32 = ctypes.windll.gdi32
+				gdi32.StretchBlt(sb._memDC, 0, 0, sb.width, sb.height, sb._screenDC, left, top, width, height,
+					winGDI.SRCCOPY)
+				bmInfo = winGDI.BITMAPINFO()
+				bmInfo.bmiHeader.biSize = ctypes.sizeof(bmInfo)
+				bmInfo.bmiHeader.biWidth = sb.width
+				bmInfo.bmiHeader.biHeight = -sb.height
+				bmInfo.bmiHeader.biPlanes = 1
+				bmInfo.bmiHeader.biBitCount = 32
+				bmInfo.bmiHeader.biCompression = winGDI.BI_RGB
+				gdi32.GetDIBits(sb._memDC, sb._memBitmap, 0, sb.height, slot.pixels, ctypes.byref(bmInfo),
+					winGDI.DIB_RGB_COLORS)
+				return slot.pixels
+			except Exception:
+				self._reuseCaptureBuffers = False
+				logHandler.log.exception(f"{ADDON_NAME}: Capturing into a reused buffer failed, allocating per capture")
+		slot.pixels = sb.captureImage(left, top, width, height)
+		return slot.pixels
+	
+	def _recognitionDone(self, inFlightToken, keys, recognizeStart, backend, width, height, generation):
+		"""Account a finished recognition (recognizer callback thread).
+		
+		Returns:
+			bool: True if the result should be processed, False if it belongs to
+				a stopped or superseded loop
+		"""
+		self._inFlight.release(inFlightToken)
+		recognizeSeconds = time.monotonic() - recognizeStart
+		self._cpuBudget.add([key[1] for key in keys], recognizeSeconds)
+		backend.observe(width, height, recognizeSeconds)
+		with self._rescanLock:
+			deferred = [key[1] for key in keys if key in self._rescanWhenIdle]
+			self._rescanWhenIdle.difference_update(keys)
+		if not self._isCurrentGeneration(generation):
+			# Late result of a stopped or superseded loop
+			self._perf.count(keys[0][0], "staleResults")
+			return False
+		if deferred:
+			self.requestRescan(deferred)
+		return True
+	
+	def _planMosaics(self, cfg, groups):
+		"""Areas to recognize together as mosaics (see lionMosaic.planBatches).
+		
+		Args:
+			cfg: Configuration dict snapshot
+			groups: Due target indexes by target rectangle
+		
+		Returns:
+			list: Batches of rectangles, empty unless "mosaic" is on and the
+				backend reports word boxes (needed to split the result)
+		"""
+		if not cfg.get("mosaic") or len(groups) < 2:
+			return []
+		backend = self._getBackend(cfg)
+		if lionBackends.CAP_WORD_BOXES not in backend.capabilities:
+			return []
+		rects = list(groups)
+		batches = lionMosaic.planBatches([(rect[2], rect[3]) for rect in rects], backend.costEstimate)
+		return [[rects[i] for i in batch] for batch in batches]
+	
+	def OcrMosaic(self, cfg, appName, areas, generation=None):
+		"""Scan several target areas with one recognition of a mosaic image.
+		
+		The areas are captured separately, stacked into one bitmap (see
+		lionMosaic), recognized once, and the words of the result are split back
+		into one result per area, which then goes through the same anti-repeat
+		and speech stages as an OcrScreen result.
+		
+		Args:
+			cfg: Configuration dict snapshot
+			appName: Current app profile name
+			areas: (targets, targetIndexes) per area, as OcrScreen takes them
+			generation: Lifecycle generation of the loop that scheduled this scan
+		"""
+		try:
+			if generation is None:
+				generation = self._ocrGeneration
+			elif not self._isCurrentGeneration(generation):
+				return
+			configuredThreshold = self._parseThreshold(cfg)
+			scanned = []  # (rect, keys)
+			for targets, targetIndexes in areas:
+				keys = self._keysToScan(cfg, appName, targetIndexes)
+				if keys and self._isScannableRect(*targets[keys[0][1]]):
+					scanned.append((tuple(targets[keys[0][1]]), keys))
+			if len(scanned) < 2:
+				for rect, keys in scanned:
+					self.OcrScreen(cfg, appName, {key[1]: rect for key in keys}, [key[1] for key in keys],
+						generation)
+				return
+			
+			backend = self._getBackend(cfg)
+			try:
+				recog = backend.create(cfg.get("language") or None)
+			except Exception:
+				logHandler.log.exception(f"{ADDON_NAME}: Failed to create {backend.name} recognizer")
+				return
+			
+			# Stack the areas in screen pixels; capture each at the mosaic's scale
+			width, height, tops = lionMosaic.layout([(rect[2], rect[3]) for rect, _keys in scanned])
+			try:
+				imgInfo = contentRecog.RecogImageInfo.createFromRecognizer(0, 0, width, height, recog)
+			except Exception:
+				logHandler.log.exception(f"{ADDON_NAME}: Failed to create RecogImageInfo")
+				return
+			factor = imgInfo.resizeFactor
+			areaInfos = [contentRecog.RecogImageInfo(rect[0], rect[1], rect[2], rect[3], factor)
+				for rect, _keys in scanned]
+			areaSizes = [(info.recogWidth, info.recogHeight) for info in areaInfos]
+			areaTops = [int(top * factor) for top in tops]
+			# Built before capture slots are taken, so a failure cannot leak them
+			textFilter = self._getTextFilter(cfg)
+			wordFilter = lionFilters.wordFilterFromConfig(cfg)
+			stabilityGate = lionFilters.stabilityGateFromConfig(cfg)
+			
+			# Areas are captured into pooled slots, released once composed (and
+			# recorded); the mosaic's own slot is owned until the callback has run
+			recorder = self._recorder
+			areaTicks = [None] * len(scanned)
+			areaSlots = []
+			mosaicSlot = None
+			try:
+				captureMark = self._perf.mark()
+				buffers = []
+				for (rect, _keys), (areaWidth, areaHeight) in zip(scanned, areaSizes):
+					areaSlots.append(self._capturePool.acquire(areaWidth, areaHeight))
+					buffers.append(self._capture(areaSlots[-1], *rect))
+				mosaicSlot = self._mosaicPool.acquire(imgInfo.recogWidth, imgInfo.recogHeight)
+				if mosaicSlot.pixels is None:
+					mosaicSlot.pixels = lionMosaic.allocateLike(buffers[0], imgInfo.recogWidth * imgInfo.recogHeight)
+				pixels = lionMosaic.compose(buffers, areaSizes, areaTops, imgInfo.recogWidth, imgInfo.recogHeight,
+					out=mosaicSlot.pixels)
+				self._perf.record(appName, "capture", captureMark)
+				if recorder:
+					areaTicks = [[self._makeRecordingTick(recorder, buffer, info, appName, key[1], rect,
+						configuredThreshold) for key in keys]
+						for (rect, keys), buffer, info in zip(scanned, buffers, areaInfos)]
+			except Exception:
+				if mosaicSlot is not None:
+					self._mosaicPool.release(mosaicSlot)
+				logHandler.log.exception(f"{ADDON_NAME}: Failed to capture mosaic")
+				return
+			finally:
+				for slot in areaSlots:
+					self._capturePool.release(slot)
+			
+			logHandler.log.debug(f"{ADDON_NAME} Mosaic scan: app={appName}, "
+				f"areas={[(rect, [key[1] for key in keys]) for rect, keys in scanned]}, size={width}x{height}")
+			
+			allKeys = [key for _rect, keys in scanned for key in keys]
+			
+			def callback(result):
+				try:
+					if not self._recognitionDone(inFlightToken, allKeys, recognizeStart, backend, width, height,
+							generation):
+						return
+					try:
+						self._perf.record(appName, "recognize", recognizeMark)
+						if isinstance(result, Exception):
+							raise result
+						self._perf.count(appName, "mosaicAreas", len(scanned))
+						parts = lionMosaic.splitResult(result, areaTops, [size[1] for size in areaSizes])
+						for (rect, keys), part, info, ticks in zip(scanned, parts, areaInfos, areaTicks):
+							self._handleOcrResult(part, keys, configuredThreshold, ticks, captureMark, textFilter,
+								wordFilter, info, stabilityGate)
+							if self._roiLearning:
+								self._learnFromResult(part, info, keys, rect)
+					except Exception:
+						logHandler.log.exception(f"{ADDON_NAME}: Error in mosaic OCR callback")
+					for ticks in areaTicks:
+						for tick in ticks or ():
+							recorder.record(tick)
+				finally:
+					self._mosaicPool.release(mosaicSlot)
+			
+			inFlightToken = self._inFlight.add(pixels, allKeys)
+			try:
+				recognizeMark = self._perf.mark()
+				recognizeStart = time.monotonic()
+				recog.recognize(pixels, imgInfo, callback)
+			except Exception:
+				self._inFlight.release(inFlightToken)
+				self._mosaicPool.release(mosaicSlot)
+				logHandler.log.exception(f"{ADDON_NAME}: OCR recognize() failed")
+		except Exception:
+			logHandler.log.exception(f"{ADDON_NAME}: Unexpected error in OcrMosaic for {appName}")
+	
 	def _cleanOcrStateCache(self):
 		"""Periodic cleanup of OCR state cache to prevent memory leak.
 		
@@ -795,13 +1731,63 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 			with self._stateLock:
 				self._cleanupInProgress = False
 	
-	def _handleOcrResult(self, result, key, configuredThreshold):
+	def _handleOcrResult(self, result, keys, configuredThreshold, ticks=None, captureMark=None,
+			textFilter=None, wordFilter=None, imgInfo=None, stabilityGate=None):
 		"""Handle OCR result with per-key anti-repeat state.
 		
 		Args:
 			result: OCR result object
+			keys: (appName, targetIndex) tuples of the targets sharing this frame
+			configuredThreshold: similarity threshold for this scan
+			ticks: Optional recording dicts, one per key; receive the text and decision
+			captureMark: Perf mark taken when the frame was captured
+			textFilter: Compiled profile text filter (default: the global "filters")
+			wordFilter: lionFilters.WordFilter dropping noise words, or None
+			imgInfo: Recognized image info (needed by wordFilter)
+			stabilityGate: lionFilters.StabilityGate holding unsettled text, or None
+		"""
+		appName = keys[0][0]
+		mark = self._perf.mark()
+		text = None
+		if wordFilter is not None and imgInfo is not None:
+			text, dropped = wordFilter.apply(getattr(result, "data", None),
+				imgInfo.recogWidth, imgInfo.recogHeight, imgInfo.resizeFactor)
+			if dropped:
+				self._perf.count(appName, "droppedWords", dropped)
+		if text is None:
+			info = result.makeTextInfo(_RESULT_OWNER, textInfos.POSITION_ALL)
+			text = info.text
+		self._perf.record(appName, "extract", mark)
+		
+		calibration = self._calibration
+		if calibration and (calibration[0], calibration[1]) in keys:
+			self._calibrateFromText(text, textFilter, calibration[2])
+		
+		for i, key in enumerate(keys):
+			spoken = self._processOcrText(text, key, configuredThreshold, captureMark, textFilter,
+				stabilityGate)
+			if ticks:
+				ticks[i]["text"] = text
+				ticks[i]["spoken"] = spoken
+	
+	def _processOcrText(self, text, key, configuredThreshold, captureMark=None, textFilter=None,
+			stabilityGate=None):
+		"""Run recognized text through the filter, diff, anti-repeat and speech stages.
+		
+		Separate from _handleOcrResult so recorded sessions can be replayed
+		without a recognizer.
+		
+		Args:
+			text: Recognized text
 			key: (appName, targetIndex) tuple for state tracking
 			configuredThreshold: similarity threshold for this scan
+			captureMark: Perf mark of the frame capture, for end-to-end latency
+			textFilter: Compiled profile text filter (default: the global "filters")
+			stabilityGate: lionFilters.StabilityGate; changed text is only spoken
+				once it is stable (default: at once)
+		
+		Returns:
+			bool: True if the text was queued for speech
 		"""
 		# Trigger cleanup with race condition protection
 		should_cleanup = False
@@ -814,31 +1800,673 @@ class GlobalPlugin(globalPluginHandler.GlobalPlugin):
 		if should_cleanup:
 			threading.Thread(target=self._cleanOcrStateCache, daemon=True).start()
 		
-		o = type('NVDAObjects.NVDAObject', (), {})()
-		info = result.makeTextInfo(o, textInfos.POSITION_ALL)
+		appName = key[0]
+		mark = self._perf.mark()
+		
+		# Drop noise before comparing: the filtered text is spoken, the
+		# normalized one is compared with the previous announcement
+		if textFilter is None:
+			textFilter = self._getTextFilter(config.conf["lion"])
+		speechText, compareText = textFilter.apply(text)
+		mark = self._perf.record(appName, "filter", mark)
 		
 		# Thread-safe state access - compute decision under lock
 		shouldSpeak = False
+		held = False
 		textToSpeak = ""
 		with self._stateLock:
 			# Get or create state for this key
 			state = self._ocrState.setdefault(key, {"prevString": ""})
 			prevString = state["prevString"]
 			
-			# Compute similarity ratio
-			ratio = SequenceMatcher(None, prevString, info.text).ratio()
+			fingerprint = None
+			if stabilityGate is not None:
+				fingerprint = stabilityGate.fingerprint(compareText)
+			if fingerprint is not None and stabilityGate.isPending(state, fingerprint):
+				# Same text as the held candidate: it still differs from the announcement
+				changed = True
+			else:
+				# Compute similarity ratio
+				ratio = SequenceMatcher(None, prevString, compareText).ratio()
+				changed = ratio < configuredThreshold
 			
 			# Determine if we should speak
-			if ratio < configuredThreshold and info.text != "" and info.text != "Play":
-				shouldSpeak = True
-				textToSpeak = info.text
-				# Update state for this key
-				state["prevString"] = info.text
+			if changed and speechText != "":
+				if stabilityGate is None or stabilityGate.observe(state, fingerprint):
+					shouldSpeak = True
+					textToSpeak = speechText
+					# Update state for this key
+					state["prevString"] = compareText
+				else:
+					held = True
+			elif stabilityGate is not None:
+				stabilityGate.forget(state)
+		mark = self._perf.record(appName, "similarity", mark)
 		
 		# Thread-safe UI call: schedule on event queue instead of calling directly
 		if shouldSpeak:
-			queueHandler.queueFunction(queueHandler.eventQueue, ui.message, textToSpeak)
+			with self._speechLock:
+				self._speechBacklog += 1
+			queueHandler.queueFunction(queueHandler.eventQueue, self._announce, textToSpeak, appName,
+				captureMark, key[1])
+			self._perf.record(appName, "speech", mark)
+			self._perf.count(appName, "spoken")
+		elif held:
+			self._perf.count(appName, "unstable")
+		else:
+			self._perf.count(appName, "suppressed")
+		return shouldSpeak
+	
+	def _announce(self, text, appName, captureMark=None, targetIndex=None):
+		"""Speak accepted OCR text (runs on the event queue).
+		
+		Records the capture-to-speech latency at the moment the announcement
+		is dequeued, and keeps the text in the review history.
+		"""
+		with self._speechLock:
+			self._speechBacklog -= 1
+		self._perf.recordLatency(appName, "endToEnd", captureMark)
+		self._history.add(text, appName, targetIndex)
+		ui.message(text)
+	
+	def _makeRecordingTick(self, recorder, pixels, imgInfo, appName, targetIndex, rect, threshold):
+		"""Build the recording record for a captured frame.
+		
+		Returns:
+			dict: Record fields known at capture time (text is added by the callback)
+		"""
+		tick = {
+			"t": time.time(),
+			"app": appName,
+			"target": targetIndex,
+			"rect": list(rect),
+			"fp": lionRecorder.frameFingerprint(pixels),
+			"thr": threshold,
+		}
+		if recorder.storePixels:
+			tick["px"] = lionRecorder.encodePixels(pixels)
+			tick["pw"] = imgInfo.recogWidth
+			tick["ph"] = imgInfo.recogHeight
+		return tick
+	
+	def startRecording(self, path=None, storePixels=None):
+		"""Start writing a session recording.
+		
+		Args:
+			path: Recording file, defaults to a timestamped file in RECORDINGS_DIR
+			storePixels: Store compressed pixels, defaults to the recordPixels option
+		
+		Returns:
+			str or None: Recording path, None if it could not be opened
+		"""
+		if storePixels is None:
+			storePixels = config.conf["lion"]["recordPixels"]
+		try:
+			if path is None:
+				os.makedirs(RECORDINGS_DIR, exist_ok=True)
+				path = os.path.join(RECORDINGS_DIR, time.strftime("session-%Y%m%d-%H%M%S.lionrec"))
+			self.stopRecording()
+			self._recorder = lionRecorder.SessionRecorder(path, storePixels=storePixels)
+			logHandler.log.info(f"{ADDON_NAME}: Recording session to {path}")
+			return path
+		except Exception:
+			logHandler.log.exception(f"{ADDON_NAME}: Failed to start recording")
+			return None
+	
+	def stopRecording(self):
+		"""Stop the session recording, if any."""
+		recorder, self._recorder = self._recorder, None
+		if recorder:
+			recorder.close()
+			logHandler.log.info(f"{ADDON_NAME}: Recorded {recorder.records} scans to {recorder.path}")
+	
+	@script(
+		# Translators: description of the performance report command.
+		description=_("Speaks LION performance statistics for the active profile. "
+			"Press twice to write the full report to the NVDA log"),
+		category=ADDON_NAME,
+		gesture="kb:nvda+alt+shift+l")
+	def script_perfReport(self, gesture):
+		if not self._perf.enabled:
+			ui.message(_("LION performance statistics are disabled"))
+			return
+		if getLastScriptRepeatCount() >= 1:
+			logHandler.log.info(f"{ADDON_NAME}: Load times: {self.describeLoadTimes()}\n{self._perf.report()}")
+			ui.message(_("Performance report written to the NVDA log"))
+			return
+		parts = [self._describePerf(self.currentAppProfile)]
+		if self._governor.mode != lionGovernor.ACTIVE:
+			parts.append(self._describeGovernor())
+		cpuBudget = self.getEffectiveConfig(self.currentAppProfile).get("cpuBudget", 0)
+		if cpuBudget:
+			parts.append(self._describeCpuBudget(cpuBudget))
+		ui.message("; ".join(parts))
+	
+	def _describePerf(self, profile):
+		"""Translated, speakable form of lionPerf.PerfStats.summary()."""
+		snap = self._perf.snapshot(profile)
+		if not snap["stages"] and not snap["counters"]:
+			# Translators: spoken by the performance report when a profile has no statistics yet
+			return _("No statistics for {profile}").format(profile=profile)
+		stageNames = {
+			# Translators: scan stage in the spoken performance report
+			"target": _("target"),
+			# Translators: scan stage in the spoken performance report
+			"capture": _("capture"),
+			# Translators: scan stage in the spoken performance report
+			"recognize": _("recognize"),
+			# Translators: scan stage in the spoken performance report
+			"extract": _("extract"),
+			# Translators: scan stage in the spoken performance report
+			"filter": _("filter"),
+			# Translators: scan stage in the spoken performance report
+			"similarity": _("similarity"),
+			# Translators: scan stage in the spoken performance report
+			"speech": _("speech"),
+		}
+		# Translators: start of the spoken performance report
+		parts = [_("{profile}: {scans} scans").format(profile=profile, scans=snap["counters"].get("scans", 0))]
+		for stage in lionPerf.STAGES:
+			data = snap["stages"].get(stage)
+			if data:
+				# Translators: one scan stage in the spoken performance report (times in milliseconds)
+				parts.append(_("{stage} {mean} ms, p95 {p95}").format(stage=stageNames.get(stage, stage),
+					mean=f"{data['meanMs']:.0f}", p95=f"{data['p95Ms']:.0f}"))
+		endToEnd = snap["latencies"].get("endToEnd")
+		if endToEnd:
+			# Translators: latency from screen capture to speech in the spoken performance report
+			parts.append(_("capture to speech p50 {p50} ms, p95 {p95}").format(
+				p50=f"{endToEnd['p50Ms']:.0f}", p95=f"{endToEnd['p95Ms']:.0f}"))
+		return "; ".join(parts)
+	
+	def _describeGovernor(self):
+		"""Translated, speakable form of lionGovernor.ScanGovernor.describe()."""
+		mode, reason, seconds = self._governor.state()
+		if mode == lionGovernor.ACTIVE:
+			# Translators: scan governor state: scanning at the normal rate
+			return _("scanning")
+		modeNames = {
+			# Translators: scan governor state: scanning slowed down
+			lionGovernor.IDLE: _("idle"),
+			# Translators: scan governor state: scanning paused
+			lionGovernor.SUSPENDED: _("suspended"),
+		}
+		reasons = {
+			# Translators: why scanning is paused or slowed down
+			"locked": _("screen locked"),
+			# Translators: why scanning is paused or slowed down
+			"displayOff": _("display off"),
+			# Translators: why scanning is paused or slowed down
+			"sleepMode": _("sleep mode"),
+			# Translators: why scanning is paused or slowed down
+			"idle": _("no input"),
+		}
+		# Translators: scan governor state, e.g. "suspended (screen locked) for 30 s"
+		return _("{mode} ({reason}) for {seconds} s").format(mode=modeNames.get(mode, mode),
+			reason=reasons.get(reason, reason), seconds=f"{seconds:.0f}")
+	
+	def _describeCpuBudget(self, budgetPercent):
+		"""Translated, speakable form of lionGovernor.CpuBudget.describe()."""
+		usage = f"{self._cpuBudget.usage() * 100:.0f}"
+		if not budgetPercent:
+			# Translators: recognizer CPU usage in percent of one CPU
+			return _("recognizer {usage}% of one CPU").format(usage=usage)
+		if self._cpuBudget.throttling:
+			# Translators: recognizer CPU usage against the configured budget, while scans are slowed down
+			return _("recognizer {usage}% of one CPU, budget {budget}%, throttling").format(
+				usage=usage, budget=budgetPercent)
+		# Translators: recognizer CPU usage against the configured budget
+		return _("recognizer {usage}% of one CPU, budget {budget}%").format(usage=usage, budget=budgetPercent)
+
+	@script(
+		# Translators: description of the command toggling performance statistics.
+		description=_("Turns collection of LION performance statistics on or off"),
+		category=ADDON_NAME)
+	def script_togglePerfStats(self, gesture):
+		enabled = not self._perf.enabled
+		self.setPerfStats(enabled)
+		if enabled:
+			ui.message(_("LION performance statistics on"))
+		else:
+			ui.message(_("LION performance statistics off"))
+
+	def setPerfStats(self, enabled):
+		"""Turn collection of performance statistics on or off (resets them)."""
+		config.conf["lion"]["perfStats"] = enabled
+		self._perf.reset()
+		self._perf.enabled = enabled
+	
+	def setLiveOverrides(self, appName, values):
+		"""Apply settings to the running scan loop without saving them.
+		
+		The values take precedence over the profile while appName is the active
+		profile, until replaced, cleared or the profile is saved.
+		
+		Args:
+			appName: Profile the values were edited for
+			values: Dict of PROFILE_KEYS values, or None to go back to the saved profile
+		"""
+		with self._profileLock:
+			previous = self._liveOverrides
+			self._liveOverrides = (appName, dict(values)) if values else None
+		# The dialog saves global settings before calling this
+		self._applyGlobalSettings()
+		if previous or values:
+			# Show the effect right away rather than after the old interval
+			self.requestRescan()
+	
+	def getLiveStats(self):
+		"""Counters of the active profile for the settings dialog's Performance tab.
+		
+		Returns:
+			dict: profile, perfEnabled, running (OCR on), snapshot (lionPerf snapshot),
+				geometryHits, geometryMisses, speechBacklog, governor and cpu
+				(translated descriptions), live (True if unsaved settings are applied)
+		"""
+		appName = self.currentAppProfile
+		with self._geometryLock:
+			hits, misses = self._geometryCacheHits, self._geometryCacheMisses
+		live = self._liveOverrides
+		return {
+			"profile": appName,
+			"perfEnabled": self._perf.enabled,
+			"running": self.ocrState in (OCR_STARTING, OCR_RUNNING),
+			"snapshot": self._perf.snapshot(appName),
+			"geometryHits": hits,
+			"geometryMisses": misses,
+			"speechBacklog": max(0, self._speechBacklog),
+			"governor": self._describeGovernor(),
+			"cpu": self._describeCpuBudget(self.getEffectiveConfig(appName).get("cpuBudget", 0)),
+			"live": bool(live and live[0] == appName),
+		}
+	
+	def getMemoryReport(self):
+		"""Estimate bytes held by the scan loop's long-lived structures.
+		
+		Returns:
+			dict: Category name -> bytes ("capturePool": idle reusable capture
+				buffers), plus "inFlightCount", "inFlightPeak" (bytes) and
+				"inFlightExpired" (abandoned recognitions)
+		"""
+		with self._stateLock:
+			stateBytes = lionMemory.deepSizeOf(self._ocrState)
+		with self._geometryLock:
+			geometryBytes = lionMemory.deepSizeOf(
+				{index: entry["location"] for index, entry in self._targetGeometry.items()})
+		return {
+			"ocrState": stateBytes,
+			"inFlightFrames": self._inFlight.totalBytes(),
+			"inFlightCount": self._inFlight.count(),
+			"inFlightPeak": self._inFlight.peakBytes,
+			"inFlightExpired": self._inFlight.expired,
+			"capturePool": self._capturePool.freeBytes() + self._mosaicPool.freeBytes(),
+			"targetCaches": geometryBytes + lionMemory.deepSizeOf(self._lastTargets),
+			"profileData": lionMemory.deepSizeOf(self.currentProfileData),
+			"profileSummary": lionMemory.deepSizeOf(self._profileSummary),
+			"perfStats": lionMemory.deepSizeOf(self._perf),
+			"history": self._history.bytes,
+		}
+	
+	def startAllocationTrace(self, seconds=None):
+		"""Start a tracemalloc trace that ends after `seconds` (memTraceSeconds by default)."""
+		if self._allocTrace:
+			return
+		if seconds is None:
+			seconds = config.conf["lion"]["memTraceSeconds"]
+		self._allocTrace = lionMemory.AllocationTrace()
+		self._allocTrace.start()
+		self._allocTraceTimer = threading.Timer(seconds, self.stopAllocationTrace)
+		self._allocTraceTimer.daemon = True
+		self._allocTraceTimer.start()
+		logHandler.log.info(f"{ADDON_NAME}: Allocation trace started for {seconds} s")
+	
+	def stopAllocationTrace(self):
+		"""Finish the allocation trace and write its diff report next to the profiles.
+		
+		Returns:
+			str or None: Report path, None if no trace was running or writing failed
+		"""
+		trace, self._allocTrace = self._allocTrace, None
+		if self._allocTraceTimer:
+			self._allocTraceTimer.cancel()
+			self._allocTraceTimer = None
+		if not trace:
+			return None
+		report = trace.stop()
+		logHandler.log.info(f"{ADDON_NAME}: {report.splitlines()[0]}")
+		path = os.path.join(os.path.dirname(PROFILES_DIR), time.strftime("memtrace-%Y%m%d-%H%M%S.txt"))
+		try:
+			with open(path, "w", encoding="utf-8") as f:
+				f.write(report)
+				f.write("\n\n")
+				for name, value in self.getMemoryReport().items():
+					f.write(f"{name}: {value}\n")
+			logHandler.log.info(f"{ADDON_NAME}: Allocation trace report written to {path}")
+			return path
+		except Exception:
+			logHandler.log.exception(f"{ADDON_NAME}: Failed to write allocation trace report")
+			return None
+
+	@script(
+		# Translators: description of the memory report command.
+		description=_("Speaks memory held by LION. Press twice to write the details to the NVDA log"),
+		category=ADDON_NAME)
+	def script_memoryReport(self, gesture):
+		report = self.getMemoryReport()
+		if getLastScriptRepeatCount() >= 1:
+			logHandler.log.info(f"{ADDON_NAME}: Memory report: " + ", ".join(
+				f"{name}={value}" for name, value in report.items()))
+			ui.message(_("Memory report written to the NVDA log"))
+			return
+		total = sum(value for name, value in report.items() if name not in ("inFlightCount", "inFlightPeak", "inFlightExpired"))
+		ui.message(_("LION holds {total}, {count} frames in flight").format(
+			total=lionMemory.formatBytes(total), count=report["inFlightCount"]))
+
+	@script(
+		# Translators: description of the allocation tracing command.
+		description=_("Starts an allocation trace of the LION scan loop, or stops it and writes the report"),
+		category=ADDON_NAME)
+	def script_toggleAllocationTrace(self, gesture):
+		if self._allocTrace:
+			if self.stopAllocationTrace():
+				ui.message(_("Allocation trace report written"))
+			else:
+				ui.message(_("Could not write allocation trace report"))
+		else:
+			self.startAllocationTrace()
+			ui.message(_("Allocation trace started"))
+
+	@script(
+		# Translators: description of the session recording command.
+		description=_("Starts or stops recording LION scans to a file for offline replay"),
+		category=ADDON_NAME)
+	def script_toggleRecording(self, gesture):
+		if self._recorder:
+			self.stopRecording()
+			ui.message(_("LION recording stopped"))
+		elif self.startRecording():
+			ui.message(_("LION recording started"))
+		else:
+			ui.message(_("Could not start LION recording"))
+
+	def startRegionLearning(self):
+		"""Start learning the changing region of the current profile's OCR target.
+		
+		Returns:
+			bool: True if learning started
+		"""
+		if self._roiLearning:
+			return False
+		with self._profileLock:
+			appName = self.currentAppProfile
+			targetIndex = self._parseTargetIndex(self.getEffectiveConfig(appName))
+		seconds = config.conf["lion"]["roiLearnSeconds"]
+		self._roiProposal = None
+		self._roiLearning = (appName, targetIndex, lionTuning.RoiLearner(seconds))
+		logHandler.log.info(f"{ADDON_NAME}: Learning region of target {targetIndex} for {appName} ({seconds} s)")
+		self.requestRescan((targetIndex,))
+		return True
+	
+	def _learnFromResult(self, result, imgInfo, keys, rect):
+		"""Feed a recognition result of the learned target to the learner."""
+		learning = self._roiLearning
+		if not learning or (learning[0], learning[1]) not in keys:
+			return
+		learner = learning[2]
+		learner.add(lionTuning.resultWords(result, imgInfo.recogWidth, imgInfo.recogHeight), rect)
+		if learner.done:
+			queueHandler.queueFunction(queueHandler.eventQueue, self.finishRegionLearning, learner)
+	
+	def finishRegionLearning(self, learner=None):
+		"""End region learning and propose (or, with roiAutoApply, apply) the crop.
+		
+		Args:
+			learner: Only finish if this learner is still the active one (callbacks)
+		"""
+		learning = self._roiLearning
+		if not learning or (learner is not None and learning[2] is not learner):
+			return
+		self._roiLearning = None
+		appName, targetIndex, learner = learning
+		self.requestRescan((targetIndex,))
+		crop = learner.proposal()
+		logHandler.log.info(f"{ADDON_NAME}: Region learning for {appName} ended after {learner.frames} "
+			f"frames, {learner.changedWords} changed words, proposal {crop}")
+		if crop is None:
+			ui.message(_("No changing text found, crop unchanged"))
+			return
+		if config.conf["lion"]["roiAutoApply"]:
+			self.applyRegionCrop(appName, crop)
+			return
+		self._roiProposal = (appName, crop)
+		# Translators: {left}... are crop percentages, {area} the share of the target kept.
+		ui.message(_("Proposed crop: left {left}, right {right}, up {up}, down {down} percent, "
+			"{area} percent of the target. Run the learn region command again to apply it").format(
+			left=crop["cropLeft"], right=crop["cropRight"], up=crop["cropUp"], down=crop["cropDown"],
+			area=int(round(learner.coverage() * 100))))
+	
+	def applyRegionCrop(self, appName, crop):
+		"""Save learned crop settings to a profile.
+		
+		Args:
+			appName: Profile the crop was learned for; must be the active profile
+			crop: cropLeft/cropRight/cropUp/cropDown percentages
+		
+		Returns:
+			bool: True if the crop was saved
+		"""
+		if not self._saveTunedValues(appName, crop):
+			ui.message(_("The learned crop belongs to {app}, switch to it to apply").format(app=appName))
+			return False
+		self._roiProposal = None
+		ui.message(_("Learned crop applied to {app}").format(app=appName))
+		return True
+	
+	def _saveTunedValues(self, appName, values):
+		"""Save learned settings to the active profile (as overrides unless global).
+		
+		Returns:
+			bool: False if appName is no longer the active profile
+		"""
+		with self._profileLock:
+			if appName != self.currentAppProfile:
+				return False
+			if appName == "global":
+				for key, value in values.items():
+					config.conf["lion"][key] = value
+			else:
+				overrides = dict(self.currentProfileData)
+				for key, value in values.items():
+					if value != config.conf["lion"][key]:
+						overrides[key] = value
+					else:
+						overrides.pop(key, None)
+				self.saveProfileForApp(appName, overrides)
+		self.requestRescan()
+		return True
+
+	@script(
+		# Translators: description of the region learning command.
+		description=_("Learns which part of the OCR target changes and proposes a crop; "
+			"run again to stop learning early or to apply the proposal"),
+		category=ADDON_NAME)
+	def script_learnRegion(self, gesture):
+		if self._roiProposal:
+			self.applyRegionCrop(*self._roiProposal)
+		elif self._roiLearning:
+			self.finishRegionLearning()
+		elif self.ocrState not in (OCR_STARTING, OCR_RUNNING):
+			ui.message(_("Start LION before learning the region"))
+		elif self.startRegionLearning():
+			ui.message(_("Learning the changing region for {seconds} seconds").format(
+				seconds=config.conf["lion"]["roiLearnSeconds"]))
+
+	def startCalibration(self):
+		"""Start sampling the OCR noise of the current profile's (static) OCR target.
+		
+		Returns:
+			bool: True if calibration started
+		"""
+		if self._calibration:
+			return False
+		with self._profileLock:
+			appName = self.currentAppProfile
+			targetIndex = self._parseTargetIndex(self.getEffectiveConfig(appName))
+		frames = config.conf["lion"]["calibrationFrames"]
+		self._calibration = (appName, targetIndex, lionTuning.ThresholdCalibrator(frames))
+		logHandler.log.info(f"{ADDON_NAME}: Calibrating threshold of target {targetIndex} for {appName} "
+			f"({frames} samples)")
+		self.requestRescan((targetIndex,))
+		return True
+	
+	def _calibrateFromText(self, text, textFilter, calibrator):
+		"""Feed the comparison text of a calibrated target's result to the calibrator."""
+		if textFilter is None:
+			textFilter = self._getTextFilter(config.conf["lion"])
+		calibrator.add(textFilter.apply(text)[1])
+		if calibrator.done:
+			queueHandler.queueFunction(queueHandler.eventQueue, self.finishCalibration, calibrator)
+	
+	def finishCalibration(self, calibrator=None):
+		"""End calibration and save the threshold below the noise floor to the profile.
+		
+		Args:
+			calibrator: Only finish if this calibrator is still the active one (callbacks)
+		
+		Returns:
+			float or None: Threshold saved
+		"""
+		calibration = self._calibration
+		if not calibration or (calibrator is not None and calibration[2] is not calibrator):
+			return None
+		self._calibration = None
+		appName, _targetIndex, calibrator = calibration
+		threshold = calibrator.proposal()
+		floor = calibrator.noiseFloor
+		logHandler.log.info(f"{ADDON_NAME}: Threshold calibration for {appName} ended after "
+			f"{len(calibrator.ratios)} samples, noise floor {floor}, proposal {threshold}")
+		if threshold is None:
+			if len(calibrator.ratios) < lionTuning.CALIBRATION_MIN_SAMPLES:
+				ui.message(_("Not enough scans to calibrate, threshold unchanged"))
+			else:
+				ui.message(_("The text changed during calibration, threshold unchanged"))
+			return None
+		if not self._saveTunedValues(appName, {"threshold": threshold}):
+			ui.message(_("The calibration belongs to {app}, threshold unchanged").format(app=appName))
+			return None
+		# Translators: {threshold} is the new similarity threshold, {floor} the lowest
+		# similarity of unchanged text.
+		ui.message(_("Threshold for {app} set to {threshold:.2f}, noise floor {floor:.2f}").format(
+			app=appName, threshold=threshold, floor=floor))
+		return threshold
+
+	@script(
+		# Translators: description of the threshold calibration command.
+		description=_("Calibrates the similarity threshold of the active profile from OCR noise; "
+			"keep the OCR target unchanged while it runs, run again to stop early"),
+		category=ADDON_NAME)
+	def script_calibrateThreshold(self, gesture):
+		if self._calibration:
+			self.finishCalibration()
+		elif self.ocrState not in (OCR_STARTING, OCR_RUNNING):
+			ui.message(_("Start LION before calibrating"))
+		elif self.startCalibration():
+			ui.message(_("Calibrating the threshold, keep the screen unchanged"))
+
+	def _reviewHistory(self, step):
+		"""Speak the previous (step -1) or next (step 1) history entry of the active profile."""
+		profile = self.currentAppProfile
+		if step < 0:
+			entry = self._history.previous(self._historyCursor, profile)
+		else:
+			entry = self._history.next(self._historyCursor, profile)
+		if entry is None:
+			if self._history.latest(profile) is None:
+				ui.message(_("No LION history for {profile}").format(profile=profile))
+			elif step < 0:
+				ui.message(_("Start of LION history"))
+			else:
+				ui.message(_("End of LION history"))
+			return
+		self._historyCursor = entry.id
+		ui.message(entry.text)
+
+	@script(
+		# Translators: description of the command reviewing older announcements.
+		description=_("Speaks the previous LION announcement of the active profile"),
+		category=ADDON_NAME,
+		gesture="kb:nvda+alt+shift+pageUp")
+	def script_historyPrevious(self, gesture):
+		self._reviewHistory(-1)
+
+	@script(
+		# Translators: description of the command reviewing newer announcements.
+		description=_("Speaks the next LION announcement of the active profile"),
+		category=ADDON_NAME,
+		gesture="kb:nvda+alt+shift+pageDown")
+	def script_historyNext(self, gesture):
+		self._reviewHistory(1)
+
+	@script(
+		# Translators: description of the command copying an announcement.
+		description=_("Copies the reviewed LION announcement (or the latest one) to the clipboard"),
+		category=ADDON_NAME)
+	def script_historyCopy(self, gesture):
+		entry = self._history.get(self._historyCursor)
+		if entry is None or entry.profile != self.currentAppProfile:
+			entry = self._history.latest(self.currentAppProfile)
+		if entry is None:
+			ui.message(_("No LION history for {profile}").format(profile=self.currentAppProfile))
+			return
+		if api.copyToClip(entry.text):
+			ui.message(_("Copied to clipboard"))
+
+	def searchHistory(self, query, profile=None):
+		"""Entries of the announcement history containing every word of query.
+		
+		Args:
+			query: Words to look for (the last one may be incomplete)
+			profile: Only search this profile's entries
+		
+		Returns:
+			list: lionHistory.HistoryEntry tuples, newest first
+		"""
+		mark = self._perf.mark()
+		results = self._history.search(query, profile)
+		self._perf.record(self.currentAppProfile, "historySearch", mark)
+		return results
+
+	@script(
+		# Translators: description of the command searching the announcement history.
+		description=_("Opens a dialog searching the LION announcement history"),
+		category=ADDON_NAME,
+		gesture="kb:nvda+alt+shift+f")
+	def script_historySearch(self, gesture):
+		wx.CallAfter(self._openHistorySearch)
+
+	def _openHistorySearch(self):
+		if _loadGui() is None:
+			ui.message(_("Error: Settings module not available"))
+			return
+		if self.historyDialog:
+			try:
+				self.historyDialog.Raise()
+				return
+			except (RuntimeError, AttributeError):
+				self.historyDialog = None
+		try:
+			gui.mainFrame.prePopup()
+			self.historyDialog = lionGui.HistorySearchDialog(gui.mainFrame, self)
+			self.historyDialog.Show()
+			gui.mainFrame.postPopup()
+		except Exception:
+			logHandler.log.exception(f"{ADDON_NAME}: Error opening history search")
+			self.historyDialog = None
 
 	__gestures={
 		"kb:nvda+alt+l":"ReadLiveOcr"
 	}
+
+
+# Whole module import, including the LION helper modules (not lionGui)
+IMPORT_SECONDS = time.perf_counter() - _importStart
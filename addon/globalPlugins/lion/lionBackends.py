@@ -0,0 +1,206 @@
+"""
+LION Evolution Pro - Recognizer backends
+
+A backend creates recognizers with NVDA's content recognizer interface
+(recognize(pixels, imgInfo, onResult) calling onResult with a result that has
+makeTextInfo(obj, position), or with an Exception) and describes itself:
+languages, capabilities and an estimated cost per scan. Backends are selected
+per profile with the "backend" and "language" keys.
+
+Registered backends:
+--------------------
+- uwp: the Windows 10+ OCR engine shipped with NVDA (contentRecog.uwpOcr).
+- stub: deterministic recognizer for tests and benchmarks; returns a fixed
+  text per frame fingerprint, optionally after a simulated latency.
+
+Another locally installed engine is added by subclassing RecognizerBackend
+and calling registerBackend() with an instance, e.g. from another addon.
+
+This module has no NVDA dependencies at import time so it can be used headless.
+"""
+
+import threading
+
+from . import lionRecorder
+
+
+DEFAULT_BACKEND = "uwp"
+
+# Capabilities a backend may declare
+CAP_WORD_BOXES = "wordBoxes"  # result.data has per-word bounding boxes
+CAP_CONFIDENCE = "confidence"  # per-word confidence values
+CAP_LANGUAGES = "languages"  # recognition language can be chosen
+CAP_DETERMINISTIC = "deterministic"  # same frame, same text, no external engine
+
+# Weight of the newest observation in the learned cost per megapixel
+COST_WEIGHT = 0.2
+
+
+class RecognizerBackend:
+	"""Base class of recognizer backends."""
+
+	name = ""
+	label = ""
+	capabilities = frozenset()
+	testOnly = False  # Hidden from the settings dialog
+	# Prior cost estimate: fixed overhead plus seconds per megapixel
+	overheadSeconds = 0.05
+	secondsPerMegapixel = 0.1
+
+	def __init__(self):
+		self._costLock = threading.Lock()
+
+	def isAvailable(self):
+		"""True if the engine can be used on this system."""
+		return True
+
+	def languages(self):
+		"""Language codes the engine can recognize (empty: not selectable)."""
+		return []
+
+	def create(self, language=None):
+		"""Create a recognizer.
+
+		Args:
+			language: Language code, or None for the engine default
+
+		Returns:
+			object: Recognizer with getResizeFactor(width, height) and
+				recognize(pixels, imgInfo, onResult)
+		"""
+		raise NotImplementedError
+
+	def costEstimate(self, width, height):
+		"""Estimated seconds to recognize an area of width x height pixels."""
+		return self.overheadSeconds + self.secondsPerMegapixel * width * height / 1e6
+
+	def observe(self, width, height, seconds):
+		"""Refine costEstimate() with a measured recognition time."""
+		megapixels = width * height / 1e6
+		if megapixels <= 0:
+			return
+		sample = max(0.0, seconds - self.overheadSeconds) / megapixels
+		with self._costLock:
+			self.secondsPerMegapixel += COST_WEIGHT * (sample - self.secondsPerMegapixel)
+
+
+class UwpBackend(RecognizerBackend):
+	"""Windows OCR through NVDA's contentRecog.uwpOcr."""
+
+	name = "uwp"
+	label = "Windows OCR"
+	capabilities = frozenset((CAP_WORD_BOXES, CAP_LANGUAGES))
+	overheadSeconds = 0.05
+	secondsPerMegapixel = 0.15
+
+	def isAvailable(self):
+		try:
+			from contentRecog import uwpOcr
+			return bool(uwpOcr.getLanguages())
+		except Exception:
+			return False
+
+	def languages(self):
+		try:
+			from contentRecog import uwpOcr
+			return list(uwpOcr.getLanguages())
+		except Exception:
+			return []
+
+	def create(self, language=None):
+		from contentRecog import uwpOcr
+		if language:
+			return uwpOcr.UwpOcr(language=language)
+		return uwpOcr.UwpOcr()
+
+
+class StubTextInfo:
+	def __init__(self, text):
+		self.text = text
+
+
+class StubResult:
+	"""Recognition result holding a fixed text."""
+
+	def __init__(self, text):
+		self.text = text
+
+	def makeTextInfo(self, obj, position):
+		return StubTextInfo(self.text)
+
+
+class StubRecognizer:
+	"""Deterministic recognizer: text depends only on the frame's fingerprint."""
+
+	def __init__(self, texts=None, latency=0.0):
+		"""
+		Args:
+			texts: Mapping of frame fingerprint to text (see lionRecorder.frameFingerprint);
+				other frames read as "frame <fingerprint>"
+			latency: Seconds before the result is delivered (0: delivered synchronously)
+		"""
+		self.texts = texts or {}
+		self.latency = latency
+
+	def getResizeFactor(self, width, height):
+		return 1
+
+	def recognize(self, pixels, imgInfo, onResult):
+		fingerprint = lionRecorder.frameFingerprint(pixels)
+		result = StubResult(self.texts.get(fingerprint, f"frame {fingerprint}"))
+		if self.latency:
+			timer = threading.Timer(self.latency, onResult, (result,))
+			timer.daemon = True
+			timer.start()
+		else:
+			onResult(result)
+
+	def cancel(self):
+		pass
+
+
+class StubBackend(RecognizerBackend):
+	"""Backend creating StubRecognizer instances sharing one text table."""
+
+	name = "stub"
+	label = "Deterministic stub"
+	capabilities = frozenset((CAP_DETERMINISTIC,))
+	testOnly = True
+	overheadSeconds = 0.0
+	secondsPerMegapixel = 0.0
+
+	def __init__(self, texts=None, latency=0.0):
+		super().__init__()
+		self.texts = dict(texts or {})
+		self.latency = latency
+
+	def create(self, language=None):
+		return StubRecognizer(self.texts, self.latency)
+
+
+_backends = {}
+
+
+def registerBackend(backend):
+	"""Register (or replace) a backend under backend.name."""
+	_backends[backend.name] = backend
+
+
+def getBackend(name):
+	"""Return the backend registered under name, or None."""
+	return _backends.get(name)
+
+
+def backendNames():
+	"""Names of all registered backends."""
+	return sorted(_backends)
+
+
+def availableBackends(includeTestOnly=False):
+	"""Registered backends usable on this system."""
+	return [backend for name, backend in sorted(_backends.items())
+		if (includeTestOnly or not backend.testOnly) and backend.isAvailable()]
+
+
+registerBackend(UwpBackend())
+registerBackend(StubBackend())
@@ -0,0 +1,159 @@
+"""
+LION Evolution Pro - Capture buffer pool
+
+Capturing a target allocates a screen bitmap (GDI device context and bitmap)
+and a pixel buffer of the recognized size: megabytes per scan for the whole
+screen. CapturePool keeps both for reuse, by size: a scan acquires a slot,
+captures into the slot's buffer, hands the buffer to the recognizer by
+reference and releases the slot when the recognizer's callback has run, so
+the buffer is never overwritten while a recognition still reads it. In
+steady state scanning allocates no pixel buffers at all.
+
+Idle memory is bounded by bytes, not slot count:
+------------------------------------------------
+- One idle slot is kept per size; slots beyond that only exist while
+  several recognitions of that size are in flight and are dropped when
+  released.
+- Idle slots (pixel buffers and screen bitmaps) are kept within
+  MAX_IDLE_BYTES, least recently released sizes dropped first; the slot
+  just released is always kept, so a single whole-screen target still
+  reuses its buffer.
+- Idle slots unused for IDLE_SECONDS are dropped (trim(), also run by
+  acquire and release), e.g. after a target changed size or while scanning
+  is suspended.
+- clear() (scanning stopped) drops the idle slots, and the slots still in
+  use are dropped when their late callbacks release them.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import collections
+import threading
+import time
+
+
+# Idle bytes kept (pixel buffers and screen bitmaps) beyond the slot last released
+MAX_IDLE_BYTES = 16 * 1024 * 1024
+# Idle slots not reused for this many seconds are dropped
+IDLE_SECONDS = 30.0
+# Bytes per pixel of captured bitmaps (BGRA)
+BYTES_PER_PIXEL = 4
+
+
+class CaptureSlot:
+	"""A screen bitmap of one size and the pixel buffer last captured with it."""
+
+	__slots__ = ("width", "height", "bitmap", "pixels", "epoch")
+
+	def __init__(self, width, height, bitmap=None, epoch=0):
+		self.width = width
+		self.height = height
+		self.bitmap = bitmap
+		self.pixels = None  # Allocated by the first capture
+		self.epoch = epoch  # Pool epoch the slot belongs to (see CapturePool.clear)
+
+	@property
+	def bytes(self):
+		"""Memory held: the pixel buffer and the screen bitmap, if any."""
+		held = (self.pixels is not None) + (self.bitmap is not None)
+		return self.width * self.height * BYTES_PER_PIXEL * held
+
+
+class CapturePool:
+	"""Capture slots kept for reuse, by size."""
+
+	def __init__(self, newBitmap=None, maxIdleBytes=MAX_IDLE_BYTES, idleSeconds=IDLE_SECONDS):
+		"""
+		Args:
+			newBitmap: Callable (width, height) -> screen bitmap for a new slot
+				(None: slots only hold pixel buffers)
+			maxIdleBytes: Idle bytes kept beyond the slot last released
+			idleSeconds: Idle slots not reused for this long are dropped
+		"""
+		self._newBitmap = newBitmap
+		self.maxIdleBytes = maxIdleBytes
+		self.idleSeconds = idleSeconds
+		self._lock = threading.Lock()
+		# (width, height) -> (slot, release time), least recently released first
+		self._free = collections.OrderedDict()
+		self._freeBytes = 0
+		self._epoch = 0
+		self.inUse = 0
+		self.created = 0
+		self.reused = 0
+		self.dropped = 0
+
+	def acquire(self, width, height):
+		"""Take the idle slot of this size, or a new one.
+
+		Returns:
+			CaptureSlot: Exclusively owned until release()
+		"""
+		size = (width, height)
+		with self._lock:
+			self._expire(time.monotonic())
+			self.inUse += 1
+			entry = self._free.pop(size, None)
+			if entry is not None:
+				self._freeBytes -= entry[0].bytes
+				self.reused += 1
+				return entry[0]
+			self.created += 1
+			epoch = self._epoch
+		bitmap = self._newBitmap(width, height) if self._newBitmap is not None else None
+		return CaptureSlot(width, height, bitmap, epoch)
+
+	def release(self, slot):
+		"""Return a slot once nothing reads its pixels any more."""
+		now = time.monotonic()
+		with self._lock:
+			self.inUse -= 1
+			if slot.epoch != self._epoch:
+				# Acquired before clear()
+				self.dropped += 1
+				return
+			size = (slot.width, slot.height)
+			previous = self._free.pop(size, None)
+			if previous is not None:
+				# Several of this size were in flight: one idle slot is enough
+				self._freeBytes -= previous[0].bytes
+				self.dropped += 1
+			self._free[size] = (slot, now)
+			self._freeBytes += slot.bytes
+			self._expire(now)
+			while self._freeBytes > self.maxIdleBytes and len(self._free) > 1:
+				_size, (oldSlot, _released) = self._free.popitem(last=False)
+				self._freeBytes -= oldSlot.bytes
+				self.dropped += 1
+
+	def trim(self):
+		"""Drop idle slots not reused for idleSeconds."""
+		with self._lock:
+			self._expire(time.monotonic())
+
+	def _expire(self, now):
+		# Called with the lock held; entries are in release order
+		while self._free:
+			size, (slot, released) = next(iter(self._free.items()))
+			if now - released < self.idleSeconds:
+				break
+			del self._free[size]
+			self._freeBytes -= slot.bytes
+			self.dropped += 1
+
+	def clear(self):
+		"""Drop all idle slots; slots in use are dropped when released."""
+		with self._lock:
+			self._epoch += 1
+			self.dropped += len(self._free)
+			self._free.clear()
+			self._freeBytes = 0
+
+	def freeBytes(self):
+		"""Bytes held by idle slots (pixel buffers and screen bitmaps)."""
+		with self._lock:
+			return self._freeBytes
+
+	def describe(self):
+		return (f"{self.inUse} in use, {len(self._free)} idle ({self._freeBytes} bytes), "
+			f"{self.created} created, {self.reused} reused, {self.dropped} dropped")
@@ -0,0 +1,326 @@
+"""
+LION Evolution Pro - Text filter pipeline
+
+Per-profile rules applied to recognized text before the similarity check and
+speech, so recurring noise (clocks, counters, progress percentages) neither
+triggers re-reads nor gets spoken.
+
+Rules (profile key "filters", one string per rule):
+---------------------------------------------------
+- "line:<text>"     drop lines equal to <text> (surrounding whitespace ignored)
+- "regex:<pattern>" remove every match of <pattern> (Python re syntax)
+- "digits"          compare with digit runs masked ("12:05" and "12:06" match)
+- "whitespace"      compare with whitespace runs collapsed
+
+Blocked lines and regex matches are removed from the spoken text as well;
+digit masking and whitespace collapsing only affect the comparison text.
+
+A rule list is compiled once (regex rules and digit masking fused into a
+single pattern) and applied in one pass over the lines. A leading inline flag
+group such as "(?i)" is rewritten to a scoped one ("(?i:...)") so it only
+applies to its own rule. Rules with named groups, backreferences or group
+conditions would change meaning when joined, so they are applied on their
+own, one after another, before the fused pattern; all rules are if the
+joined pattern does not compile.
+
+Word filtering (profile keys "minWordConfidence", "minWordHeight",
+"dropEdgeWords") runs earlier, on the word boxes of the recognition result:
+words below the confidence threshold (when the engine reports one), shorter
+than the minimum height, or touching the border of the recognized image
+(glyphs cut by the crop) are dropped before the text is assembled. Icons and
+graphics recognized as garbage then never reach the text rules, the
+similarity check or speech.
+
+Stability (profile keys "stableFrames", "stableMs") runs last, after the
+similarity check: text that differs enough from the last announcement is
+held as a candidate and only spoken once the same text (by fingerprint) was
+recognized in stableFrames consecutive results or stayed for stableMs
+milliseconds, whichever comes first. Animations and partially rendered
+content then produce one announcement instead of one per frame.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import re
+import time
+
+
+DEFAULT_FILTERS = ("line:Play",)
+
+_DIGIT_GROUP = "lionDigits"
+_WHITESPACE_RE = re.compile(r"\s+")
+# Leading global flags, e.g. "(?i)" or "(?im)"
+_GLOBAL_FLAGS_RE = re.compile(r"^\(\?([aiLmsux]+)\)")
+# Constructs that refer to other groups by number or name (conservative: an
+# escaped backslash before a digit also matches)
+_GROUP_REFERENCE_RE = re.compile(r"\\\d|\\g<|\(\?P=|\(\?\(")
+
+
+class TextFilter:
+	"""A compiled rule list."""
+
+	def __init__(self, rules, blockedLines, removalPattern, digitsPattern, collapseWhitespace,
+			separatePatterns=()):
+		self.rules = rules
+		self._blockedLines = blockedLines
+		self._removal = removalPattern
+		self._fused = digitsPattern
+		self._collapseWhitespace = collapseWhitespace
+		# Removal patterns that cannot be fused, applied one after another
+		self._separate = tuple(separatePatterns)
+
+	@property
+	def isIdentity(self):
+		"""True if the filter never changes any text."""
+		return not (self._blockedLines or self._removal or self._fused or self._collapseWhitespace
+			or self._separate)
+
+	def apply(self, text):
+		"""Filter recognized text.
+
+		Returns:
+			tuple: (speech text, comparison text)
+		"""
+		if self.isIdentity:
+			return text, text
+		blocked = self._blockedLines
+		removal = self._removal
+		fused = self._fused
+		speechLines = []
+		compareLines = []
+		for line in text.split("\n"):
+			if blocked and line.strip() in blocked:
+				continue
+			for pattern in self._separate:
+				line = pattern.sub("", line)
+			if fused is not None:
+				# One pass: regex matches removed, digit runs masked
+				compare = fused.sub(_maskDigits, line)
+				if removal is not None:
+					line = removal.sub("", line)
+			else:
+				if removal is not None:
+					line = removal.sub("", line)
+				compare = line
+			if self._collapseWhitespace:
+				compare = _WHITESPACE_RE.sub(" ", compare).strip()
+			speechLines.append(line)
+			compareLines.append(compare)
+		return "\n".join(speechLines).strip(), "\n".join(compareLines).strip()
+
+
+def _maskDigits(match):
+	return "#" if match.group(_DIGIT_GROUP) is not None else ""
+
+
+def compileFilters(rules):
+	"""Compile a rule list.
+
+	Args:
+		rules: Iterable of rule strings (see module docstring)
+
+	Returns:
+		tuple: (TextFilter, errors) where errors lists "rule: reason" strings
+			for rules that were ignored
+	"""
+	rules = tuple(rules or ())
+	blockedLines = set()
+	patterns = []
+	separate = []
+	maskDigits = False
+	collapseWhitespace = False
+	errors = []
+	for rule in rules:
+		rule = str(rule)
+		kind, sep, value = rule.partition(":")
+		kind = kind.strip().lower()
+		if kind == "line" and sep:
+			blockedLines.add(value.strip())
+		elif kind == "regex" and sep:
+			try:
+				compiled = re.compile(value)
+			except re.error as e:
+				errors.append(f"{rule}: {e}")
+				continue
+			if compiled.groupindex or _GROUP_REFERENCE_RE.search(value):
+				separate.append(compiled)
+				continue
+			flags = _GLOBAL_FLAGS_RE.match(value)
+			if flags:
+				scoped = f"(?{flags.group(1)}:{value[flags.end():]})"
+				try:
+					re.compile(scoped)
+				except re.error:
+					separate.append(compiled)
+					continue
+				patterns.append(scoped)
+			else:
+				patterns.append(f"(?:{value})")
+		elif kind == "digits" and not sep:
+			maskDigits = True
+		elif kind == "whitespace" and not sep:
+			collapseWhitespace = True
+		elif rule.strip():
+			errors.append(f"{rule}: unknown rule")
+	removal = fused = None
+	try:
+		if patterns:
+			removal = re.compile("|".join(patterns))
+		if maskDigits:
+			fused = re.compile("|".join(patterns + [rf"(?P<{_DIGIT_GROUP}>\d+)"]))
+	except re.error:
+		# Valid on their own but not together: apply every rule separately
+		separate = [re.compile(pattern) for pattern in patterns] + separate
+		removal = None
+		fused = re.compile(rf"(?P<{_DIGIT_GROUP}>\d+)") if maskDigits else None
+	return TextFilter(rules, frozenset(blockedLines), removal, fused, collapseWhitespace, separate), errors
+
+
+def parseRules(text):
+	"""Split multi-line text (one rule per line) into a rule list."""
+	return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+class WordFilter:
+	"""Drops noise words from a result's word boxes and assembles the remaining text."""
+
+	# Distance from the image border (recognized pixels) counting as touching it
+	EDGE_MARGIN = 1
+
+	def __init__(self, minConfidence=0.0, minHeight=0, dropEdgeWords=False):
+		"""
+		Args:
+			minConfidence: Drop words whose "confidence" (0-1) is lower; words
+				without a confidence value are kept
+			minHeight: Drop words whose box is less tall, in screen pixels
+			dropEdgeWords: Drop words touching the border of the recognized image
+		"""
+		self.minConfidence = minConfidence
+		self.minHeight = minHeight
+		self.dropEdgeWords = dropEdgeWords
+
+	@property
+	def isIdentity(self):
+		return not (self.minConfidence > 0 or self.minHeight > 0 or self.dropEdgeWords)
+
+	def apply(self, data, width, height, resizeFactor=1):
+		"""Assemble the text of the words that pass the filter.
+
+		Args:
+			data: Lines of word dicts (text, x, y, width, height and optionally
+				confidence), as in NVDA's LinesWordsResult.data
+			width: Recognized image width in pixels
+			height: Recognized image height in pixels
+			resizeFactor: Recognized pixels per screen pixel
+
+		Returns:
+			tuple: (text, dropped word count); text is None if data has no word
+				boxes, so the caller should use the result's own text
+		"""
+		if not data:
+			return None, 0
+		minHeight = self.minHeight * resizeFactor
+		margin = self.EDGE_MARGIN
+		lines = []
+		dropped = 0
+		try:
+			for line in data:
+				words = []
+				for word in line:
+					confidence = word.get("confidence")
+					if confidence is not None and confidence < self.minConfidence:
+						dropped += 1
+						continue
+					if word["height"] < minHeight:
+						dropped += 1
+						continue
+					if self.dropEdgeWords and (word["x"] <= margin or word["y"] <= margin
+						or word["x"] + word["width"] >= width - margin
+						or word["y"] + word["height"] >= height - margin):
+						dropped += 1
+						continue
+					words.append(word["text"])
+				if words:
+					lines.append(" ".join(words))
+		except (KeyError, TypeError, AttributeError):
+			# Not a word box layout this filter understands
+			return None, 0
+		return "\n".join(lines), dropped
+
+
+def wordFilterFromConfig(cfg):
+	"""WordFilter for a config snapshot, or None if it would keep every word."""
+	try:
+		wordFilter = WordFilter(float(cfg.get("minWordConfidence", 0.0)), int(cfg.get("minWordHeight", 0)),
+			bool(cfg.get("dropEdgeWords", False)))
+	except (ValueError, TypeError):
+		return None
+	return None if wordFilter.isIdentity else wordFilter
+
+
+class StabilityGate:
+	"""Holds announcement candidates until their text stops changing.
+
+	State lives in the caller's per-key state dict (key "pending": fingerprint,
+	first sighting, sightings), so the gate itself is shared by all keys of a
+	profile. Not thread-safe on its own: call it under the state lock.
+	"""
+
+	def __init__(self, frames=0, ms=0):
+		"""
+		Args:
+			frames: Consecutive results a candidate must appear in (0 or 1: no
+				frame requirement)
+			ms: Milliseconds a candidate must stay (0: no time requirement)
+		"""
+		self.frames = frames
+		self.seconds = ms / 1000.0
+
+	@property
+	def isIdentity(self):
+		return self.frames <= 1 and self.seconds <= 0
+
+	@staticmethod
+	def fingerprint(text):
+		return hash(text)
+
+	@staticmethod
+	def isPending(state, fingerprint):
+		"""True if fingerprint is the candidate already held for this key."""
+		pending = state.get("pending")
+		return pending is not None and pending[0] == fingerprint
+
+	def observe(self, state, fingerprint, now=None):
+		"""Account one sighting of a candidate.
+
+		Args:
+			state: Per-key state dict
+			fingerprint: Fingerprint of the candidate's comparison text
+			now: time.monotonic() of the sighting
+
+		Returns:
+			bool: True if the candidate is stable and should be spoken now
+		"""
+		now = time.monotonic() if now is None else now
+		pending = state.get("pending")
+		if pending is None or pending[0] != fingerprint:
+			pending = state["pending"] = [fingerprint, now, 0]
+		pending[2] += 1
+		if (self.frames > 1 and pending[2] >= self.frames) or (self.seconds > 0 and now - pending[1] >= self.seconds):
+			del state["pending"]
+			return True
+		return False
+
+	@staticmethod
+	def forget(state):
+		"""Drop the held candidate (the text went back to what was announced)."""
+		state.pop("pending", None)
+
+
+def stabilityGateFromConfig(cfg):
+	"""StabilityGate for a config snapshot, or None if text is spoken at once."""
+	try:
+		gate = StabilityGate(int(cfg.get("stableFrames", 0)), int(cfg.get("stableMs", 0)))
+	except (ValueError, TypeError):
+		return None
+	return None if gate.isIdentity else gate
@@ -0,0 +1,263 @@
+"""
+LION Evolution Pro - Scan governors
+
+ScanGovernor decides once per scan tick whether the OCR loop should scan
+normally, slow down (user idle) or suspend (workstation locked, screen saver
+running, NVDA sleep mode for the focused app). The conditions come from an
+ActivityConditions object so they can be replaced by fakes headless.
+
+Modes:
+------
+- ACTIVE: scan at the configured intervals.
+- IDLE: no input for idleAfter seconds; scan at most every idleInterval seconds.
+- SUSPENDED: no capture or recognition at all; the loop only polls the
+  conditions (a few cheap system calls) every GOVERNOR_POLL seconds.
+
+CpuBudget stretches scan intervals so recognizer time stays under a share of
+one CPU (see its docstring).
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import collections
+import ctypes
+import threading
+import time
+
+
+ACTIVE = "active"
+IDLE = "idle"
+SUSPENDED = "suspended"
+
+# Seconds between condition checks while idle or suspended: input or unlock is
+# noticed at most this late
+GOVERNOR_POLL = 0.5
+
+# Seconds of recognizer time samples kept for CpuBudget.usage()
+BUDGET_WINDOW = 10.0
+# Weight of the newest sample in a target's average recognition cost
+BUDGET_COST_WEIGHT = 0.3
+
+
+class ActivityConditions:
+	"""Interface of the conditions consulted by ScanGovernor.
+
+	The base class describes a user who is always present; subclasses override
+	what they can detect.
+	"""
+
+	def idleSeconds(self):
+		"""Seconds since the last keyboard or mouse input."""
+		return 0.0
+
+	def isLocked(self):
+		"""True while the workstation is locked or another desktop has the input."""
+		return False
+
+	def isDisplayOff(self):
+		"""True while nothing useful is on screen (screen saver running)."""
+		return False
+
+	def isSleepMode(self):
+		"""True while NVDA sleep mode is on for the focused application."""
+		return False
+
+
+class _LASTINPUTINFO(ctypes.Structure):
+	_fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+
+class WindowsConditions(ActivityConditions):
+	"""Conditions read from Win32: GetLastInputInfo, OpenInputDesktop, screen saver state."""
+
+	DESKTOP_SWITCHDESKTOP = 0x0100
+	SPI_GETSCREENSAVERRUNNING = 0x0072
+
+	def __init__(self, sleepModeGetter=None):
+		"""
+		Args:
+			sleepModeGetter: Callable returning the sleep mode of the focused app
+		"""
+		self._sleepModeGetter = sleepModeGetter
+		self._user32 = ctypes.windll.user32
+		self._kernel32 = ctypes.windll.kernel32
+		self._user32.OpenInputDesktop.restype = ctypes.c_void_p
+		self._user32.CloseDesktop.argtypes = [ctypes.c_void_p]
+		self._lastInput = _LASTINPUTINFO(cbSize=ctypes.sizeof(_LASTINPUTINFO))
+
+	def idleSeconds(self):
+		if not self._user32.GetLastInputInfo(ctypes.byref(self._lastInput)):
+			return 0.0
+		# Both are 32-bit millisecond tick counts; the difference survives wrap-around
+		return ((self._kernel32.GetTickCount() - self._lastInput.dwTime) & 0xFFFFFFFF) / 1000.0
+
+	def isLocked(self):
+		# The secure desktop shown while locked cannot be opened by user processes
+		desktop = self._user32.OpenInputDesktop(0, False, self.DESKTOP_SWITCHDESKTOP)
+		if not desktop:
+			return True
+		self._user32.CloseDesktop(desktop)
+		return False
+
+	def isDisplayOff(self):
+		running = ctypes.c_int(0)
+		self._user32.SystemParametersInfoW(self.SPI_GETSCREENSAVERRUNNING, 0, ctypes.byref(running), 0)
+		return bool(running.value)
+
+	def isSleepMode(self):
+		return bool(self._sleepModeGetter and self._sleepModeGetter())
+
+
+class ScanGovernor:
+	"""Maps the current ActivityConditions to a scan mode."""
+
+	def __init__(self, conditions=None):
+		self.conditions = conditions or ActivityConditions()
+		self.mode = ACTIVE
+		self.reason = None  # Why the mode is not ACTIVE ("locked", "idle"...)
+		self.since = time.monotonic()
+		self.errors = 0  # Failed condition checks (treated as ACTIVE)
+		self._lock = threading.Lock()
+
+	def evaluate(self, idleAfter=0):
+		"""Check the conditions and update the mode.
+
+		A failing check never stops scanning: it counts as ACTIVE.
+
+		Args:
+			idleAfter: Seconds without input before slowing down (0 disables)
+
+		Returns:
+			tuple: (mode, changed) where changed tells if the mode just switched
+		"""
+		conditions = self.conditions
+		mode, reason = ACTIVE, None
+		try:
+			if conditions.isLocked():
+				mode, reason = SUSPENDED, "locked"
+			elif conditions.isDisplayOff():
+				mode, reason = SUSPENDED, "displayOff"
+			elif conditions.isSleepMode():
+				mode, reason = SUSPENDED, "sleepMode"
+			elif idleAfter and conditions.idleSeconds() >= idleAfter:
+				mode, reason = IDLE, "idle"
+		except Exception:
+			self.errors += 1
+			mode, reason = ACTIVE, None
+		with self._lock:
+			changed = mode != self.mode
+			if changed:
+				self.since = time.monotonic()
+			self.mode, self.reason = mode, reason
+		return mode, changed
+
+	def interval(self, interval, idleInterval):
+		"""Effective scan interval of a target in the current mode."""
+		if self.mode == IDLE:
+			return max(interval, idleInterval)
+		return interval
+
+	def state(self):
+		"""Current mode, the reason for it and seconds spent in it.
+
+		Returns:
+			tuple: (mode, reason, seconds); reason is None while ACTIVE
+		"""
+		with self._lock:
+			return self.mode, self.reason, time.monotonic() - self.since
+
+	def describe(self):
+		"""Short description of the current mode, untranslated (for the log)."""
+		with self._lock:
+			if self.mode == ACTIVE:
+				return "scanning"
+			return f"{self.mode} ({self.reason}) for {time.monotonic() - self.since:.0f} s"
+
+
+class CpuBudget:
+	"""Recognizer time accounting against a percentage of one CPU.
+
+	Every completed recognition adds its duration (submit to callback) to the
+	targets it served. interval() keeps each target's average cost within its
+	share of the budget by stretching its scan interval to
+	max(interval, cost * share / budget); the configured interval is a floor,
+	never shortened. usage() reports recognizer seconds per wall-clock second
+	over the last BUDGET_WINDOW seconds.
+	"""
+
+	def __init__(self, window=BUDGET_WINDOW):
+		self.window = window
+		self.throttling = False
+		self.throttledScans = 0
+		self._lock = threading.Lock()
+		self._samples = collections.deque()  # (end time, seconds)
+		self._total = 0.0
+		self._cost = {}  # target index -> average seconds per recognition
+
+	def add(self, targetIndexes, seconds):
+		"""Account one recognition.
+
+		Args:
+			targetIndexes: Targets that shared the recognized frame
+			seconds: Recognizer time
+		"""
+		now = time.monotonic()
+		with self._lock:
+			self._samples.append((now, seconds))
+			self._total += seconds
+			self._prune(now)
+			for index in targetIndexes:
+				cost = self._cost.get(index)
+				self._cost[index] = seconds if cost is None else (
+					cost + BUDGET_COST_WEIGHT * (seconds - cost))
+
+	def _prune(self, now):
+		while self._samples and now - self._samples[0][0] > self.window:
+			self._total -= self._samples.popleft()[1]
+
+	def usage(self):
+		"""Recognizer seconds per wall-clock second (1.0 = one full CPU)."""
+		with self._lock:
+			self._prune(time.monotonic())
+			return max(0.0, self._total) / self.window
+
+	def interval(self, targetIndex, interval, budgetPercent, share=1):
+		"""Scan interval of a target under the budget.
+
+		Args:
+			targetIndex: Target index
+			interval: Configured interval in seconds
+			budgetPercent: Allowed recognizer time in percent of one CPU (0: unlimited)
+			share: Number of targets splitting the budget
+
+		Returns:
+			float: Interval in seconds, never below `interval`
+		"""
+		if not budgetPercent or budgetPercent <= 0:
+			return interval
+		with self._lock:
+			cost = self._cost.get(targetIndex)
+		if cost is None:
+			return interval
+		return max(interval, cost * max(1, share) * 100.0 / budgetPercent)
+
+	def setThrottling(self, throttling):
+		"""Record whether the last scheduled scans were stretched.
+
+		Returns:
+			bool: True if the throttling state changed
+		"""
+		if throttling:
+			self.throttledScans += 1
+		changed = throttling != self.throttling
+		self.throttling = throttling
+		return changed
+
+	def describe(self, budgetPercent):
+		"""Short description of usage against the budget, untranslated (for the log)."""
+		text = f"recognizer {self.usage() * 100:.0f}% of one CPU"
+		if budgetPercent:
+			text += f", budget {budgetPercent}%"
+			if self.throttling:
+				text += ", throttling"
+		return text
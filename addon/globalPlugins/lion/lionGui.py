@@ -1,14 +1,49 @@
+import collections
+import time
 import wx
 import addonHandler
 import gui
 import config
 import ui
 import api
-import os
 import logHandler
+from . import lionBackends
+from . import lionFilters
+from . import lionPerf
 
 addonHandler.initTranslation()
 
+# Performance tab refresh period (milliseconds) and number of refreshes rates are averaged over
+PERF_REFRESH_MS = 1000
+PERF_RATE_SAMPLES = 5
+
+class ProfileListCtrl(wx.ListCtrl):
+	"""Virtual profile list drawn from the backend's cached profile summary.
+	
+	Rows are (name, hasOverrides, isActive) tuples (see GlobalPlugin.getProfileSummary);
+	only the rows on screen are ever asked for.
+	"""
+	
+	def __init__(self, parent):
+		wx.ListCtrl.__init__(self, parent, style=wx.LC_REPORT | wx.LC_SINGLE_SEL | wx.LC_VIRTUAL)
+		self.rows = []
+	
+	def setRows(self, rows):
+		self.rows = list(rows)
+		self.SetItemCount(len(self.rows))
+		self.Refresh()
+	
+	def OnGetItemText(self, item, column):
+		name, hasOverrides, isActive = self.rows[item]
+		if column == 0:
+			return name
+		if isActive:
+			return _("Active Profile")
+		if name != "global" and not hasOverrides:
+			# Profile exists but has no overrides (empty {})
+			return _("Same as global")
+		return ""
+
 class frmMain(wx.Frame):
 	def __init__(self, parent, backend):
 		wx.Frame.__init__(self, parent, id=wx.ID_ANY, title=_("LION Settings"), 
@@ -47,6 +82,11 @@ class frmMain(wx.Frame):
 		self.notebook.AddPage(self.settingsTab, _("Settings"))
 		self._createSettingsTab(self.settingsTab, effectiveConfig)
 
+		# Tab 3: Performance (live counters of the active profile)
+		self.performanceTab = wx.Panel(self.notebook)
+		self.notebook.AddPage(self.performanceTab, _("Performance"))
+		self._createPerformanceTab(self.performanceTab)
+
 		# Close button (no OK/Cancel - settings saved explicitly)
 		actionSizer = wx.BoxSizer(wx.HORIZONTAL)
 		self.btnClose = wx.Button(panel, wx.ID_CLOSE, _("Close"))
@@ -65,7 +105,7 @@ class frmMain(wx.Frame):
 		listBox = wx.StaticBox(parent, label=_("Available Profiles"))
 		listSizer = wx.StaticBoxSizer(listBox, wx.VERTICAL)
 		
-		self.lstProfiles = wx.ListCtrl(listBox, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+		self.lstProfiles = ProfileListCtrl(listBox)
 		self.lstProfiles.AppendColumn(_("Profile"), width=200)
 		self.lstProfiles.AppendColumn(_("Status"), width=150)
 		
@@ -80,16 +120,20 @@ class frmMain(wx.Frame):
 		self.btnCreateProfile = wx.Button(parent, label=_("Create Profile"))
 		self.btnDeleteProfile = wx.Button(parent, label=_("Delete Profile"))
 		self.btnSetActive = wx.Button(parent, label=_("Set Active Profile"))
+		# Translators: button that reads the profile files again, e.g. after editing them by hand
+		self.btnRescanProfiles = wx.Button(parent, label=_("Rescan Profiles"))
 		
 		btnSizer.Add(self.btnCreateProfile, 0, wx.ALL, 5)
 		btnSizer.Add(self.btnDeleteProfile, 0, wx.ALL, 5)
 		btnSizer.Add(self.btnSetActive, 0, wx.ALL, 5)
+		btnSizer.Add(self.btnRescanProfiles, 0, wx.ALL, 5)
 		tabSizer.Add(btnSizer, 0, wx.ALL | wx.CENTER, 5)
 
 		# Bindings
 		self.btnCreateProfile.Bind(wx.EVT_BUTTON, self.onCreateProfile)
 		self.btnDeleteProfile.Bind(wx.EVT_BUTTON, self.onDeleteProfile)
 		self.btnSetActive.Bind(wx.EVT_BUTTON, self.onSetActive)
+		self.btnRescanProfiles.Bind(wx.EVT_BUTTON, self.onRescanProfiles)
 
 	def _createSettingsTab(self, parent, effectiveConfig):
 		"""Create Settings tab with controls for active profile"""
@@ -121,6 +165,16 @@ class frmMain(wx.Frame):
 		])
 		self.choiceTarget.SetSelection(int(effectiveConfig.get("target", config.conf["lion"]["target"])))
 		targetSizer.Add(self.choiceTarget, 0, wx.ALL | wx.EXPAND, 5)
+		# Targets scanned concurrently (none checked: only the OCR target above)
+		targetSizer.Add(wx.StaticText(targetBox, label=_("Scan several targets at once")), 0, wx.ALL, 5)
+		self.chkTargets = wx.CheckListBox(targetBox, choices=[
+			_("Navigator object"),
+			_("Whole Screen"),
+			_("Current window"),
+			_("Current control")
+		])
+		self.chkTargets.SetCheckedItems(list(effectiveConfig.get("targets", config.conf["lion"]["targets"])))
+		targetSizer.Add(self.chkTargets, 0, wx.ALL | wx.EXPAND, 5)
 		tabSizer.Add(targetSizer, 0, wx.ALL | wx.EXPAND, 5)
 
 		# Threshold
@@ -137,6 +191,67 @@ class frmMain(wx.Frame):
 		thresholdSizer.Add(thresholdGrid, 0, wx.EXPAND | wx.ALL, 5)
 		tabSizer.Add(thresholdSizer, 0, wx.ALL | wx.EXPAND, 5)
 
+		# Text filters applied before comparing and speaking
+		filtersBox = wx.StaticBox(parent, label=_("Text filters (one rule per line)"))
+		filtersSizer = wx.StaticBoxSizer(filtersBox, wx.VERTICAL)
+		self.txtFilters = wx.TextCtrl(filtersBox, style=wx.TE_MULTILINE, size=(-1, 60),
+			value="\n".join(effectiveConfig.get("filters", config.conf["lion"]["filters"])))
+		filtersSizer.Add(self.txtFilters, 1, wx.ALL | wx.EXPAND, 5)
+		tabSizer.Add(filtersSizer, 0, wx.ALL | wx.EXPAND, 5)
+
+		# Word filtering: noise words dropped before the text is assembled
+		wordsBox = wx.StaticBox(parent, label=_("Word filtering"))
+		wordsSizer = wx.StaticBoxSizer(wordsBox, wx.VERTICAL)
+		wordsGrid = wx.FlexGridSizer(cols=2, hgap=5, vgap=5)
+		wordsGrid.AddGrowableCol(1, 1)
+		wordsGrid.Add(wx.StaticText(wordsBox, label=_("Minimum word confidence (0-1)")), 
+			0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+		self.spinWordConfidence = wx.SpinCtrlDouble(wordsBox, min=0.0, max=1.0, inc=0.05, 
+			initial=float(effectiveConfig.get("minWordConfidence", config.conf["lion"]["minWordConfidence"])))
+		self.spinWordConfidence.SetDigits(2)
+		wordsGrid.Add(self.spinWordConfidence, 1, wx.ALL | wx.EXPAND, 5)
+		wordsSizer.Add(wordsGrid, 0, wx.EXPAND | wx.ALL, 5)
+		self.spinWordHeight = self._addSpin(wordsSizer, wordsBox, _("Minimum word height (pixels)"), 
+			int(effectiveConfig.get("minWordHeight", config.conf["lion"]["minWordHeight"])))
+		self.chkDropEdgeWords = wx.CheckBox(wordsBox, label=_("Ignore words cut by the edge of the target"))
+		self.chkDropEdgeWords.SetValue(bool(effectiveConfig.get("dropEdgeWords", config.conf["lion"]["dropEdgeWords"])))
+		wordsSizer.Add(self.chkDropEdgeWords, 0, wx.ALL, 5)
+		tabSizer.Add(wordsSizer, 0, wx.ALL | wx.EXPAND, 5)
+
+		# Stability: changed text is held until it stops changing (0 = speak at once)
+		stableBox = wx.StaticBox(parent, label=_("Stability"))
+		stableSizer = wx.StaticBoxSizer(stableBox, wx.VERTICAL)
+		self.spinStableFrames = self._addSpin(stableSizer, stableBox, _("Speak after unchanged scans"), 
+			int(effectiveConfig.get("stableFrames", config.conf["lion"]["stableFrames"])))
+		stableRow = wx.BoxSizer(wx.HORIZONTAL)
+		stableRow.Add(wx.StaticText(stableBox, label=_("or after unchanged milliseconds")), 
+			0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+		self.spinStableMs = wx.SpinCtrl(stableBox, min=0, max=10000, 
+			initial=int(effectiveConfig.get("stableMs", config.conf["lion"]["stableMs"])))
+		stableRow.Add(self.spinStableMs, 0, wx.ALL, 5)
+		stableSizer.Add(stableRow, 0, wx.EXPAND)
+		tabSizer.Add(stableSizer, 0, wx.ALL | wx.EXPAND, 5)
+
+		# Recognizer engine and language
+		recognizerBox = wx.StaticBox(parent, label=_("Recognizer"))
+		recognizerSizer = wx.StaticBoxSizer(recognizerBox, wx.VERTICAL)
+		recognizerGrid = wx.FlexGridSizer(cols=2, hgap=5, vgap=5)
+		recognizerGrid.AddGrowableCol(1, 1)
+		recognizerGrid.Add(wx.StaticText(recognizerBox, label=_("Engine")), 
+			0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+		self.choiceRecognizer = wx.Choice(recognizerBox)
+		recognizerGrid.Add(self.choiceRecognizer, 1, wx.ALL | wx.EXPAND, 5)
+		recognizerGrid.Add(wx.StaticText(recognizerBox, label=_("Language")), 
+			0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+		self.choiceLanguage = wx.Choice(recognizerBox)
+		recognizerGrid.Add(self.choiceLanguage, 1, wx.ALL | wx.EXPAND, 5)
+		recognizerSizer.Add(recognizerGrid, 0, wx.EXPAND | wx.ALL, 5)
+		self.chkMosaic = wx.CheckBox(recognizerBox, label=_("Recognize small targets together in one image"))
+		self.chkMosaic.SetValue(bool(effectiveConfig.get("mosaic", config.conf["lion"]["mosaic"])))
+		recognizerSizer.Add(self.chkMosaic, 0, wx.ALL, 5)
+		tabSizer.Add(recognizerSizer, 0, wx.ALL | wx.EXPAND, 5)
+		self._setRecognizerControls(effectiveConfig)
+
 		# Crop settings
 		cropBox = wx.StaticBox(parent, label=_("Crop Settings (%)"))
 		cropSizer = wx.StaticBoxSizer(cropBox, wx.VERTICAL)
@@ -150,6 +265,10 @@ class frmMain(wx.Frame):
 			int(effectiveConfig.get("cropDown", 0)))
 		tabSizer.Add(cropSizer, 0, wx.ALL | wx.EXPAND, 5)
 
+		# Hot-apply: edited values drive the running scan loop before they are saved
+		self.chkLiveApply = wx.CheckBox(parent, label=_("Apply changes immediately (without saving)"))
+		tabSizer.Add(self.chkLiveApply, 0, wx.ALL, 5)
+
 		# Action buttons for Settings tab
 		settingsBtnSizer = wx.BoxSizer(wx.HORIZONTAL)
 		self.btnSave = wx.Button(parent, label=_("Save"))
@@ -165,46 +284,144 @@ class frmMain(wx.Frame):
 		# Bind control change events to set dirty flag
 		self.spinInterval.Bind(wx.EVT_SPINCTRLDOUBLE, self.onControlChanged)
 		self.choiceTarget.Bind(wx.EVT_CHOICE, self.onControlChanged)
+		self.chkTargets.Bind(wx.EVT_CHECKLISTBOX, self.onControlChanged)
 		self.spinThreshold.Bind(wx.EVT_SPINCTRLDOUBLE, self.onControlChanged)
+		self.choiceRecognizer.Bind(wx.EVT_CHOICE, self.onRecognizerChanged)
+		self.choiceLanguage.Bind(wx.EVT_CHOICE, self.onControlChanged)
+		self.chkMosaic.Bind(wx.EVT_CHECKBOX, self.onControlChanged)
+		self.txtFilters.Bind(wx.EVT_TEXT, self.onControlChanged)
+		self.spinWordConfidence.Bind(wx.EVT_SPINCTRLDOUBLE, self.onControlChanged)
+		self.spinWordHeight.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
+		self.chkDropEdgeWords.Bind(wx.EVT_CHECKBOX, self.onControlChanged)
+		self.spinStableFrames.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
+		self.spinStableMs.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
 		self.spinCropLeft.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
 		self.spinCropRight.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
 		self.spinCropUp.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
 		self.spinCropDown.Bind(wx.EVT_SPINCTRL, self.onControlChanged)
+		self.chkLiveApply.Bind(wx.EVT_CHECKBOX, self.onLiveApplyChanged)
+
+	def _createPerformanceTab(self, parent):
+		"""Create Performance tab: live scan statistics refreshed by a timer"""
+		tabSizer = wx.BoxSizer(wx.VERTICAL)
+		parent.SetSizer(tabSizer)
+
+		self.chkPerfStats = wx.CheckBox(parent, label=_("Collect performance statistics"))
+		self.chkPerfStats.SetValue(self.backend.getLiveStats()["perfEnabled"])
+		tabSizer.Add(self.chkPerfStats, 0, wx.ALL, 5)
+
+		statsBox = wx.StaticBox(parent, label=_("Active profile"))
+		statsSizer = wx.StaticBoxSizer(statsBox, wx.VERTICAL)
+		self.lstPerformance = wx.ListCtrl(statsBox, style=wx.LC_REPORT | wx.LC_SINGLE_SEL)
+		self.lstPerformance.AppendColumn(_("Measure"), width=220)
+		self.lstPerformance.AppendColumn(_("Value"), width=300)
+		self._perfRows = [
+			("profile", _("Profile")),
+			("state", _("OCR")),
+			("scanRate", _("Scans per second")),
+			("recognitionRate", _("Recognitions per second")),
+			("recognize", _("Recognize time")),
+			("endToEnd", _("Capture to speech")),
+			("skips", _("Skipped, recognizer busy")),
+			("unchanged", _("Results not spoken (unchanged)")),
+			("geometry", _("Target location cache hits")),
+			("backlog", _("Speech backlog")),
+			("cpu", _("Recognizer CPU")),
+			("settings", _("Settings in use")),
+		]
+		for key, label in self._perfRows:
+			index = self.lstPerformance.InsertItem(self.lstPerformance.GetItemCount(), label)
+			self.lstPerformance.SetItem(index, 1, "")
+		statsSizer.Add(self.lstPerformance, 1, wx.ALL | wx.EXPAND, 5)
+		tabSizer.Add(statsSizer, 1, wx.ALL | wx.EXPAND, 5)
+
+		# Snapshots of the last refreshes: rates are computed over this window
+		self._perfSamples = collections.deque(maxlen=PERF_RATE_SAMPLES)
+		self._perfProfile = None
+		self.perfTimer = wx.Timer(self)
+		self.Bind(wx.EVT_TIMER, self.onPerfTimer, self.perfTimer)
+		self.perfTimer.Start(PERF_REFRESH_MS)
+		self.chkPerfStats.Bind(wx.EVT_CHECKBOX, self.onPerfStatsChanged)
+
+	def onPerfStatsChanged(self, event):
+		"""Turn statistics collection on or off from the Performance tab"""
+		try:
+			self.backend.setPerfStats(self.chkPerfStats.GetValue())
+			self._perfSamples.clear()
+			self._refreshPerformance()
+		except Exception:
+			logHandler.log.exception("LionEvolutionPro: Error toggling performance statistics")
+
+	def onPerfTimer(self, event):
+		"""Refresh the Performance tab while it is shown"""
+		if self.notebook.GetCurrentPage() is self.performanceTab:
+			self._refreshPerformance()
+
+	def _refreshPerformance(self):
+		"""Show the backend's live counters, with rates over the last few refreshes"""
+		try:
+			stats = self.backend.getLiveStats()
+			if stats["profile"] != self._perfProfile:
+				# Counters are per profile: start over after a profile switch
+				self._perfProfile = stats["profile"]
+				self._perfSamples.clear()
+			snapshot = stats["snapshot"]
+			previous = self._perfSamples[0] if self._perfSamples else None
+			self._perfSamples.append(snapshot)
+			values = {
+				"profile": stats["profile"],
+				"state": (_("on, {governor}").format(governor=stats["governor"]) if stats["running"]
+					else _("off")),
+				"backlog": str(stats["speechBacklog"]),
+				"cpu": stats["cpu"],
+				"settings": _("unsaved changes applied") if stats["live"] else _("saved profile"),
+			}
+			lookups = stats["geometryHits"] + stats["geometryMisses"]
+			values["geometry"] = (f"{stats['geometryHits'] * 100.0 / lookups:.0f}% ({lookups})"
+				if lookups else "-")
+			if not stats["perfEnabled"]:
+				disabled = _("statistics off")
+				for key in ("scanRate", "recognitionRate", "recognize", "endToEnd", "skips", "unchanged"):
+					values[key] = disabled
+			else:
+				rates = lionPerf.liveRates(previous, snapshot)
+				recognize = snapshot["stages"].get("recognize")
+				endToEnd = snapshot["latencies"].get("endToEnd")
+				values["scanRate"] = f"{rates['scansPerSec']:.1f}"
+				values["recognitionRate"] = f"{rates['recognitionsPerSec']:.1f}"
+				values["recognize"] = (_("{mean:.0f} ms now, p95 {p95:.0f} ms").format(
+					mean=rates["recognizeMs"], p95=recognize["p95Ms"]) if recognize else "-")
+				values["endToEnd"] = (_("p50 {p50:.0f} ms, p95 {p95:.0f} ms").format(
+					p50=endToEnd["p50Ms"], p95=endToEnd["p95Ms"]) if endToEnd else "-")
+				values["skips"] = f"{rates['skipRatio'] * 100:.0f}%"
+				values["unchanged"] = f"{rates['unchangedRatio'] * 100:.0f}%"
+			for index, (key, label) in enumerate(self._perfRows):
+				value = values.get(key, "")
+				# Only touch changed cells so screen readers are not flooded
+				if self.lstPerformance.GetItemText(index, 1) != value:
+					self.lstPerformance.SetItem(index, 1, value)
+		except Exception:
+			logHandler.log.exception("LionEvolutionPro: Error refreshing performance statistics")
 
 	def _refreshProfileList(self):
 		"""Refresh the list of available profiles (ListCtrl with global first)"""
 		try:
-			self.lstProfiles.DeleteAllItems()
-			
-			# Always add "global" as first row
-			index = self.lstProfiles.InsertItem(0, "global")
-			if self.backend.currentAppProfile == "global":
-				self.lstProfiles.SetItem(index, 1, _("Active Profile"))
-			else:
-				self.lstProfiles.SetItem(index, 1, "")
-			
-			# Use the PROFILES_DIR from the backend module
-			from . import PROFILES_DIR
-			if os.path.exists(PROFILES_DIR):
-				profileNames = []
-				for filename in sorted(os.listdir(PROFILES_DIR)):
-					if filename.endswith('.json'):
-						profileName = filename[:-5]  # Remove .json extension
-						profileNames.append(profileName)
-				
-				# Add profiles to list
-				for profileName in profileNames:
-					index = self.lstProfiles.InsertItem(self.lstProfiles.GetItemCount(), profileName)
-					if self.backend.currentAppProfile == profileName:
-						self.lstProfiles.SetItem(index, 1, _("Active Profile"))
-					elif not self.backend.profileHasOverrides(profileName):
-						# Profile exists but has no overrides (empty {})
-						self.lstProfiles.SetItem(index, 1, _("Same as global"))
-					else:
-						self.lstProfiles.SetItem(index, 1, "")
+			# In-memory summary, no file I/O; refreshed again once a pending scan completes
+			self.lstProfiles.setRows(self.backend.getProfileSummary(onReady=self._refreshProfileListLater))
 		except Exception:
 			logHandler.log.exception("LionEvolutionPro: Error refreshing profile list")
 
+	def _refreshProfileListLater(self):
+		"""Refresh the profile list from a background thread (profile scan callback)."""
+		wx.CallAfter(self._refreshProfileList)
+
+	def onRescanProfiles(self, event):
+		"""Read the profile files again, e.g. after editing them by hand"""
+		try:
+			self.backend.rescanProfiles(self._refreshProfileListLater)
+		except Exception:
+			logHandler.log.exception("LionEvolutionPro: Error rescanning profiles")
+
 	def _addSpin(self, sizer, parent, label, value):
 		"""Helper to add a spin control with label"""
 		row = wx.BoxSizer(wx.HORIZONTAL)
@@ -214,21 +431,81 @@ class frmMain(wx.Frame):
 		sizer.Add(row, 0, wx.EXPAND)
 		return spin
 
+	def _setRecognizerControls(self, effectiveConfig):
+		"""Fill the engine and language choices and select the profile's values"""
+		backendName = effectiveConfig.get("backend", config.conf["lion"]["backend"])
+		self._recognizerNames = [backend.name for backend in lionBackends.availableBackends()]
+		if backendName not in self._recognizerNames:
+			# Keep a configured engine selectable even if it is unavailable here
+			self._recognizerNames.append(backendName)
+		labels = []
+		for name in self._recognizerNames:
+			backend = lionBackends.getBackend(name)
+			labels.append(backend.label if backend else name)
+		self.choiceRecognizer.Set(labels)
+		self.choiceRecognizer.SetSelection(self._recognizerNames.index(backendName))
+		self._setLanguageChoices(backendName, effectiveConfig.get("language", config.conf["lion"]["language"]))
+
+	def _setLanguageChoices(self, backendName, language):
+		"""Fill the language choice for an engine; "" is the engine default"""
+		backend = lionBackends.getBackend(backendName)
+		self._languageCodes = [""] + (backend.languages() if backend else [])
+		if language not in self._languageCodes:
+			self._languageCodes.append(language)
+		self.choiceLanguage.Set([_("Default")] + self._languageCodes[1:])
+		self.choiceLanguage.SetSelection(self._languageCodes.index(language))
+
+	def onRecognizerChanged(self, event):
+		"""Engine changed: offer its languages, starting with its default"""
+		self._setLanguageChoices(self._recognizerNames[self.choiceRecognizer.GetSelection()], "")
+		self.onControlChanged(event)
+
 	def onControlChanged(self, event):
 		"""Called when any control value changes - set dirty flag if not suppressed"""
 		if not self._suppressControlEvents:
 			self._dirty = True
+			if self.chkLiveApply.GetValue():
+				self._applyLive()
 		event.Skip()
 
+	def onLiveApplyChanged(self, event):
+		"""Hot-apply turned on: apply the edited values; off: back to the saved profile"""
+		if self.chkLiveApply.GetValue():
+			self._applyLive()
+		else:
+			self.backend.setLiveOverrides(self.backend.currentAppProfile, None)
+
+	def _applyLive(self):
+		"""Apply the edited values to the running scan loop without saving them"""
+		try:
+			values = self._collectSettings(announce=False)
+			if values is not None:
+				self.backend.setLiveOverrides(self.backend.currentAppProfile, values)
+		except Exception:
+			logHandler.log.exception("LionEvolutionPro: Error applying settings live")
+
 	def _refreshSettingsControls(self):
 		"""Refresh Settings tab controls with active profile config"""
 		try:
 			self._suppressControlEvents = True
+			# Controls show the saved profile again: drop values applied live
+			self.backend.setLiveOverrides(self.backend.currentAppProfile, None)
 			effectiveConfig = self.backend.getEffectiveConfig(self.backend.currentAppProfile)
 			
 			self.spinInterval.SetValue(float(effectiveConfig.get("interval", config.conf["lion"]["interval"])))
 			self.choiceTarget.SetSelection(int(effectiveConfig.get("target", config.conf["lion"]["target"])))
+			self.chkTargets.SetCheckedItems(list(effectiveConfig.get("targets", config.conf["lion"]["targets"])))
 			self.spinThreshold.SetValue(float(effectiveConfig.get("threshold", config.conf["lion"]["threshold"])))
+			self._setRecognizerControls(effectiveConfig)
+			self.chkMosaic.SetValue(bool(effectiveConfig.get("mosaic", config.conf["lion"]["mosaic"])))
+			self.txtFilters.SetValue("\n".join(effectiveConfig.get("filters", config.conf["lion"]["filters"])))
+			self.spinWordConfidence.SetValue(float(effectiveConfig.get("minWordConfidence",
+				config.conf["lion"]["minWordConfidence"])))
+			self.spinWordHeight.SetValue(int(effectiveConfig.get("minWordHeight", config.conf["lion"]["minWordHeight"])))
+			self.chkDropEdgeWords.SetValue(bool(effectiveConfig.get("dropEdgeWords",
+				config.conf["lion"]["dropEdgeWords"])))
+			self.spinStableFrames.SetValue(int(effectiveConfig.get("stableFrames", config.conf["lion"]["stableFrames"])))
+			self.spinStableMs.SetValue(int(effectiveConfig.get("stableMs", config.conf["lion"]["stableMs"])))
 			self.spinCropLeft.SetValue(int(effectiveConfig.get("cropLeft", config.conf["lion"]["cropLeft"])))
 			self.spinCropRight.SetValue(int(effectiveConfig.get("cropRight", config.conf["lion"]["cropRight"])))
 			self.spinCropUp.SetValue(int(effectiveConfig.get("cropUp", config.conf["lion"]["cropUp"])))
@@ -271,7 +548,7 @@ class frmMain(wx.Frame):
 				ui.message(_("No profile selected"))
 				return
 			
-			profileName = self.lstProfiles.GetItemText(selection, 0)
+			profileName = self.lstProfiles.rows[selection][0]
 			
 			# Can't delete global
 			if profileName == "global":
@@ -302,7 +579,7 @@ class frmMain(wx.Frame):
 				ui.message(_("No profile selected"))
 				return
 			
-			profileName = self.lstProfiles.GetItemText(selection, 0)
+			profileName = self.lstProfiles.rows[selection][0]
 			
 			# Check if dirty
 			if self._dirty:
@@ -348,6 +625,66 @@ class frmMain(wx.Frame):
 		else:
 			ui.message(_("Error saving settings"))
 
+	def _collectSettings(self, announce=True):
+		"""Read and validate the Settings tab controls.
+		
+		Args:
+			announce: Speak validation errors (off while applying live edits)
+		
+		Returns:
+			dict or None: Values by config key, None if validation failed
+		"""
+		currentValues = {
+			"cropLeft": int(self.spinCropLeft.GetValue()),
+			"cropRight": int(self.spinCropRight.GetValue()),
+			"cropUp": int(self.spinCropUp.GetValue()),
+			"cropDown": int(self.spinCropDown.GetValue()),
+			"target": self.choiceTarget.GetSelection(),
+			"targets": sorted(self.chkTargets.GetCheckedItems()),
+			"threshold": self.spinThreshold.GetValue(),
+			"interval": self.spinInterval.GetValue(),
+			"backend": self._recognizerNames[self.choiceRecognizer.GetSelection()],
+			"language": self._languageCodes[self.choiceLanguage.GetSelection()],
+			"mosaic": self.chkMosaic.GetValue(),
+			"filters": lionFilters.parseRules(self.txtFilters.GetValue()),
+			"minWordConfidence": self.spinWordConfidence.GetValue(),
+			"minWordHeight": int(self.spinWordHeight.GetValue()),
+			"dropEdgeWords": self.chkDropEdgeWords.GetValue(),
+			"stableFrames": int(self.spinStableFrames.GetValue()),
+			"stableMs": int(self.spinStableMs.GetValue())
+		}
+		
+		# Validate text filter rules
+		_textFilter, errors = lionFilters.compileFilters(currentValues["filters"])
+		if errors:
+			self._validationError(announce, _("Error in text filters: {error}").format(error=errors[0]),
+				f"LionEvolutionPro: Invalid text filters: {errors}")
+			return None
+		
+		# Validate horizontal crop total
+		if (currentValues["cropLeft"] + currentValues["cropRight"]) >= 100:
+			self._validationError(announce, _("Error: Total horizontal crop (Left + Right) cannot be 100% or more"),
+				f"LionEvolutionPro: Invalid horizontal crop: "
+				f"{currentValues['cropLeft']}+{currentValues['cropRight']}")
+			return None
+		
+		# Validate vertical crop total
+		if (currentValues["cropUp"] + currentValues["cropDown"]) >= 100:
+			self._validationError(announce, _("Error: Total vertical crop (Up + Down) cannot be 100% or more"),
+				f"LionEvolutionPro: Invalid vertical crop: "
+				f"{currentValues['cropUp']}+{currentValues['cropDown']}")
+			return None
+		
+		return currentValues
+
+	def _validationError(self, announce, message, detail):
+		"""Report invalid settings: spoken and logged as a warning, or only debug-logged"""
+		if announce:
+			ui.message(message)
+			logHandler.log.warning(detail)
+		else:
+			logHandler.log.debug(detail)
+
 	def _saveSettings(self):
 		"""Internal method to save settings with validation.
 		
@@ -356,29 +693,8 @@ class frmMain(wx.Frame):
 		"""
 		try:
 			appName = self.backend.currentAppProfile
-			
-			currentValues = {
-				"cropLeft": int(self.spinCropLeft.GetValue()),
-				"cropRight": int(self.spinCropRight.GetValue()),
-				"cropUp": int(self.spinCropUp.GetValue()),
-				"cropDown": int(self.spinCropDown.GetValue()),
-				"target": self.choiceTarget.GetSelection(),
-				"threshold": self.spinThreshold.GetValue(),
-				"interval": self.spinInterval.GetValue()
-			}
-			
-			# Validate horizontal crop total
-			if (currentValues["cropLeft"] + currentValues["cropRight"]) >= 100:
-				ui.message(_("Error: Total horizontal crop (Left + Right) cannot be 100% or more"))
-				logHandler.log.warning(f"LionEvolutionPro: Invalid horizontal crop: "
-					f"{currentValues['cropLeft']}+{currentValues['cropRight']}")
-				return False
-			
-			# Validate vertical crop total
-			if (currentValues["cropUp"] + currentValues["cropDown"]) >= 100:
-				ui.message(_("Error: Total vertical crop (Up + Down) cannot be 100% or more"))
-				logHandler.log.warning(f"LionEvolutionPro: Invalid vertical crop: "
-					f"{currentValues['cropUp']}+{currentValues['cropDown']}")
+			currentValues = self._collectSettings()
+			if currentValues is None:
 				return False
 			
 			if appName == "global":
@@ -387,8 +703,10 @@ class frmMain(wx.Frame):
 					config.conf["lion"][key] = value
 				logHandler.log.info("LionEvolutionPro: Saved global settings to config.conf")
 			else:
-				# Compute overrides (only values different from global)
-				overrides = {}
+				# Compute overrides (only values different from global), keeping
+				# overrides of keys that have no control in this dialog
+				overrides = {key: value for key, value in self.backend.currentProfileData.items()
+					if key not in currentValues}
 				for key, value in currentValues.items():
 					if value != config.conf["lion"][key]:
 						overrides[key] = value
@@ -397,6 +715,8 @@ class frmMain(wx.Frame):
 				self.backend.saveProfileForApp(appName, overrides)
 				logHandler.log.info(f"LionEvolutionPro: Saved profile for {appName} with overrides")
 			
+			# Saved values are now the profile's own
+			self.backend.setLiveOverrides(appName, None)
 			return True
 		except Exception:
 			logHandler.log.exception("LionEvolutionPro: Error saving settings")
@@ -469,11 +789,97 @@ class frmMain(wx.Frame):
 						event.Veto()
 					return
 			
-			# Close the dialog
+			# Close the dialog; unsaved values applied live are discarded
+			self.perfTimer.Stop()
+			self.backend.setLiveOverrides(self.backend.currentAppProfile, None)
 			self.backend.settingsDialog = None
 			self.Destroy()
 		except Exception:
 			logHandler.log.exception("LionEvolutionPro: Error closing dialog")
 			# Always clean up
+			self.perfTimer.Stop()
+			self.backend.setLiveOverrides(self.backend.currentAppProfile, None)
 			self.backend.settingsDialog = None
 			self.Destroy()
+
+class HistorySearchDialog(wx.Dialog):
+	"""Search the announcement history as you type and copy a found entry"""
+
+	def __init__(self, parent, backend):
+		wx.Dialog.__init__(self, parent, id=wx.ID_ANY, title=_("Search LION History"),
+			style=wx.DEFAULT_DIALOG_STYLE | wx.RESIZE_BORDER)
+		self.backend = backend
+		self.profile = backend.currentAppProfile
+		self._results = []
+		self.SetSize((550, 450))
+
+		mainSizer = wx.BoxSizer(wx.VERTICAL)
+		self.SetSizer(mainSizer)
+		queryRow = wx.BoxSizer(wx.HORIZONTAL)
+		queryRow.Add(wx.StaticText(self, label=_("Search for")), 0, wx.ALL | wx.ALIGN_CENTER_VERTICAL, 5)
+		self.txtQuery = wx.TextCtrl(self)
+		queryRow.Add(self.txtQuery, 1, wx.ALL | wx.EXPAND, 5)
+		mainSizer.Add(queryRow, 0, wx.EXPAND)
+		self.chkProfileOnly = wx.CheckBox(self, label=_("Only {profile}").format(profile=self.profile))
+		self.chkProfileOnly.SetValue(True)
+		mainSizer.Add(self.chkProfileOnly, 0, wx.ALL, 5)
+		self.lblCount = wx.StaticText(self, label="")
+		mainSizer.Add(self.lblCount, 0, wx.ALL, 5)
+		self.lstResults = wx.ListBox(self, style=wx.LB_SINGLE)
+		mainSizer.Add(self.lstResults, 1, wx.ALL | wx.EXPAND, 5)
+		self.txtEntry = wx.TextCtrl(self, style=wx.TE_MULTILINE | wx.TE_READONLY, size=(-1, 100))
+		mainSizer.Add(self.txtEntry, 0, wx.ALL | wx.EXPAND, 5)
+
+		btnSizer = wx.BoxSizer(wx.HORIZONTAL)
+		self.btnCopy = wx.Button(self, label=_("&Copy"))
+		self.btnClose = wx.Button(self, wx.ID_CLOSE, _("Close"))
+		btnSizer.Add(self.btnCopy, 0, wx.ALL, 5)
+		btnSizer.Add(self.btnClose, 0, wx.ALL, 5)
+		mainSizer.Add(btnSizer, 0, wx.ALL | wx.ALIGN_RIGHT, 5)
+		self.SetEscapeId(wx.ID_CLOSE)
+
+		self.txtQuery.Bind(wx.EVT_TEXT, self.onQueryChanged)
+		self.chkProfileOnly.Bind(wx.EVT_CHECKBOX, self.onQueryChanged)
+		self.lstResults.Bind(wx.EVT_LISTBOX, self.onResultSelected)
+		self.lstResults.Bind(wx.EVT_LISTBOX_DCLICK, self.onCopy)
+		self.btnCopy.Bind(wx.EVT_BUTTON, self.onCopy)
+		self.btnClose.Bind(wx.EVT_BUTTON, lambda event: self.Close())
+		self.Bind(wx.EVT_CLOSE, self.onClose)
+		self.txtQuery.SetFocus()
+
+	def onQueryChanged(self, event):
+		"""Search again with the current words"""
+		try:
+			profile = self.profile if self.chkProfileOnly.GetValue() else None
+			self._results = self.backend.searchHistory(self.txtQuery.GetValue(), profile)
+			self.lstResults.Set([self._describe(entry) for entry in self._results])
+			self.lblCount.SetLabel(_("{count} results").format(count=len(self._results)))
+			self.txtEntry.SetValue("")
+			if self._results:
+				self.lstResults.SetSelection(0)
+				self.txtEntry.SetValue(self._results[0].text)
+		except Exception:
+			logHandler.log.exception("LionEvolutionPro: Error searching history")
+
+	def _describe(self, entry):
+		"""One line per result: time, profile and the start of the text"""
+		firstLine = entry.text.strip().split("\n", 1)[0][:80]
+		return f"{time.strftime('%H:%M:%S', time.localtime(entry.time))} {entry.profile}: {firstLine}"
+
+	def onResultSelected(self, event):
+		selection = self.lstResults.GetSelection()
+		if 0 <= selection < len(self._results):
+			self.txtEntry.SetValue(self._results[selection].text)
+
+	def onCopy(self, event):
+		"""Copy the selected entry to the clipboard"""
+		selection = self.lstResults.GetSelection()
+		if not 0 <= selection < len(self._results):
+			ui.message(_("No entry selected"))
+			return
+		if api.copyToClip(self._results[selection].text):
+			ui.message(_("Copied to clipboard"))
+
+	def onClose(self, event):
+		self.backend.historyDialog = None
+		self.Destroy()
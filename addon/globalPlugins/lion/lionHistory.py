@@ -0,0 +1,314 @@
+"""
+LION Evolution Pro - Announcement history
+
+Keeps the text LION announced so it can be reviewed again without another
+recognition pass. Entries are tagged with the profile and target they came
+from and stored in one ring buffer bounded by an estimated byte size: the
+oldest entries are evicted first.
+
+Storage is compact because live OCR repeats itself: every distinct line is
+stored once (reference counted) and an entry only holds references to its
+lines, so a screen re-announced with one changed line costs one new line
+plus a pointer per line.
+
+HistoryIndex is an inverted index (word -> ids of the entries containing it)
+kept in step with the history as entries are added and evicted. Its
+estimated size counts against the same byte cap, so enabling search never
+lets the history grow past it.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import array
+import collections
+import re
+import sys
+import threading
+import time
+
+
+# Default byte cap of the history
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+# Estimated fixed cost of one entry (entry and line tuples, time, deque slot),
+# per line reference, and of one distinct line besides its text (dictionary slots)
+ENTRY_OVERHEAD = 150
+LINE_REFERENCE = 8
+LINE_OVERHEAD = 100
+
+# Estimated cost of one indexed word besides its text (dictionary slot, posting
+# array header) and of one posting (entry id in the word's array)
+TOKEN_OVERHEAD = 140
+POSTING_BYTES = 4
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+HistoryEntry = collections.namedtuple("HistoryEntry", ("id", "time", "profile", "target", "text"))
+
+
+def tokenize(text):
+	"""Distinct lower case words of a text, in order of first appearance."""
+	return list(dict.fromkeys(_TOKEN_RE.findall(text.lower())))
+
+
+class HistoryIndex:
+	"""Inverted index over history entries.
+
+	Entry ids only grow and entries are evicted oldest first, so every posting
+	array is sorted and eviction removes from its front. Not thread-safe on its
+	own: AnnouncementHistory calls it under its lock.
+	"""
+
+	def __init__(self):
+		self._postings = {}  # word -> array of entry ids, ascending
+		self.bytes = 0
+
+	def __len__(self):
+		"""Number of distinct indexed words."""
+		return len(self._postings)
+
+	def add(self, entryId, text):
+		"""Index an entry.
+
+		Returns:
+			int: Change of the estimated size in bytes
+		"""
+		before = self.bytes
+		for token in tokenize(text):
+			posting = self._postings.get(token)
+			if posting is None:
+				posting = self._postings[token] = array.array("I")
+				self.bytes += sys.getsizeof(token) + TOKEN_OVERHEAD
+			posting.append(entryId)
+			self.bytes += POSTING_BYTES
+		return self.bytes - before
+
+	def remove(self, entryId, text):
+		"""Remove an entry, which must be the oldest one indexed.
+
+		Returns:
+			int: Change of the estimated size in bytes (negative)
+		"""
+		before = self.bytes
+		for token in tokenize(text):
+			posting = self._postings.get(token)
+			if not posting or posting[0] != entryId:
+				continue
+			del posting[0]
+			self.bytes -= POSTING_BYTES
+			if not posting:
+				del self._postings[token]
+				self.bytes -= sys.getsizeof(token) + TOKEN_OVERHEAD
+		return self.bytes - before
+
+	def clear(self):
+		self._postings.clear()
+		self.bytes = 0
+
+	def search(self, query):
+		"""Ids of the entries containing every word of a query.
+
+		The last word also matches as a prefix, so results follow typing.
+
+		Returns:
+			list: Entry ids, newest first
+		"""
+		tokens = tokenize(query)
+		if not tokens:
+			return []
+		matches = None
+		for i, token in enumerate(tokens):
+			posting = self._postings.get(token)
+			if i == len(tokens) - 1:
+				ids = set(posting) if posting else set()
+				for word, wordPosting in self._postings.items():
+					if word.startswith(token) and word != token:
+						ids.update(wordPosting)
+			else:
+				ids = set(posting) if posting else set()
+			matches = ids if matches is None else matches & ids
+			if not matches:
+				return []
+		return sorted(matches, reverse=True)
+
+
+class AnnouncementHistory:
+	"""Byte-capped ring buffer of announcements with deduplicated lines."""
+
+	def __init__(self, maxBytes=DEFAULT_MAX_BYTES, indexed=False):
+		"""
+		Args:
+			maxBytes: Estimated size the history is kept under (0 keeps nothing),
+				including the search index
+			indexed: Maintain a HistoryIndex so search() works
+		"""
+		self.maxBytes = maxBytes
+		self.index = HistoryIndex() if indexed else None
+		self._lock = threading.Lock()
+		# (time, profile, target, lines) oldest first; entry ids are consecutive
+		# from _firstId
+		self._entries = collections.deque()
+		self._firstId = 1
+		# Distinct line -> its stored copy (split() makes a new string every time,
+		# entries must reference the stored one), and -> number of entries using it
+		self._lines = {}
+		self._references = {}
+		self._bytes = 0
+		self.evicted = 0
+
+	def __len__(self):
+		return len(self._entries)
+
+	@property
+	def bytes(self):
+		"""Estimated size of the stored entries and lines."""
+		return self._bytes
+
+	@property
+	def uniqueLines(self):
+		return len(self._lines)
+
+	def add(self, text, profile, target, when=None):
+		"""Append an announcement, evicting the oldest entries beyond the byte cap.
+
+		Args:
+			text: Announced text
+			profile: Profile (application) name
+			target: Target index the text was recognized from
+			when: Timestamp (default: time.time())
+
+		Returns:
+			int or None: Id of the new entry, None if the history keeps nothing
+		"""
+		if self.maxBytes <= 0 or not text:
+			return None
+		with self._lock:
+			lines = []
+			for line in text.split("\n"):
+				stored = self._lines.get(line)
+				if stored is None:
+					stored = self._lines[line] = line
+					self._references[line] = 1
+					self._bytes += sys.getsizeof(line) + LINE_OVERHEAD
+				else:
+					self._references[stored] += 1
+				lines.append(stored)
+			lines = tuple(lines)
+			entryId = self._firstId + len(self._entries)
+			self._entries.append((time.time() if when is None else when, profile, target, lines))
+			self._bytes += ENTRY_OVERHEAD + LINE_REFERENCE * len(lines)
+			if self.index is not None:
+				self._bytes += self.index.add(entryId, text)
+			while self._bytes > self.maxBytes and len(self._entries) > 1:
+				self._evictOldest()
+			return entryId
+
+	def _evictOldest(self):
+		"""Drop the oldest entry and the lines no other entry uses (lock held)."""
+		_when, _profile, _target, lines = self._entries.popleft()
+		if self.index is not None:
+			self._bytes += self.index.remove(self._firstId, "\n".join(lines))
+		self._firstId += 1
+		self._bytes -= ENTRY_OVERHEAD + LINE_REFERENCE * len(lines)
+		for line in lines:
+			count = self._references[line] - 1
+			if count:
+				self._references[line] = count
+			else:
+				del self._references[line]
+				del self._lines[line]
+				self._bytes -= sys.getsizeof(line) + LINE_OVERHEAD
+		self.evicted += 1
+
+	def setMaxBytes(self, maxBytes):
+		"""Change the byte cap, evicting the oldest entries beyond it (0 clears the history)."""
+		if maxBytes <= 0:
+			self.clear()
+		with self._lock:
+			self.maxBytes = maxBytes
+			while self._bytes > self.maxBytes and len(self._entries) > 1:
+				self._evictOldest()
+
+	def clear(self):
+		with self._lock:
+			self._firstId += len(self._entries)
+			self._entries.clear()
+			self._lines.clear()
+			self._references.clear()
+			if self.index is not None:
+				self.index.clear()
+			self._bytes = 0
+
+	def _makeEntry(self, position):
+		when, profile, target, lines = self._entries[position]
+		return HistoryEntry(self._firstId + position, when, profile, target, "\n".join(lines))
+
+	def _position(self, entryId):
+		"""Index of an entry id in the deque, None if evicted or unknown (lock held)."""
+		if entryId is None:
+			return None
+		position = entryId - self._firstId
+		if 0 <= position < len(self._entries):
+			return position
+		return None
+
+	def get(self, entryId):
+		"""Return the HistoryEntry with this id, or None if it was evicted."""
+		with self._lock:
+			position = self._position(entryId)
+			return None if position is None else self._makeEntry(position)
+
+	def _step(self, entryId, step, profile):
+		with self._lock:
+			position = self._position(entryId)
+			if position is None:
+				# Unknown or evicted: start from the newest (step back) or give up
+				if step > 0:
+					return None
+				position = len(self._entries)
+			position += step
+			while 0 <= position < len(self._entries):
+				if profile is None or self._entries[position][1] == profile:
+					return self._makeEntry(position)
+				position += step
+			return None
+
+	def latest(self, profile=None):
+		"""Newest entry (of one profile if given), or None."""
+		return self._step(None, -1, profile)
+
+	def previous(self, entryId, profile=None):
+		"""Entry before entryId (of one profile if given); the newest one if entryId
+		is None or was evicted. None at the start of the history."""
+		return self._step(entryId, -1, profile)
+
+	def next(self, entryId, profile=None):
+		"""Entry after entryId (of one profile if given), None at the end."""
+		return self._step(entryId, 1, profile)
+
+	def search(self, query, profile=None, limit=100):
+		"""Find entries containing every word of a query (see HistoryIndex.search).
+
+		Args:
+			query: Words to look for, case-insensitive
+			profile: Only return entries of this profile
+			limit: Maximum number of entries returned
+
+		Returns:
+			list: HistoryEntry tuples, newest first (empty if the history is not indexed)
+		"""
+		if self.index is None:
+			return []
+		with self._lock:
+			results = []
+			for entryId in self.index.search(query):
+				position = self._position(entryId)
+				if position is None:
+					continue
+				if profile is not None and self._entries[position][1] != profile:
+					continue
+				results.append(self._makeEntry(position))
+				if len(results) >= limit:
+					break
+			return results
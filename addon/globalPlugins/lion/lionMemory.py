@@ -0,0 +1,172 @@
+"""
+LION Evolution Pro - Memory accounting
+
+Estimates bytes held by the addon's long-lived structures and provides an
+opt-in tracemalloc allocation trace over a scan window.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import sys
+import threading
+import time
+import tracemalloc
+
+
+def deepSizeOf(obj, seen=None):
+	"""Approximate bytes held by a structure of dicts, lists, tuples, sets and scalars.
+
+	Shared objects are counted once. Objects of other types count their shallow
+	size plus their __dict__/__slots__ contents.
+
+	Args:
+		obj: Object to measure
+		seen: Set of ids already counted (internal)
+
+	Returns:
+		int: Approximate size in bytes
+	"""
+	if seen is None:
+		seen = set()
+	objId = id(obj)
+	if objId in seen:
+		return 0
+	seen.add(objId)
+	size = sys.getsizeof(obj)
+	if isinstance(obj, (str, bytes, bytearray, int, float, bool, type(None))):
+		return size
+	if isinstance(obj, dict):
+		for key, value in obj.items():
+			size += deepSizeOf(key, seen) + deepSizeOf(value, seen)
+	elif isinstance(obj, (list, tuple, set, frozenset)):
+		for item in obj:
+			size += deepSizeOf(item, seen)
+	else:
+		if hasattr(obj, "__dict__"):
+			size += deepSizeOf(vars(obj), seen)
+		for slot in getattr(type(obj), "__slots__", ()):
+			if hasattr(obj, slot):
+				size += deepSizeOf(getattr(obj, slot), seen)
+	return size
+
+
+def bufferSize(pixels):
+	"""Bytes held by a pixel buffer (anything supporting the buffer protocol)."""
+	try:
+		return memoryview(pixels).nbytes
+	except TypeError:
+		return sys.getsizeof(pixels)
+
+
+def formatBytes(n):
+	"""Human readable byte count."""
+	value = float(n)
+	for unit in ("bytes", "KB", "MB"):
+		if abs(value) < 1024 or unit == "MB":
+			return f"{value:.0f} {unit}" if unit == "bytes" else f"{value:.1f} {unit}"
+		value /= 1024.0
+
+
+class InFlightBuffers:
+	"""Tracks pixel buffers handed to the recognizer until their callback runs."""
+
+	def __init__(self):
+		self._lock = threading.Lock()
+		self._buffers = {}  # token -> (keys, bytes, start time)
+		self._nextToken = 0
+		self.peakBytes = 0
+		self.expired = 0
+
+	def add(self, pixels, keys=()):
+		"""Register a buffer and return the token to release it with.
+
+		Args:
+			pixels: Buffer handed to the recognizer
+			keys: Scan keys the recognition belongs to (targets sharing the frame)
+		"""
+		size = bufferSize(pixels)
+		with self._lock:
+			self._nextToken += 1
+			token = self._nextToken
+			self._buffers[token] = (tuple(keys), size, time.monotonic())
+			total = sum(entry[1] for entry in self._buffers.values())
+			if total > self.peakBytes:
+				self.peakBytes = total
+			return token
+
+	def release(self, token):
+		with self._lock:
+			self._buffers.pop(token, None)
+
+	def pending(self, key, maxAge):
+		"""Number of recognitions in flight for a key.
+
+		Entries older than maxAge seconds are assumed abandoned by the
+		recognizer (no callback will come) and dropped.
+		"""
+		now = time.monotonic()
+		with self._lock:
+			stale = [token for token, entry in self._buffers.items() if now - entry[2] > maxAge]
+			for token in stale:
+				del self._buffers[token]
+			self.expired += len(stale)
+			return sum(1 for entry in self._buffers.values() if key in entry[0])
+
+	def count(self):
+		with self._lock:
+			return len(self._buffers)
+
+	def totalBytes(self):
+		with self._lock:
+			return sum(entry[1] for entry in self._buffers.values())
+
+
+class AllocationTrace:
+	"""tracemalloc trace comparing allocation sites between a start and end snapshot."""
+
+	def __init__(self, frames=10):
+		self.frames = frames
+		self.startTime = None
+		self._startSnapshot = None
+		self._startedTracing = False
+
+	@property
+	def running(self):
+		return self._startSnapshot is not None
+
+	def start(self):
+		if not tracemalloc.is_tracing():
+			tracemalloc.start(self.frames)
+			self._startedTracing = True
+		self.startTime = time.monotonic()
+		self._startSnapshot = tracemalloc.take_snapshot()
+
+	def stop(self, top=25):
+		"""End the trace and return a text report of the top allocation differences.
+
+		Args:
+			top: Number of allocation sites to include
+
+		Returns:
+			str: Report text
+		"""
+		if self._startSnapshot is None:
+			return "Allocation trace was not running"
+		endSnapshot = tracemalloc.take_snapshot()
+		current, peak = tracemalloc.get_traced_memory()
+		if self._startedTracing:
+			tracemalloc.stop()
+		filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+		stats = endSnapshot.filter_traces(filters).compare_to(
+			self._startSnapshot.filter_traces(filters), "lineno")
+		elapsed = time.monotonic() - self.startTime
+		self._startSnapshot = None
+		self._startedTracing = False
+		growth = sum(stat.size_diff for stat in stats)
+		lines = [
+			f"Allocation trace over {elapsed:.0f} s: net {formatBytes(growth)} "
+			f"(traced now {formatBytes(current)}, peak {formatBytes(peak)})",
+		]
+		for stat in stats[:top]:
+			lines.append(str(stat))
+		return "\n".join(lines)
@@ -0,0 +1,205 @@
+"""
+LION Evolution Pro - Mosaic batching
+
+Every recognize() call costs a fixed overhead on top of the time proportional
+to the pixels recognized (see RecognizerBackend.costEstimate). When several
+small target areas are due in the same scan tick, they can be packed into one
+mosaic image and recognized with a single call.
+
+Layout:
+-------
+Areas are stacked vertically, left aligned, with a blank band of SEPARATOR
+pixels between them. Stacking keeps every text line inside one area's band,
+so the recognized words are assigned back to their area by their vertical
+center and moved back to area coordinates (splitResult). Words falling in a
+separator belong to no area and are dropped.
+
+Policy:
+-------
+planBatches() groups areas smallest first while the mosaic stays within
+MAX_MOSAIC_PIXELS and MAX_REGIONS, and only keeps a group if the backend's
+cost estimate of the mosaic (including the unused pixels beside narrow
+areas) is lower than the sum of the separate recognitions.
+benchmarks/benchMosaic.py measures per-call overhead against batch size
+with a stub recognizer to check these limits.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import bisect
+
+
+# Blank band between stacked areas, in screen pixels
+SEPARATOR = 16
+# Largest mosaic (screen pixels): bigger images delay every area they contain
+MAX_MOSAIC_PIXELS = 2 * 1024 * 1024
+# Most areas recognized in one mosaic
+MAX_REGIONS = 8
+# Bytes per pixel of captured bitmaps (BGRA)
+BYTES_PER_PIXEL = 4
+
+
+def layout(sizes, separator=SEPARATOR):
+	"""Stack areas vertically.
+
+	Args:
+		sizes: (width, height) of each area
+		separator: Pixels between consecutive areas
+
+	Returns:
+		tuple: (mosaic width, mosaic height, top row of each area)
+	"""
+	tops = []
+	height = 0
+	for _width, areaHeight in sizes:
+		if tops:
+			height += separator
+		tops.append(height)
+		height += areaHeight
+	width = max((areaWidth for areaWidth, _height in sizes), default=0)
+	return width, height, tops
+
+
+def planBatches(sizes, costEstimate, separator=SEPARATOR, maxPixels=MAX_MOSAIC_PIXELS,
+		maxRegions=MAX_REGIONS):
+	"""Choose the areas worth recognizing together.
+
+	Args:
+		sizes: (width, height) of each area
+		costEstimate: Callable (width, height) -> estimated seconds of one recognition
+		separator: Pixels between consecutive areas
+		maxPixels: Largest mosaic area
+		maxRegions: Most areas per mosaic
+
+	Returns:
+		list: Batches (lists of positions in sizes, at least two each); areas
+			in no batch are best recognized alone
+	"""
+	batches = []
+
+	def flush(batch):
+		if len(batch) < 2:
+			return
+		width, height, _tops = layout([sizes[i] for i in batch], separator)
+		if costEstimate(width, height) < sum(costEstimate(*sizes[i]) for i in batch):
+			batches.append(batch)
+
+	current = []
+	for i in sorted(range(len(sizes)), key=lambda i: sizes[i][0] * sizes[i][1]):
+		candidate = current + [i]
+		width, height, _tops = layout([sizes[j] for j in candidate], separator)
+		if len(candidate) <= maxRegions and width * height <= maxPixels:
+			current = candidate
+		else:
+			flush(current)
+			current = [i]
+	flush(current)
+	return batches
+
+
+def allocateLike(pixels, count):
+	"""Zeroed pixel buffer of count pixels, of the same kind as pixels.
+
+	ctypes arrays (screenBitmap's rows of RGBQUAD) give a flat ctypes array of
+	the same pixel type, anything else a bytearray.
+	"""
+	itemType = getattr(type(pixels), "_type_", None)
+	while getattr(itemType, "_length_", None) is not None:
+		# Array of rows: the pixel type is the element of a row
+		itemType = itemType._type_
+	if itemType is not None and not isinstance(itemType, str):
+		return (itemType * count)()
+	return bytearray(count * BYTES_PER_PIXEL)
+
+
+def compose(buffers, sizes, tops, width, height, out=None):
+	"""Copy area bitmaps into one mosaic bitmap.
+
+	Args:
+		buffers: Pixel buffers of the areas (rows of BGRA pixels)
+		sizes: (width, height) of each buffer in pixels
+		tops: Mosaic row of each area's first row
+		width: Mosaic width in pixels
+		height: Mosaic height in pixels
+		out: Buffer of width * height pixels to fill, e.g. a reused one (default:
+			a new one)
+
+	Returns:
+		object: The mosaic buffer; pixels outside the areas are blank
+	"""
+	mosaic = allocateLike(buffers[0], width * height) if out is None else out
+	view = memoryview(mosaic).cast("B")
+	stride = width * BYTES_PER_PIXEL
+	# A reused buffer still holds the previous mosaic: blank what no area covers
+	zeros = memoryview(bytes(stride)) if out is not None else None
+	blankFrom = 0
+	for buffer, (areaWidth, areaHeight), top in zip(buffers, sizes, tops):
+		if zeros is not None:
+			for row in range(blankFrom, top):
+				view[row * stride:(row + 1) * stride] = zeros
+		source = memoryview(buffer).cast("B")
+		rowBytes = areaWidth * BYTES_PER_PIXEL
+		rows = min(areaHeight, height - top)
+		for row in range(rows):
+			chunk = source[row * rowBytes:(row + 1) * rowBytes]
+			start = (top + row) * stride
+			view[start:start + len(chunk)] = chunk
+			if zeros is not None and len(chunk) < stride:
+				view[start + len(chunk):start + stride] = zeros[:stride - len(chunk)]
+		blankFrom = top + rows
+	if zeros is not None:
+		for row in range(blankFrom, height):
+			view[row * stride:(row + 1) * stride] = zeros
+	return mosaic
+
+
+class _PartTextInfo:
+	def __init__(self, text):
+		self.text = text
+
+
+class MosaicPart:
+	"""The words of one area of a mosaic result, in area coordinates.
+
+	Looks like the recognizer's result (data and makeTextInfo) to the rest of
+	the scan pipeline.
+	"""
+
+	def __init__(self, lines):
+		self.data = lines
+
+	@property
+	def text(self):
+		return "\n".join(" ".join(word["text"] for word in line) for line in self.data)
+
+	def makeTextInfo(self, obj, position):
+		return _PartTextInfo(self.text)
+
+
+def splitResult(result, tops, heights):
+	"""Assign the words of a mosaic result back to their areas.
+
+	Args:
+		result: Recognition result with per-word boxes in result.data
+		tops: Mosaic row of each area's first row (recognized pixels, ascending)
+		heights: Height of each area (recognized pixels)
+
+	Returns:
+		list: One MosaicPart per area
+	"""
+	parts = [[] for _top in tops]
+	for line in getattr(result, "data", None) or ():
+		lineParts = {}
+		for word in line:
+			try:
+				center = word["y"] + word["height"] / 2.0
+			except (KeyError, TypeError):
+				continue
+			i = bisect.bisect_right(tops, center) - 1
+			if i < 0 or center >= tops[i] + heights[i]:
+				# In a separator
+				continue
+			lineParts.setdefault(i, []).append(dict(word, y=word["y"] - tops[i]))
+		for i, words in lineParts.items():
+			parts[i].append(words)
+	return [MosaicPart(lines) for lines in parts]
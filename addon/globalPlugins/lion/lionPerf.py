@@ -0,0 +1,309 @@
+"""
+LION Evolution Pro - Scan stage instrumentation
+
+Records per-profile counters and fixed-bucket latency histograms for each
+stage of an OCR scan (target resolution, capture, recognize round-trip, text
+extraction, text filters, similarity, speech enqueue), plus windows of exact end-to-end
+latency samples (frame capture to announcement dequeued by the speech stage).
+
+This module has no NVDA dependencies so it can be used headless.
+
+Overhead contract:
+------------------
+- Disabled: mark() returns None and record() returns immediately, so callers
+  pay one attribute lookup and call per stage.
+- Enabled: one perf_counter() call per mark and a short locked update of a
+  fixed-size histogram per record. No per-sample allocation.
+"""
+
+import collections
+import threading
+import time
+
+
+# Scan stages in pipeline order
+STAGES = ("target", "capture", "recognize", "extract", "filter", "similarity", "speech")
+
+# Histogram bucket upper bounds in milliseconds; one extra open-ended bucket follows
+BUCKET_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Percentiles reported for latency sample windows, and the window size
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+LATENCY_WINDOW = 1024
+
+
+class StageHistogram:
+	"""Fixed-bucket latency histogram for one stage of one profile."""
+
+	__slots__ = ("count", "totalMs", "maxMs", "buckets")
+
+	def __init__(self):
+		self.count = 0
+		self.totalMs = 0.0
+		self.maxMs = 0.0
+		self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+	def add(self, ms):
+		"""Add one sample in milliseconds."""
+		self.count += 1
+		self.totalMs += ms
+		if ms > self.maxMs:
+			self.maxMs = ms
+		for i, bound in enumerate(BUCKET_BOUNDS_MS):
+			if ms <= bound:
+				self.buckets[i] += 1
+				return
+		self.buckets[-1] += 1
+
+	@property
+	def meanMs(self):
+		return self.totalMs / self.count if self.count else 0.0
+
+	def percentileMs(self, p):
+		"""Approximate percentile as the upper bound of the bucket containing it.
+
+		Args:
+			p: Percentile in [0, 100]
+
+		Returns:
+			float: Bucket upper bound in ms (maxMs for the open-ended bucket)
+		"""
+		if not self.count:
+			return 0.0
+		rank = max(1, int(round(self.count * p / 100.0)))
+		seen = 0
+		for i, n in enumerate(self.buckets):
+			seen += n
+			if seen >= rank:
+				if i < len(BUCKET_BOUNDS_MS):
+					return float(min(BUCKET_BOUNDS_MS[i], self.maxMs))
+				return self.maxMs
+		return self.maxMs
+
+
+class LatencyWindow:
+	"""The most recent LATENCY_WINDOW latency samples, for exact percentiles."""
+
+	__slots__ = ("count", "samples")
+
+	def __init__(self):
+		self.count = 0
+		self.samples = collections.deque(maxlen=LATENCY_WINDOW)
+
+	def add(self, ms):
+		self.count += 1
+		self.samples.append(ms)
+
+	def percentiles(self):
+		"""Return {"p50Ms": ..., ...} over the window plus maxMs."""
+		ordered = sorted(self.samples)
+		result = {}
+		for p in LATENCY_PERCENTILES:
+			if ordered:
+				index = min(len(ordered) - 1, int(round((len(ordered) - 1) * p / 100.0)))
+				result[f"p{p}Ms"] = ordered[index]
+			else:
+				result[f"p{p}Ms"] = 0.0
+		result["maxMs"] = ordered[-1] if ordered else 0.0
+		return result
+
+
+class PerfStats:
+	"""Thread-safe per-profile stage histograms and counters."""
+
+	def __init__(self, enabled=False):
+		self.enabled = enabled
+		self._lock = threading.Lock()
+		# profile -> {"stages": {stage: StageHistogram}, "counters": {name: int},
+		#	"latencies": {name: LatencyWindow}}
+		self._profiles = {}
+		self._startTime = time.monotonic()
+
+	def _profileEntry(self, profile):
+		entry = self._profiles.get(profile)
+		if entry is None:
+			entry = self._profiles[profile] = {"stages": {}, "counters": {}, "latencies": {}}
+		return entry
+
+	def mark(self):
+		"""Return a start mark for a stage, or None when disabled."""
+		if not self.enabled:
+			return None
+		return time.perf_counter()
+
+	def record(self, profile, stage, startMark):
+		"""Record elapsed time since startMark for a stage.
+
+		Args:
+			profile: Profile name the scan belongs to
+			stage: Stage name (see STAGES)
+			startMark: Value returned by mark(); None is ignored
+
+		Returns:
+			float or None: A new mark usable as start of the next stage
+		"""
+		if startMark is None or not self.enabled:
+			return None
+		now = time.perf_counter()
+		with self._lock:
+			stages = self._profileEntry(profile)["stages"]
+			hist = stages.get(stage)
+			if hist is None:
+				hist = stages[stage] = StageHistogram()
+			hist.add((now - startMark) * 1000.0)
+		return now
+
+	def recordLatency(self, profile, name, startMark):
+		"""Record an end-to-end latency sample measured from startMark.
+
+		Args:
+			profile: Profile name the scan belongs to
+			name: Latency name (e.g. "endToEnd")
+			startMark: Value returned by mark(); None is ignored
+		"""
+		if startMark is None or not self.enabled:
+			return
+		ms = (time.perf_counter() - startMark) * 1000.0
+		with self._lock:
+			latencies = self._profileEntry(profile)["latencies"]
+			window = latencies.get(name)
+			if window is None:
+				window = latencies[name] = LatencyWindow()
+			window.add(ms)
+
+	def count(self, profile, name, n=1):
+		"""Increment a named counter for a profile (no-op when disabled)."""
+		if not self.enabled:
+			return
+		with self._lock:
+			counters = self._profileEntry(profile)["counters"]
+			counters[name] = counters.get(name, 0) + n
+
+	def reset(self):
+		"""Discard all recorded data."""
+		with self._lock:
+			self._profiles.clear()
+			self._startTime = time.monotonic()
+
+	def snapshot(self, profile):
+		"""Return a plain dict copy of a profile's data.
+
+		Returns:
+			dict: {"stages": {stage: {count, meanMs, p50Ms, p95Ms, maxMs}}, "counters": {...},
+				"latencies": {name: {count, p50Ms, p90Ms, p95Ms, p99Ms, maxMs}},
+				"elapsed": seconds since last reset}
+		"""
+		with self._lock:
+			entry = self._profiles.get(profile, {"stages": {}, "counters": {}, "latencies": {}})
+			stages = {}
+			for stage, hist in entry["stages"].items():
+				stages[stage] = {
+					"count": hist.count,
+					"meanMs": hist.meanMs,
+					"p50Ms": hist.percentileMs(50),
+					"p95Ms": hist.percentileMs(95),
+					"maxMs": hist.maxMs,
+				}
+			latencies = {}
+			for name, window in entry["latencies"].items():
+				latencies[name] = dict(window.percentiles(), count=window.count)
+			return {
+				"stages": stages,
+				"counters": dict(entry["counters"]),
+				"latencies": latencies,
+				"elapsed": time.monotonic() - self._startTime,
+			}
+
+	def profiles(self):
+		"""Return the names of profiles with recorded data."""
+		with self._lock:
+			return sorted(self._profiles)
+
+	def summary(self, profile):
+		"""Short summary for one profile, untranslated (the spoken one is built by the plugin)."""
+		snap = self.snapshot(profile)
+		if not snap["stages"] and not snap["counters"]:
+			return f"No statistics for {profile}"
+		parts = [f"{profile}: {snap['counters'].get('scans', 0)} scans"]
+		for stage in STAGES:
+			data = snap["stages"].get(stage)
+			if data:
+				parts.append(f"{stage} {data['meanMs']:.0f} ms, p95 {data['p95Ms']:.0f}")
+		endToEnd = snap["latencies"].get("endToEnd")
+		if endToEnd:
+			parts.append(f"capture to speech p50 {endToEnd['p50Ms']:.0f} ms, p95 {endToEnd['p95Ms']:.0f}")
+		return "; ".join(parts)
+
+	def report(self):
+		"""Full multi-line report of all profiles, including histogram buckets."""
+		lines = []
+		with self._lock:
+			elapsed = time.monotonic() - self._startTime
+			lines.append(f"Performance report ({elapsed:.0f} s since reset)")
+			bucketNames = [f"<={b}" for b in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}"]
+			for profile in sorted(self._profiles):
+				entry = self._profiles[profile]
+				lines.append(f"[{profile}]")
+				for name, value in sorted(entry["counters"].items()):
+					lines.append(f"  {name}: {value}")
+				for stage in STAGES + tuple(s for s in sorted(entry["stages"]) if s not in STAGES):
+					hist = entry["stages"].get(stage)
+					if not hist:
+						continue
+					lines.append(f"  {stage}: n={hist.count} mean={hist.meanMs:.1f}ms "
+						f"p50={hist.percentileMs(50):.0f}ms p95={hist.percentileMs(95):.0f}ms "
+						f"max={hist.maxMs:.1f}ms")
+					lines.append("    " + " ".join(
+						f"{name}:{n}" for name, n in zip(bucketNames, hist.buckets) if n))
+				for name, window in sorted(entry["latencies"].items()):
+					values = window.percentiles()
+					lines.append(f"  {name}: n={window.count} " + " ".join(
+						f"{key[:-2]}={value:.0f}ms" for key, value in values.items()))
+		return "\n".join(lines)
+
+
+def liveRates(previous, current):
+	"""Rates between two snapshots of one profile (see PerfStats.snapshot).
+
+	Args:
+		previous: Earlier snapshot, or None to rate everything since the last reset
+		current: Later snapshot
+
+	Returns:
+		dict: seconds covered, scansPerSec, recognitionsPerSec, recognizeMs (mean
+			over the interval), skipRatio (busy skips per scan attempt) and
+			unchangedRatio (results not spoken because the text did not change)
+	"""
+	if previous is not None and previous["elapsed"] > current["elapsed"]:
+		# Statistics were reset in between
+		previous = None
+	seconds = current["elapsed"] - (previous["elapsed"] if previous else 0.0)
+
+	def counter(name):
+		value = current["counters"].get(name, 0)
+		if previous:
+			value -= previous["counters"].get(name, 0)
+		return max(0, value)
+
+	def stage(name):
+		data = current["stages"].get(name) or {"count": 0, "meanMs": 0.0}
+		count, total = data["count"], data["count"] * data["meanMs"]
+		if previous and name in previous["stages"]:
+			before = previous["stages"][name]
+			count -= before["count"]
+			total -= before["count"] * before["meanMs"]
+		return max(0, count), total
+
+	scans = counter("scans")
+	skips = counter("busySkips")
+	spoken = counter("spoken")
+	suppressed = counter("suppressed")
+	recognitions, recognizeTotal = stage("recognize")
+	return {
+		"seconds": seconds,
+		"scansPerSec": scans / seconds if seconds > 0 else 0.0,
+		"recognitionsPerSec": recognitions / seconds if seconds > 0 else 0.0,
+		"recognizeMs": recognizeTotal / recognitions if recognitions else 0.0,
+		"skipRatio": skips / float(scans + skips) if scans + skips else 0.0,
+		"unchangedRatio": suppressed / float(spoken + suppressed) if spoken + suppressed else 0.0,
+	}
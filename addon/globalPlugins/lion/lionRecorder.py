@@ -0,0 +1,121 @@
+"""
+LION Evolution Pro - Session recording
+
+Writes one record per OCR scan to a compact append-only file so field sessions
+can be replayed offline through the diff, anti-repeat and speech stages.
+
+File format:
+------------
+UTF-8 text, one JSON object per line. The first line is a header:
+	{"format": "lionRecording", "version": 1, "created": <epoch seconds>}
+Every following line is a scan record:
+	t      capture time (epoch seconds)
+	app    profile name
+	target target index
+	rect   [left, top, width, height] of the scanned area
+	fp     frame fingerprint (hex digest of the captured pixels)
+	text   recognized text (absent if recognition failed)
+	thr    similarity threshold in effect
+	spoken whether the text was announced
+	px     optional zlib-compressed, base64-encoded pixels ("pw"/"ph" give their size)
+
+Lines are flushed as they are written, so a crash loses at most the record
+being written, and readers skip a truncated last line.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+import time
+import zlib
+
+
+FORMAT_NAME = "lionRecording"
+FORMAT_VERSION = 1
+
+
+def frameFingerprint(pixels):
+	"""Return a short hex digest of a pixel buffer.
+
+	Args:
+		pixels: Any object supporting the buffer protocol (ctypes array, bytes...)
+
+	Returns:
+		str: 16 hex characters
+	"""
+	return hashlib.blake2b(memoryview(pixels).cast("B"), digest_size=8).hexdigest()
+
+
+def encodePixels(pixels, level=6):
+	"""Compress a pixel buffer for storage in a record."""
+	return base64.b64encode(zlib.compress(memoryview(pixels).cast("B"), level)).decode("ascii")
+
+
+def decodePixels(record):
+	"""Return the raw pixel bytes stored in a record, or None if it has none."""
+	data = record.get("px")
+	if not data:
+		return None
+	return zlib.decompress(base64.b64decode(data))
+
+
+class SessionRecorder:
+	"""Thread-safe append-only writer of scan records."""
+
+	def __init__(self, path, storePixels=False):
+		"""
+		Args:
+			path: Recording file path (appended to if it exists)
+			storePixels: Also store compressed pixels in each record
+		"""
+		self.path = path
+		self.storePixels = storePixels
+		self.records = 0
+		self._lock = threading.Lock()
+		self._file = open(path, "a", encoding="utf-8")
+		if self._file.tell() == 0:
+			self._writeLine({"format": FORMAT_NAME, "version": FORMAT_VERSION, "created": time.time()})
+
+	def _writeLine(self, data):
+		self._file.write(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+		self._file.write("\n")
+		self._file.flush()
+
+	def record(self, tick):
+		"""Append a scan record.
+
+		Args:
+			tick: Dict with the fields described in the module docstring
+		"""
+		with self._lock:
+			if self._file is None:
+				return
+			self._writeLine(tick)
+			self.records += 1
+
+	def close(self):
+		with self._lock:
+			if self._file is not None:
+				self._file.close()
+				self._file = None
+
+
+def readRecords(path):
+	"""Yield scan records from a recording file, skipping the header.
+
+	Raises:
+		ValueError: If the file is not a LION recording
+	"""
+	with open(path, "r", encoding="utf-8") as f:
+		header = json.loads(f.readline() or "{}")
+		if header.get("format") != FORMAT_NAME:
+			raise ValueError(f"{path} is not a LION recording")
+		for line in f:
+			try:
+				yield json.loads(line)
+			except ValueError:
+				# Truncated last line after a crash
+				break
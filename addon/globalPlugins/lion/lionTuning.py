@@ -0,0 +1,235 @@
+"""
+LION Evolution Pro - Region of interest learning and threshold calibration
+
+While learning, the target is scanned uncropped and the word boxes of every
+result are compared with the previous result: words that appear or move are
+"changed", and the union of their boxes is the part of the target that
+produces new text. At the end of the window the tightest crop covering that
+area (plus a margin) is proposed as cropLeft/Right/Up/Down percentages.
+
+The crop is computed with the inverse of the upstream LION crop formula used
+by GlobalPlugin.cropRectLTWH:
+
+	x = (left + width) * cropLeft / 100
+	width' = width - width * cropRight / 100
+
+(and the same for y/height with cropUp/cropDown), so applying the proposal
+through that formula yields a rectangle covering the learned area.
+
+Threshold calibration samples the similarity ratio between consecutive
+results of a target while its screen is static, so every difference is OCR
+noise. The lowest ratio seen is the noise floor; the proposed threshold sits
+CALIBRATION_MARGIN below it, so noise no longer counts as a change while any
+real change (which lowers the ratio much further) still does.
+
+This module has no NVDA dependencies so it can be used headless.
+"""
+
+import math
+import threading
+import time
+from difflib import SequenceMatcher
+
+
+# Extra border around the learned area, as a fraction of the target size
+ROI_MARGIN = 0.02
+
+# Distance between the calibrated threshold and the noise floor
+CALIBRATION_MARGIN = 0.02
+# Noise floors below this mean the screen changed during calibration
+CALIBRATION_MIN_FLOOR = 0.5
+# Highest threshold calibration proposes (1.0 would speak identical text)
+CALIBRATION_MAX_THRESHOLD = 0.99
+# Fewest ratio samples a proposal is made from
+CALIBRATION_MIN_SAMPLES = 3
+
+
+def resultWords(result, width, height):
+	"""Word boxes of a recognition result, as fractions of the recognized image.
+
+	Args:
+		result: Recognition result; only results exposing per-word boxes in
+			result.data (NVDA's LinesWordsResult: lines of word dicts with
+			x, y, width, height and text) contribute
+		width: Recognized image width in pixels
+		height: Recognized image height in pixels
+
+	Returns:
+		list: (text, x, y, width, height) tuples with coordinates in [0, 1]
+	"""
+	data = getattr(result, "data", None)
+	if not data or width <= 0 or height <= 0:
+		return []
+	words = []
+	for line in data:
+		for word in line:
+			try:
+				words.append((word["text"], word["x"] / width, word["y"] / height,
+					word["width"] / width, word["height"] / height))
+			except (KeyError, TypeError):
+				continue
+	return words
+
+
+def _forwardAxis(start, size, cropStart, cropEnd):
+	"""Upstream crop formula on one axis: returns (new start, new end)."""
+	newStart = int((start + size) * cropStart / 100.0)
+	return newStart, newStart + int(size - size * cropEnd / 100.0)
+
+
+def _axisCrop(start, size, low, high):
+	"""Largest crop percentages on one axis whose cropped range still covers [low, high]."""
+	end = start + size
+	if size <= 0 or end <= 0:
+		return 0, 0
+	cropStart = max(0, min(99, int(100.0 * low / end)))
+	while cropStart > 0 and _forwardAxis(start, size, cropStart, 0)[0] > low:
+		cropStart -= 1
+	newStart = _forwardAxis(start, size, cropStart, 0)[0]
+	cropEnd = max(0, min(99 - cropStart, int(100.0 * (1.0 - (high - newStart) / size))))
+	while cropEnd > 0 and _forwardAxis(start, size, cropStart, cropEnd)[1] < high:
+		cropEnd -= 1
+	return cropStart, cropEnd
+
+
+def cropForBox(rect, box):
+	"""Crop settings covering a box inside a target rectangle.
+
+	Args:
+		rect: (left, top, width, height) of the uncropped target
+		box: (x0, y0, x1, y1) screen coordinates to keep
+
+	Returns:
+		dict: cropLeft, cropRight, cropUp and cropDown percentages
+	"""
+	left, top, width, height = rect
+	cropLeft, cropRight = _axisCrop(left, width, box[0], box[2])
+	cropUp, cropDown = _axisCrop(top, height, box[1], box[3])
+	return {"cropLeft": cropLeft, "cropRight": cropRight, "cropUp": cropUp, "cropDown": cropDown}
+
+
+class RoiLearner:
+	"""Accumulates where in a target recognized text changes."""
+
+	def __init__(self, seconds, margin=ROI_MARGIN):
+		"""
+		Args:
+			seconds: Length of the learning window
+			margin: Border added around the learned area (fraction of the target)
+		"""
+		self.seconds = seconds
+		self.margin = margin
+		self.started = time.monotonic()
+		self.frames = 0
+		self.changedWords = 0
+		self.box = None  # (x0, y0, x1, y1) as fractions of the target
+		self.rect = None  # Last uncropped target rectangle seen
+		self._previous = None
+		self._lock = threading.Lock()
+
+	@property
+	def done(self):
+		return time.monotonic() - self.started >= self.seconds
+
+	def add(self, words, rect=None):
+		"""Account the words of one result.
+
+		Args:
+			words: (text, x, y, width, height) tuples, fractions of the target (see resultWords)
+			rect: Uncropped target rectangle the result was recognized from
+		"""
+		current = {}
+		for text, x, y, width, height in words:
+			current[(text, round(x, 2), round(y, 2))] = (x, y, x + width, y + height)
+		with self._lock:
+			self.frames += 1
+			if rect is not None:
+				self.rect = tuple(rect)
+			if self._previous is not None:
+				for key, box in current.items():
+					if key in self._previous:
+						continue
+					self.changedWords += 1
+					if self.box is None:
+						self.box = box
+					else:
+						self.box = (min(self.box[0], box[0]), min(self.box[1], box[1]),
+							max(self.box[2], box[2]), max(self.box[3], box[3]))
+			self._previous = set(current)
+
+	def coverage(self):
+		"""Fraction of the target area covered by the learned box (with margin)."""
+		box = self._marginBox()
+		if box is None:
+			return 1.0
+		return (box[2] - box[0]) * (box[3] - box[1])
+
+	def _marginBox(self):
+		if self.box is None:
+			return None
+		x0, y0, x1, y1 = self.box
+		margin = self.margin
+		return (max(0.0, x0 - margin), max(0.0, y0 - margin), min(1.0, x1 + margin), min(1.0, y1 + margin))
+
+	def proposal(self, rect=None):
+		"""Crop settings covering the learned area of a target.
+
+		Args:
+			rect: Uncropped target rectangle (default: the last one seen)
+
+		Returns:
+			dict or None: Crop percentages, None if no changing text was seen
+		"""
+		rect = rect or self.rect
+		box = self._marginBox()
+		if box is None or rect is None:
+			return None
+		left, top, width, height = rect
+		return cropForBox(rect, (left + box[0] * width, top + box[1] * height,
+			left + box[2] * width, top + box[3] * height))
+
+
+class ThresholdCalibrator:
+	"""Samples the OCR noise of a static target."""
+
+	def __init__(self, samples, margin=CALIBRATION_MARGIN):
+		"""
+		Args:
+			samples: Ratio samples to collect (one per result after the first)
+			margin: Distance of the proposed threshold below the noise floor
+		"""
+		self.samples = samples
+		self.margin = margin
+		self.ratios = []
+		self._previous = None
+		self._lock = threading.Lock()
+
+	@property
+	def done(self):
+		return len(self.ratios) >= self.samples
+
+	def add(self, text):
+		"""Account the comparison text of one result."""
+		with self._lock:
+			if self._previous is not None:
+				self.ratios.append(SequenceMatcher(None, self._previous, text).ratio())
+			self._previous = text
+
+	@property
+	def noiseFloor(self):
+		"""Lowest ratio between consecutive results, None before two results."""
+		return min(self.ratios) if self.ratios else None
+
+	def proposal(self):
+		"""Threshold just below the noise floor.
+
+		Returns:
+			float or None: Proposed threshold, None with too few samples or if
+				the screen changed during calibration
+		"""
+		if len(self.ratios) < CALIBRATION_MIN_SAMPLES:
+			return None
+		floor = self.noiseFloor
+		if floor < CALIBRATION_MIN_FLOOR:
+			return None
+		return min(CALIBRATION_MAX_THRESHOLD, math.floor((floor - self.margin) * 100) / 100.0)
@@ -0,0 +1,113 @@
+"""
+Compare LION recognizer backends on the same recorded frames.
+
+Feeds every frame stored in a session recording (recorded with pixels) to
+each selected backend, one at a time, and reports recognition latency, the
+backend's cost estimate after learning from the run, and how closely its text
+matches the text recorded in the session. The stub backend is loaded with the
+recorded texts, so it reproduces them exactly and serves as a reference.
+
+Headless, "uwp" is the stand-in engine from nvdaStubs.py.
+
+Usage:
+	python benchmarks/benchOcrLoop.py --scenario typical --record s.lionrec --record-pixels
+	python benchmarks/benchBackends.py s.lionrec --backend uwp --backend stub
+"""
+
+import argparse
+import difflib
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+def loadFrames(lion, path):
+	"""Return [(pixels, width, height, fingerprint, text)] of records with pixels."""
+	frames = []
+	for record in lion.lionRecorder.readRecords(path):
+		pixels = lion.lionRecorder.decodePixels(record)
+		if pixels is not None:
+			frames.append((bytearray(pixels), record["pw"], record["ph"], record.get("fp"), record.get("text")))
+	return frames
+
+
+def runBackend(lion, backend, frames, timeout):
+	contentRecog = sys.modules["contentRecog"]
+	recognizer = backend.create()
+	latencies = []
+	agreement = []
+	failures = 0
+	for pixels, width, height, _fingerprint, expected in frames:
+		done = threading.Event()
+		outcome = {}
+
+		def onResult(result):
+			outcome["end"] = time.perf_counter()
+			outcome["result"] = result
+			done.set()
+
+		imgInfo = contentRecog.RecogImageInfo(0, 0, width, height, 1)
+		start = time.perf_counter()
+		recognizer.recognize(pixels, imgInfo, onResult)
+		result = outcome.get("result") if done.wait(timeout) else None
+		if result is None or isinstance(result, Exception):
+			failures += 1
+			continue
+		seconds = outcome["end"] - start
+		latencies.append(seconds)
+		backend.observe(width, height, seconds)
+		text = result.makeTextInfo(None, "all").text
+		if expected is not None:
+			agreement.append(difflib.SequenceMatcher(None, expected, text).ratio())
+	width, height = frames[0][1], frames[0][2]
+	return {
+		"backend": backend.name,
+		"frames": len(latencies),
+		"failures": failures,
+		"meanMs": sum(latencies) / len(latencies) * 1000.0 if latencies else 0.0,
+		"p95Ms": benchOcrLoop.percentile(latencies, 95) * 1000.0,
+		"estimateMs": backend.costEstimate(width, height) * 1000.0,
+		"agreement": sum(agreement) / len(agreement) if agreement else 0.0,
+	}
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("recording", help="session recording made with pixels")
+	parser.add_argument("--backend", action="append", help="backend to run (repeatable, default: all)")
+	parser.add_argument("--latency", type=float, default=0.05, help="stand-in engine latency in seconds")
+	parser.add_argument("--timeout", type=float, default=10.0, help="seconds to wait for one result")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	nvdaStubs.world.reset()
+	nvdaStubs.world.recognizeLatency = args.latency
+	frames = loadFrames(lion, args.recording)
+	if not frames:
+		print(f"{args.recording} has no frames with pixels (record with --record-pixels)")
+		return 1
+	backends = lion.lionBackends
+	stub = backends.getBackend("stub")
+	stub.texts.update((fp, text) for _p, _w, _h, fp, text in frames if fp and text is not None)
+
+	names = args.backend or [backend.name for backend in backends.availableBackends(includeTestOnly=True)]
+	print(f"{len(frames)} frames, {frames[0][1]}x{frames[0][2]}")
+	for name in names:
+		backend = backends.getBackend(name)
+		if backend is None or not backend.isAvailable():
+			print(f"{name:8} not available")
+			continue
+		result = runBackend(lion, backend, frames, args.timeout)
+		print(f"{name:8} frames={result['frames']:4} failures={result['failures']} "
+			f"mean={result['meanMs']:7.1f}ms p95={result['p95Ms']:7.1f}ms "
+			f"estimate={result['estimateMs']:7.1f}ms agreement={result['agreement']:.3f}")
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Headless check of LION's threshold calibration.
+
+Scans a static fake screen whose recognition randomly misreads a character,
+with a threshold of 1.0 so every misreading is spoken. Calibration then
+samples the similarity of consecutive results and saves a threshold below
+that noise floor. Fails if noise is still spoken afterwards or if a real
+change of one line is no longer spoken.
+
+Usage:
+	python benchmarks/benchCalibrate.py --noise 0.5 --samples 15
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--noise", type=float, default=0.5, help="probability of a misread character per result")
+	parser.add_argument("--samples", type=int, default=15, help="calibrationFrames")
+	parser.add_argument("--scan", type=float, default=2.0, help="seconds scanned before and after")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	world = nvdaStubs.world
+	world.reset()
+	settings = {"interval": 0.1, "target": 1, "latency": 0.02, "cpu": 0.0, "churn": 0, "noise": args.noise,
+		"config": {"threshold": 1.0, "calibrationFrames": args.samples}}
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	conf = sys.modules["config"].conf["lion"]
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	plugin.script_ReadLiveOcr(None)
+	time.sleep(args.scan)
+	before = world.counters["spoken"]
+	check(before > 1, f"noise spoken {before} times with threshold 1.0")
+
+	plugin.script_calibrateThreshold(None)
+	deadline = time.perf_counter() + args.samples * settings["interval"] * 3 + 5.0
+	while plugin._calibration is not None and time.perf_counter() < deadline:
+		time.sleep(0.05)
+	check(plugin._calibration is None, "calibration finished")
+	threshold = conf["threshold"]
+	check(lion.lionTuning.CALIBRATION_MIN_FLOOR <= threshold < 1.0, f"threshold saved: {threshold}")
+
+	world.counters.clear()
+	time.sleep(args.scan)
+	after = world.counters["spoken"]
+	check(after == 0, f"noise spoken {after} times after calibration")
+
+	text, _changeTime = world.screen.snapshot()
+	lines = text.split("\n")
+	lines[0] = "a different first line appears"
+	world.screen.setText("\n".join(lines))
+	time.sleep(1.0)
+	check(world.counters["spoken"] > after, "a changed line is still spoken")
+
+	plugin.script_ReadLiveOcr(None)
+	plugin.terminate()
+	nvdaStubs.drainSpeech()
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,166 @@
+"""
+Check LION's capture buffer pool: steady-state scanning allocates no frames.
+
+Part one exercises lionCapture.CapturePool directly: slots are reused by
+size, one idle slot is kept per size, idle bytes are capped (least recently
+released size dropped first), idle slots expire, and slots in use are never
+handed out twice.
+
+Part two scans through the plugin with the stand-in capture and recognizer
+(nvdaStubs): once allocating a frame per capture (buffer reuse off) and once
+with the pool, then with a slow recognizer and several frames in flight, and
+finally with mosaic batching. It counts frames and screen bitmaps created
+against captures, checks that no buffer was overwritten while the recognizer
+still read it, that every announcement is a complete screen text, and that
+every slot is returned once scanning stopped and the callbacks ran, without
+the pool keeping their buffers.
+
+Usage:
+	python benchmarks/benchCapturePool.py --seconds 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+# name, settings, reuse buffers
+SCENARIOS = (
+	("allocating", {"interval": 0.1, "target": 2, "latency": 0.05, "cpu": 0.0, "churn": 0.5}, False),
+	("pooled", {"interval": 0.1, "target": 2, "latency": 0.05, "cpu": 0.0, "churn": 0.5}, True),
+	("slow", {"interval": 0.05, "target": 2, "latency": 0.4, "cpu": 0.0, "churn": 0.5,
+		"config": {"maxInFlight": 3}}, True),
+	("mosaic", {"interval": 0.1, "target": 2, "latency": 0.05, "cpu": 0.0, "churn": 0.5,
+		"config": {"targets": [2, 3], "mosaic": True}}, True),
+)
+
+
+def poolUnit(lion, check):
+	made = []
+	capture = lion.lionCapture
+	slotBytes = 100 * 50 * capture.BYTES_PER_PIXEL * 2
+	pool = capture.CapturePool(lambda width, height: made.append((width, height)) or (width, height),
+		maxIdleBytes=slotBytes * 2, idleSeconds=0.2)
+	first = pool.acquire(100, 50)
+	first.pixels = bytearray(100 * 50 * 4)
+	pool.release(first)
+	again = pool.acquire(100, 50)
+	check(again is first and pool.reused == 1 and len(made) == 1, "released slot is reused for the same size")
+	other = pool.acquire(100, 50)
+	check(other is not first and pool.inUse == 2, "a slot in use is not handed out again")
+	other.pixels = bytearray(100 * 50 * 4)
+	pool.release(again)
+	pool.release(other)
+	check(pool.dropped == 1 and pool.freeBytes() == slotBytes,
+		f"one idle slot kept per size ({pool.describe()})")
+	for width in (101, 102):
+		slot = pool.acquire(width, 50)
+		slot.pixels = bytearray(width * 50 * 4)
+		pool.release(slot)
+	check(pool.freeBytes() <= slotBytes * 2 + 2 * 50 * 4 * 2,
+		f"idle bytes capped, least recently released size dropped first ({pool.describe()})")
+	reused = pool.reused
+	pool.release(pool.acquire(100, 50))
+	check(pool.reused == reused, "the dropped size is allocated again")
+	big = pool.acquire(1000, 1000)
+	big.pixels = bytearray(1000 * 1000 * 4)
+	pool.release(big)
+	check(pool.acquire(1000, 1000) is big, "the slot released last is kept even above the cap")
+	pool.release(big)
+	time.sleep(0.3)
+	pool.trim()
+	check(pool.freeBytes() == 0, f"idle slots dropped after idleSeconds ({pool.describe()})")
+	late = pool.acquire(100, 50)
+	late.pixels = bytearray(100 * 50 * 4)
+	pool.release(pool.acquire(200, 50))
+	pool.clear()
+	check(pool.inUse == 1 and not pool.freeBytes(), f"clear drops idle slots ({pool.describe()})")
+	pool.release(late)
+	check(pool.inUse == 0 and not pool.freeBytes(), "slots released after clear are dropped")
+
+
+def runScenario(lion, name, settings, reuse, seconds, check):
+	world = nvdaStubs.world
+	world.reset()
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	plugin._reuseCaptureBuffers = reuse
+	peakInUse = peakIdle = 0
+	plugin.script_ReadLiveOcr(None)
+	end = time.perf_counter() + seconds
+	while time.perf_counter() < end:
+		peakInUse = max(peakInUse, plugin._capturePool.inUse + plugin._mosaicPool.inUse)
+		peakIdle = max(peakIdle, plugin._capturePool.freeBytes() + plugin._mosaicPool.freeBytes())
+		time.sleep(0.005)
+	plugin.script_ReadLiveOcr(None)
+	# Let the recognitions in flight call back
+	time.sleep(settings["latency"] * 2 + 0.2)
+	nvdaStubs.drainSpeech()
+	counters = world.counters
+	pools = {"capture": plugin._capturePool, "mosaic": plugin._mosaicPool}
+	screenTexts = {world.screen.textFor(generation) for generation in range(world.screen.generation() + 1)}
+	entries = []
+	entry = plugin._history.latest()
+	while entry is not None:
+		entries.append(entry)
+		entry = plugin._history.previous(entry.id)
+	wrong = [entry for entry in entries if entry.text not in screenTexts]
+	print(f"{name:10} captures={counters['captures']:4} frames allocated={counters['frameAllocations']:4} "
+		f"screen bitmaps={counters['screenBitmaps']:3} recognitions={counters['recognitions']:4} "
+		f"peak in use={peakInUse} peak idle={peakIdle} announcements={len(entries)}")
+	for label, pool in pools.items():
+		print(f"{'':10} {label} pool: {pool.describe()}")
+	inUse = sum(pool.inUse for pool in pools.values())
+	idleBytes = sum(pool.freeBytes() for pool in pools.values())
+	plugin.terminate()
+
+	check(counters["captures"] > 10, f"{name}: scanned ({counters['captures']} captures)")
+	check(not counters["overwrittenFrames"],
+		f"{name}: no buffer reused while recognized ({counters['overwrittenFrames']} were)")
+	check(entries and not wrong, f"{name}: every announcement is a complete screen text ({len(wrong)} are not)")
+	check(inUse == 0, f"{name}: every slot returned after the callbacks ({inUse} still in use)")
+	maxIdle = 2 * lion.lionCapture.MAX_IDLE_BYTES
+	check(peakIdle <= maxIdle, f"{name}: idle buffers stay within the caps ({peakIdle} bytes)")
+	check(idleBytes == 0, f"{name}: no buffers kept once scanning stopped ({idleBytes} bytes)")
+	return counters["captures"], counters["frameAllocations"], counters["screenBitmaps"], peakInUse
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--seconds", type=float, default=3.0, help="run time of each scenario")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	poolUnit(lion, check)
+	# Slots ever created with one target: the one reused, plus one while the next capture overlaps
+	bound = 2
+	results = {}
+	for name, settings, reuse in SCENARIOS:
+		results[name] = runScenario(lion, name, settings, reuse, args.seconds, check)
+	captures, frames, _bitmaps, _peak = results["allocating"]
+	check(frames >= captures, f"allocating: one frame per capture ({frames} for {captures})")
+	captures, frames, bitmaps, _peak = results["pooled"]
+	check(frames <= bound and bitmaps <= bound,
+		f"pooled: {frames} frames and {bitmaps} bitmaps for {captures} captures (at most {bound})")
+	captures, frames, bitmaps, peak = results["slow"]
+	check(peak > 1 and frames <= peak + 1,
+		f"slow: {peak} slots in flight at most, {frames} frames for {captures} captures")
+	captures, frames, bitmaps, _peak = results["mosaic"]
+	check(frames <= 2 * bound and bitmaps <= 2 * bound,
+		f"mosaic: {frames} frames and {bitmaps} bitmaps for {captures} area captures")
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
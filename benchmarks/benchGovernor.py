@@ -0,0 +1,116 @@
+"""
+Headless check of LION's idle and lock-screen governor.
+
+Replaces the Windows idle/lock probes with FakeConditions and drives the real
+scan loop through active, locked, unlocked, idle and input phases, checking
+that no recognition happens while suspended, that idle scanning slows to
+idleInterval, and how quickly scanning resumes.
+
+Usage:
+	python benchmarks/benchGovernor.py --phase 2
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+class FakeConditions:
+	"""ActivityConditions driven by the benchmark."""
+
+	def __init__(self):
+		self.idle = 0.0
+		self.locked = False
+		self.displayOff = False
+		self.sleepMode = False
+
+	def idleSeconds(self):
+		return self.idle
+
+	def isLocked(self):
+		return self.locked
+
+	def isDisplayOff(self):
+		return self.displayOff
+
+	def isSleepMode(self):
+		return self.sleepMode
+
+
+def recognitionsDuring(world, seconds):
+	start = world.counters["recognitions"]
+	time.sleep(seconds)
+	return world.counters["recognitions"] - start
+
+
+def resumeDelay(world, timeout=3.0):
+	"""Seconds until the next recognition completes."""
+	start = world.counters["recognitions"]
+	begin = time.perf_counter()
+	while world.counters["recognitions"] == start:
+		if time.perf_counter() - begin > timeout:
+			return None
+		time.sleep(0.002)
+	return time.perf_counter() - begin
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--phase", type=float, default=2.0, help="seconds per phase")
+	parser.add_argument("--interval", type=float, default=0.2, help="scan interval in seconds")
+	parser.add_argument("--latency", type=float, default=0.02, help="fake recognizer latency in seconds")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	world = nvdaStubs.world
+	world.reset()
+	idleInterval = 1.0
+	settings = {"interval": args.interval, "target": 1, "latency": args.latency, "cpu": 0.0, "churn": 0,
+		"config": {"idleAfter": 60, "idleInterval": idleInterval}}
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	conditions = FakeConditions()
+	plugin._governor.conditions = conditions
+	maxResume = lion.lionGovernor.GOVERNOR_POLL + args.latency + 0.1
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	plugin.script_ReadLiveOcr(None)
+	active = recognitionsDuring(world, args.phase)
+	check(active >= args.phase / args.interval * 0.7, f"active: {active} recognitions")
+
+	for condition in ("locked", "displayOff", "sleepMode"):
+		setattr(conditions, condition, True)
+		time.sleep(args.interval + args.latency)  # Let the last scan finish
+		suspended = recognitionsDuring(world, args.phase)
+		check(suspended == 0, f"{condition}: {suspended} recognitions ({plugin._governor.describe()})")
+		setattr(conditions, condition, False)
+		delay = resumeDelay(world)
+		check(delay is not None and delay <= maxResume,
+			f"{condition} cleared: resumed after {delay if delay is None else round(delay * 1000)} ms")
+
+	conditions.idle = 120.0
+	time.sleep(args.interval + args.latency)
+	idle = recognitionsDuring(world, args.phase * 2)
+	check(idle <= args.phase * 2 / idleInterval + 1, f"idle: {idle} recognitions in {args.phase * 2:.0f} s")
+	conditions.idle = 0.0
+	delay = resumeDelay(world)
+	check(delay is not None and delay <= maxResume,
+		f"input: resumed after {delay if delay is None else round(delay * 1000)} ms")
+
+	plugin.script_ReadLiveOcr(None)
+	plugin.terminate()
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Headless check of LION's announcement history.
+
+Fills lionHistory.AnnouncementHistory with screen-like announcements (mostly
+repeated lines, one changing line each), then checks that the estimated size
+stays under the byte cap, that repeated lines are stored once, and that
+stepping back and forward through one profile's entries returns them in order.
+
+With --search, the history is indexed and sized to keep every entry; searches
+for words of old, recent and missing messages must return the right entries
+within --max-search-ms, and the index must stay within the cap after eviction.
+
+Usage:
+	python benchmarks/benchHistory.py --entries 50000 --max-bytes 1048576
+	python benchmarks/benchHistory.py --entries 50000 --search --max-bytes 100000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+
+
+WORDS = ("ticket", "refund", "invoice", "printer", "password", "driver", "license", "backup",
+	"network", "update", "account", "server", "monitor", "keyboard", "battery", "warranty")
+
+
+def screenText(n, lines):
+	"""A chat-like screen: fixed lines plus one line that changes every time."""
+	message = f"Message number {n} about {WORDS[n % len(WORDS)]} {WORDS[n * 7 % len(WORDS)]} case{n}"
+	return "\n".join([f"Support chat line {i}" for i in range(lines - 1)] + [message])
+
+
+def timedSearch(history, query, **kwargs):
+	start = time.perf_counter()
+	results = history.search(query, **kwargs)
+	return results, (time.perf_counter() - start) * 1000.0
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--entries", type=int, default=50000, help="announcements to add")
+	parser.add_argument("--lines", type=int, default=30, help="lines per announcement")
+	parser.add_argument("--max-bytes", type=int, default=1024 * 1024, help="history byte cap")
+	parser.add_argument("--search", action="store_true", help="index the history and time searches")
+	parser.add_argument("--max-search-ms", type=float, default=100.0, help="slowest acceptable search")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	history = lion.lionHistory.AnnouncementHistory(args.max_bytes, indexed=args.search)
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	start = time.perf_counter()
+	rawBytes = 0
+	for n in range(args.entries):
+		text = screenText(n, args.lines)
+		rawBytes += sys.getsizeof(text)
+		history.add(text, "chat" if n % 2 else "notepad", 1)
+	seconds = time.perf_counter() - start
+	print(f"added {args.entries} entries in {seconds * 1000:.0f} ms "
+		f"({seconds * 1e6 / max(1, args.entries):.1f} us each)")
+	print(f"kept {len(history)} entries, {history.uniqueLines} distinct lines, "
+		f"{history.bytes} bytes (evicted {history.evicted})")
+	if history.index is not None:
+		print(f"index: {len(history.index)} words, {history.index.bytes} bytes")
+	check(history.bytes <= args.max_bytes, f"size {history.bytes} within cap {args.max_bytes}")
+	check(history.uniqueLines <= len(history) + args.lines,
+		f"repeated lines stored once ({history.uniqueLines} distinct lines)")
+	if len(history):
+		# Same entries kept as whole texts
+		plainBytes = (rawBytes / args.entries + lion.lionHistory.ENTRY_OVERHEAD) * len(history)
+		storedBytes = history.bytes - (history.index.bytes if history.index is not None else 0)
+		print(f"compaction: {plainBytes / max(1, storedBytes):.1f}x smaller than storing whole texts")
+
+	latest = history.latest("chat")
+	check(latest is not None and latest.text == screenText(args.entries - 1, args.lines),
+		"latest chat entry is the last one added")
+	entry, steps = latest, 0
+	while steps < 5 and entry is not None:
+		previous = history.previous(entry.id, "chat")
+		if previous is None:
+			break
+		check(previous.profile == "chat" and previous.id < entry.id, f"step back to entry {previous.id}")
+		entry, steps = previous, steps + 1
+	forward = history.next(entry.id, "chat")
+	check(forward is not None and forward.id > entry.id and forward.profile == "chat",
+		"step forward again")
+	check(history.next(latest.id, "chat") is None, "no entry after the latest")
+	check(history.previous(None, "notepad").profile == "notepad", "review starts at the newest entry")
+
+	if args.search:
+		oldest = history.get(history.latest().id - len(history) + 1)
+		queries = [
+			("oldest case", f"case{oldest.id - 1}", {}, [oldest.id]),
+			("recent case", f"case{args.entries - 2}", {}, [args.entries - 1]),
+			("two words", f"number {args.entries - 1} {WORDS[(args.entries - 1) % len(WORDS)]}", {},
+				[args.entries]),
+			("prefix", f"case{args.entries - 1}", {"profile": "chat"}, [args.entries]),
+			("common word", "support chat", {"limit": 100}, None),
+			("missing", "nonexistentword", {}, []),
+		]
+		for name, query, kwargs, expected in queries:
+			results, ms = timedSearch(history, query, **kwargs)
+			ids = [entry.id for entry in results]
+			if expected is None:
+				ok = len(ids) == kwargs["limit"] and ids == sorted(ids, reverse=True)
+			else:
+				ok = ids[:len(expected)] == expected if expected else not ids
+			check(ok and ms <= args.max_search_ms,
+				f"search {name!r} ({query}): {len(ids)} results in {ms:.1f} ms")
+		# Evict everything through a small cap: the index must shrink with the history
+		history.maxBytes = 64 * 1024
+		history.add(screenText(args.entries, args.lines), "chat", 1)
+		check(history.bytes <= history.maxBytes and history.index.bytes < history.bytes,
+			f"index follows eviction ({history.index.bytes} of {history.bytes} bytes, "
+			f"{len(history.index)} words)")
+		results, _ms = timedSearch(history, f"case{oldest.id - 1}")
+		check(not results, "evicted entries are no longer found")
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Validation of LION's end-to-end "pixel change to speech" latency measurement.
+
+A fake screen changes its text at known instants (at varying offsets within
+the scan interval). The true delay from each change to the ui.message call is
+measured outside the addon and compared with the capture-to-speech latency the
+addon reports (perf statistics, "endToEnd"). Since the addon cannot know when
+pixels changed before its capture, for every percentile:
+
+	reported <= true <= reported + interval (+ tolerance)
+
+With --focus-event each change is accompanied by a focus event, which should
+trigger an immediate rescan: true latency then approaches the recognizer
+latency instead of half the interval.
+
+Usage:
+	python benchmarks/benchLatency.py --changes 20 --interval 0.5 --latency 0.1
+	python benchmarks/benchLatency.py --interval 3 --focus-event
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--changes", type=int, default=20, help="number of screen changes")
+	parser.add_argument("--interval", type=float, default=0.5, help="scan interval in seconds")
+	parser.add_argument("--latency", type=float, default=0.1, help="fake recognizer latency in seconds")
+	parser.add_argument("--focus-event", action="store_true",
+		help="fire a focus event with each change, as when a new window appears")
+	parser.add_argument("--tolerance", type=float, default=0.05,
+		help="slack in seconds for scheduling jitter")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	world = nvdaStubs.world
+	world.reset()
+	settings = {"interval": args.interval, "target": 1, "latency": args.latency, "cpu": 0.0, "churn": 0,
+		"config": {"perfStats": True}}
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	world.screen.setText("idle screen")
+	plugin.script_ReadLiveOcr(None)
+	time.sleep(args.interval * 2 + args.latency)
+	nvdaStubs.drainSpeech()
+	# Discard the announcement of the initial screen
+	plugin._perf.reset()
+
+	truth = []
+	for k in range(args.changes):
+		# Spread change instants over the scan interval
+		time.sleep(args.interval * ((k * 7) % 10) / 10.0)
+		text = world.screen.textFor(k)
+		world.screen.setText(text)
+		changedAt = time.perf_counter()
+		if args.focus_event:
+			plugin.event_gainFocus(sys.modules["api"].getFocusObject(), lambda: None)
+		deadline = changedAt + args.interval + args.latency + 2.0
+		spokenAt = None
+		while spokenAt is None and time.perf_counter() < deadline:
+			time.sleep(0.002)
+			spokenAt = next((t for t, spokenText in world.spoken if spokenText == text), None)
+		if spokenAt is None:
+			print(f"change {k} was never spoken")
+			return 1
+		truth.append(spokenAt - changedAt)
+	plugin.script_ReadLiveOcr(None)
+	plugin.terminate()
+
+	reported = plugin._perf.snapshot("global")["latencies"].get("endToEnd", {})
+	failures = 0
+	print(f"{'':6} {'true':>9} {'reported':>9}")
+	for p in lion.lionPerf.LATENCY_PERCENTILES:
+		trueMs = benchOcrLoop.percentile(truth, p) * 1000.0
+		reportedMs = reported.get(f"p{p}Ms", 0.0)
+		ok = (reportedMs <= trueMs + args.tolerance * 1000.0
+			and trueMs <= reportedMs + (args.interval + args.tolerance) * 1000.0)
+		failures += not ok
+		print(f"p{p:<5} {trueMs:8.1f}ms {reportedMs:8.1f}ms {'ok' if ok else 'MISMATCH'}")
+	if reported.get("count") != len(truth):
+		print(f"reported {reported.get('count')} samples for {len(truth)} changes")
+		failures += 1
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,103 @@
+"""
+Headless check of LION's OCR start/stop lifecycle with a slow recognizer.
+
+With a fake recognizer taking several seconds per frame, verifies that:
+
+- toggling OCR off while a recognition is in flight returns immediately and
+  the late result is dropped (nothing is spoken, "staleResults" is counted);
+- rapid off/on toggles never block, and abandoned loop threads exit;
+- terminate() returns immediately while OCR is running.
+
+Usage:
+	python benchmarks/benchLifecycle.py --latency 3
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+def timed(func, *args):
+	start = time.perf_counter()
+	func(*args)
+	return time.perf_counter() - start
+
+
+def waitFor(condition, timeout):
+	deadline = time.perf_counter() + timeout
+	while not condition():
+		if time.perf_counter() > deadline:
+			return False
+		time.sleep(0.005)
+	return True
+
+
+def contentSpoken(world):
+	return [text for _t, text in world.spoken if not text.startswith("lion ")]
+
+
+def loopThreads(lion):
+	prefix = f"{lion.ADDON_NAME}Ocr"
+	return [thread for thread in threading.enumerate() if thread.name.startswith(prefix)]
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--latency", type=float, default=3.0, help="fake recognizer latency in seconds")
+	parser.add_argument("--max-toggle", type=float, default=0.05,
+		help="maximum seconds a toggle or terminate may take")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	world = nvdaStubs.world
+	settings = {"interval": 0.2, "target": 1, "latency": args.latency, "cpu": 0.0, "churn": 0,
+		"config": {"perfStats": True}}
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	# Stop while a slow recognition is in flight
+	world.reset()
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	world.screen.setText("text that must never be spoken")
+	check(timed(plugin.script_ReadLiveOcr, None) < args.max_toggle, "start returns immediately")
+	check(waitFor(lambda: world.counters["recognizeCalls"] > 0, 2.0), "recognition submitted")
+	elapsed = timed(plugin.script_ReadLiveOcr, None)
+	check(elapsed < args.max_toggle, f"stop with recognition in flight took {elapsed * 1000:.1f} ms")
+	check(waitFor(lambda: plugin.ocrState == lion.OCR_STOPPED, 1.0), "state reaches stopped")
+	check(waitFor(lambda: world.counters["recognitions"] > 0, args.latency + 2.0), "late result delivered")
+	nvdaStubs.drainSpeech()
+	check(not contentSpoken(world), "late result not spoken")
+	stale = plugin._perf.snapshot("global")["counters"].get("staleResults", 0)
+	check(stale > 0, f"late results ignored by generation ({stale})")
+	plugin.terminate()
+
+	# Rapid toggles
+	world.reset()
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	worst = max(timed(plugin.script_ReadLiveOcr, None) for _i in range(9))
+	check(worst < args.max_toggle, f"slowest of 9 rapid toggles took {worst * 1000:.1f} ms")
+	check(plugin.ocrState in (lion.OCR_STARTING, lion.OCR_RUNNING), f"odd toggle count leaves OCR on ({plugin.ocrState})")
+	check(waitFor(lambda: len(loopThreads(lion)) == 1, 2.0),
+		f"abandoned loops exited ({len(loopThreads(lion))} loop threads alive)")
+
+	# Terminate while running
+	elapsed = timed(plugin.terminate)
+	check(elapsed < args.max_toggle, f"terminate took {elapsed * 1000:.1f} ms")
+	check(waitFor(lambda: not loopThreads(lion), 2.0), "loop thread exited after terminate")
+
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Memory growth check for the LION OCR scan loop.
+
+Runs the real scan loop headless for many iterations with a fast fake engine
+and changing screen text, sampling traced Python memory (tracemalloc) and the
+plugin's own getMemoryReport() at checkpoints. After warm-up, traced memory
+must stay flat: the run fails if it grows by more than --max-growth bytes.
+
+Usage:
+	python benchmarks/benchMemory.py --iterations 5000
+	python benchmarks/benchMemory.py --iterations 20000 --trace-report growth.txt
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+# The announcement history grows up to its byte cap by design; a small cap is
+# reached during warm-up so it does not count as growth
+SETTINGS = {"interval": 0.0, "target": 1, "latency": 0.0, "cpu": 0.0, "churn": 0.01,
+	"config": {"historyBytes": 32 * 1024}}
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--iterations", type=int, default=5000, help="scan iterations to run")
+	parser.add_argument("--checkpoints", type=int, default=5, help="number of memory samples")
+	parser.add_argument("--max-growth", type=int, default=256 * 1024,
+		help="allowed traced memory growth in bytes between the first and last checkpoint")
+	parser.add_argument("--trace-report", help="write a tracemalloc diff of the run to this file")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	world = nvdaStubs.world
+	world.allocateFrames = False
+	world.keepSpeech = False
+	world.reset()
+	plugin = benchOcrLoop.startPlugin(lion, SETTINGS)
+	tracemalloc.start(10)
+	trace = lion.lionMemory.AllocationTrace()
+	plugin.script_ReadLiveOcr(None)
+
+	# Warm-up: let caches and the state store reach their steady size
+	warmup = max(100, args.iterations // 10)
+	while world.counters["captures"] < warmup:
+		time.sleep(0.01)
+	trace.start()
+	samples = []
+	step = args.iterations // args.checkpoints
+	for n in range(1, args.checkpoints + 1):
+		while world.counters["captures"] < warmup + n * step:
+			time.sleep(0.01)
+		current, _peak = tracemalloc.get_traced_memory()
+		report = plugin.getMemoryReport()
+		samples.append(current)
+		print(f"iteration {world.counters['captures']:7}: traced={current:10} "
+			+ " ".join(f"{name}={value}" for name, value in report.items()))
+	plugin.script_ReadLiveOcr(None)
+	diff = trace.stop()
+	nvdaStubs.drainSpeech()
+	plugin.terminate()
+
+	growth = samples[-1] - samples[0]
+	print(f"growth between first and last checkpoint: {growth} bytes")
+	if args.trace_report:
+		with open(args.trace_report, "w", encoding="utf-8") as f:
+			f.write(diff)
+	if growth > args.max_growth:
+		print("FAIL: memory grew beyond --max-growth")
+		print(diff)
+		return 1
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,150 @@
+"""
+Measure LION's mosaic batching: recognizer call overhead against batch size.
+
+Part one recognizes batches of 1 to --max-batch areas with a stub recognizer
+whose calls cost a fixed overhead plus a time per megapixel (defaults: the
+Windows OCR prior of lionBackends), once as separate calls and once as one
+mosaic (compose, recognize, split). It prints the time per area for both and
+checks that lionMosaic.planBatches only batches where the mosaic was faster.
+
+Part two scans two targets of different size through the plugin with the
+"mosaic" option and checks that they share one recognition and that each
+target is still announced with its own, complete text.
+
+Usage:
+	python benchmarks/benchMosaic.py --overhead-ms 50 --ms-per-megapixel 150
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+# (label, width, height) of the areas batched in part one
+AREAS = (
+	("line", 300, 40),
+	("panel", 400, 300),
+	("window", 800, 600),
+	("screen", 1920, 1080),
+)
+
+
+class CostRecognizer:
+	"""Synchronous stub recognizer: overhead plus time per megapixel, then word boxes.
+
+	The result holds the text of every area in the image, found the way the
+	fake engine finds them (marked rows, see nvdaStubs.FakeFrame).
+	"""
+
+	def __init__(self, overhead, perMegapixel):
+		self.overhead = overhead
+		self.perMegapixel = perMegapixel
+		self.calls = 0
+
+	def recognize(self, pixels, width, height):
+		self.calls += 1
+		time.sleep(self.overhead + self.perMegapixel * width * height / 1e6)
+		blocks = nvdaStubs.world.recognizedBlocks(pixels, width, height)
+		return nvdaStubs.FakeResult(None, blocks=blocks)
+
+
+def timeSeparate(recognizer, frames):
+	start = time.perf_counter()
+	texts = [recognizer.recognize(frame, frame.width, frame.height).text for frame in frames]
+	return time.perf_counter() - start, texts
+
+
+def timeMosaic(lion, recognizer, frames):
+	mosaic = lion.lionMosaic
+	start = time.perf_counter()
+	sizes = [(frame.width, frame.height) for frame in frames]
+	width, height, tops = mosaic.layout(sizes)
+	pixels = mosaic.compose(frames, sizes, tops, width, height)
+	result = recognizer.recognize(pixels, width, height)
+	parts = mosaic.splitResult(result, tops, [size[1] for size in sizes])
+	return time.perf_counter() - start, [part.text for part in parts]
+
+
+def overheadTable(lion, args, check):
+	backend = lion.lionBackends.RecognizerBackend()
+	backend.overheadSeconds = args.overhead_ms / 1000.0
+	backend.secondsPerMegapixel = args.ms_per_megapixel / 1000.0
+	recognizer = CostRecognizer(backend.overheadSeconds, backend.secondsPerMegapixel)
+	print(f"{'areas':14} {'n':>2} {'separate/area':>14} {'mosaic/area':>12} {'policy':>8}")
+	for label, width, height in AREAS:
+		for n in range(1, args.max_batch + 1):
+			frames = [nvdaStubs.FakeFrame(width, height, f"{label} {i} text", 0.0) for i in range(n)]
+			separate, separateTexts = timeSeparate(recognizer, frames)
+			mosaic, mosaicTexts = timeMosaic(lion, recognizer, frames)
+			batches = lion.lionMosaic.planBatches([(width, height)] * n, backend.costEstimate)
+			batched = bool(batches) and len(batches[0]) == n
+			print(f"{label:14} {n:2} {separate * 1000 / n:12.1f}ms {mosaic * 1000 / n:10.1f}ms "
+				f"{'mosaic' if batched else 'separate':>8}")
+			if mosaicTexts != separateTexts:
+				check(False, f"{label} x{n}: mosaic texts differ from separate ones")
+			if batched:
+				check(mosaic < separate, f"{label} x{n}: batched and the mosaic was faster")
+			elif n > 1 and mosaic < separate * 0.8:
+				check(False, f"{label} x{n}: not batched although the mosaic was much faster")
+
+
+def endToEnd(lion, args, check):
+	world = nvdaStubs.world
+	results = {}
+	for mosaic in (False, True):
+		world.reset()
+		settings = {"interval": 0.2, "target": 2, "latency": 0.05, "cpu": 0.0, "churn": 1.0,
+			"config": {"targets": [2, 3], "mosaic": mosaic}}
+		plugin = benchOcrLoop.startPlugin(lion, settings)
+		plugin.script_ReadLiveOcr(None)
+		time.sleep(args.seconds)
+		plugin.script_ReadLiveOcr(None)
+		nvdaStubs.drainSpeech()
+		history = plugin._history
+		entries = []
+		entry = history.latest()
+		while entry is not None:
+			entries.append(entry)
+			entry = history.previous(entry.id)
+		plugin.terminate()
+		results[mosaic] = (world.counters["recognizeCalls"], entries)
+		print(f"mosaic={mosaic!s:5} recognize calls={world.counters['recognizeCalls']} "
+			f"announcements={len(entries)}")
+	plainCalls, _plainEntries = results[False]
+	mosaicCalls, mosaicEntries = results[True]
+	check(0 < mosaicCalls <= plainCalls * 0.6, f"recognize calls {plainCalls} -> {mosaicCalls}")
+	targets = {entry.target for entry in mosaicEntries}
+	check(targets == {2, 3}, f"both targets announced ({sorted(targets)})")
+	screenTexts = {world.screen.textFor(generation) for generation in range(world.screen.generation() + 1)}
+	wrong = [entry for entry in mosaicEntries if entry.text not in screenTexts]
+	check(not wrong, f"every mosaic announcement is a complete screen text ({len(wrong)} are not)")
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--overhead-ms", type=float, default=50.0, help="fixed cost per recognize call")
+	parser.add_argument("--ms-per-megapixel", type=float, default=150.0, help="cost per recognized megapixel")
+	parser.add_argument("--max-batch", type=int, default=4, help="largest batch measured")
+	parser.add_argument("--seconds", type=float, default=3.0, help="run time of each end-to-end scan")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	overheadTable(lion, args, check)
+	endToEnd(lion, args, check)
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
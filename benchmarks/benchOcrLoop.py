@@ -0,0 +1,207 @@
+"""
+Headless benchmark of the LION OCR scan loop.
+
+Runs the real GlobalPlugin scan loop (toggle script, ocrLoop, OcrScreen and
+_handleOcrResult) against the stand-in NVDA modules in nvdaStubs, and reports:
+
+- frames/sec: screen captures per second
+- recognitions/sec: completed recognizer callbacks per second
+- CPU per frame: process CPU time per capture, excluding the fake engine's own cost
+- speech latency: screen change to ui.message dequeue, median and p95
+- backlog: highest number of recognitions queued in the engine at once
+
+Usage:
+	python benchmarks/benchOcrLoop.py                       # run all scenarios
+	python benchmarks/benchOcrLoop.py --scenario typical --seconds 10
+	python benchmarks/benchOcrLoop.py --json results.json   # save results
+	python benchmarks/benchOcrLoop.py --compare results.json --tolerance 0.25
+	python benchmarks/benchOcrLoop.py --scenario typical --record typical.lionrec
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+
+
+# name -> settings; latency/cpu are per recognition, churn is seconds between screen changes
+SCENARIOS = {
+	"fast": {"interval": 0.1, "target": 1, "latency": 0.02, "cpu": 0.005, "churn": 0.5},
+	"typical": {"interval": 1.0, "target": 1, "latency": 0.2, "cpu": 0.02, "churn": 2.0},
+	"slowEngine": {"interval": 0.5, "target": 1, "latency": 1.0, "cpu": 0.05, "churn": 1.5},
+	"focusTarget": {"interval": 0.2, "target": 3, "latency": 0.05, "cpu": 0.005, "churn": 1.0},
+	"static": {"interval": 0.2, "target": 1, "latency": 0.05, "cpu": 0.005, "churn": 0},
+	# Whole screen and focus scanned together; whole-screen recognition is slow
+	"multiTarget": {"interval": 0.2, "target": 1, "latency": 0.05, "cpu": 0.005, "churn": 1.0,
+		"config": {"targets": [1, 3]}, "areaLatency": {(1920, 1080): 1.5}},
+	# 0.2 s recognitions under a 25% budget: the 0.1 s interval stretches to 0.8 s
+	"cpuBudget": {"interval": 0.1, "target": 1, "latency": 0.2, "cpu": 0.005, "churn": 1.0,
+		"config": {"cpuBudget": 25}},
+	# Static text plus a ticking clock, speaking any change: the "digits" filter
+	# keeps the clock from re-reading the screen every second
+	"clock": {"interval": 0.2, "target": 1, "latency": 0.02, "cpu": 0.002, "churn": 0, "clock": True,
+		"config": {"threshold": 1.0}},
+	"clockFiltered": {"interval": 0.2, "target": 1, "latency": 0.02, "cpu": 0.002, "churn": 0, "clock": True,
+		"config": {"threshold": 1.0, "filters": ["line:Play", "digits"]}},
+	# Static text next to icons recognized as different garbage every frame: word
+	# filtering drops the short, low-confidence boxes before the text is compared
+	"icons": {"interval": 0.2, "target": 1, "latency": 0.02, "cpu": 0.002, "churn": 0, "icons": 2,
+		"config": {"threshold": 1.0}},
+	"iconsFiltered": {"interval": 0.2, "target": 1, "latency": 0.02, "cpu": 0.002, "churn": 0, "icons": 2,
+		"config": {"threshold": 1.0, "minWordConfidence": 0.5, "minWordHeight": 12}},
+	# Every change paints in over 0.6 s: without a stability requirement each
+	# partial frame is spoken, with one only the finished text
+	"reveal": {"interval": 0.1, "target": 1, "latency": 0.02, "cpu": 0.002, "churn": 1.5, "reveal": 0.6,
+		"config": {"threshold": 0.9}},
+	"revealStable": {"interval": 0.1, "target": 1, "latency": 0.02, "cpu": 0.002, "churn": 1.5, "reveal": 0.6,
+		"config": {"threshold": 0.9, "stableFrames": 3, "stableMs": 500}},
+}
+
+# Metrics where a higher value is a regression
+LOWER_IS_BETTER = ("cpuPerFrameMs", "latencyP50Ms", "latencyP95Ms")
+
+_UPDATE_RE = re.compile(r"update number (\d+)")
+
+
+def percentile(values, p):
+	if not values:
+		return 0.0
+	values = sorted(values)
+	index = min(len(values) - 1, max(0, int(round((len(values) - 1) * p / 100.0))))
+	return values[index]
+
+
+def speechLatencies(screen, spoken):
+	"""Screen change to speech delay for the first announcement of each change."""
+	latencies = []
+	seen = set()
+	for spokenAt, text in spoken:
+		match = _UPDATE_RE.search(text)
+		if not match:
+			continue
+		generation = int(match.group(1))
+		if generation in seen:
+			continue
+		seen.add(generation)
+		latencies.append(spokenAt - screen.changeTime(generation))
+	return latencies
+
+
+def startPlugin(lion, settings):
+	"""Create a plugin with the scenario settings applied to the global config."""
+	world = nvdaStubs.world
+	world.screen = nvdaStubs.FakeScreen(churnInterval=settings["churn"], clock=settings.get("clock", False),
+		reveal=settings.get("reveal", 0.0))
+	world.recognizeLatency = settings["latency"]
+	world.recognizeCpu = settings["cpu"]
+	world.ocrNoise = settings.get("noise", 0.0)
+	world.iconNoise = settings.get("icons", 0)
+	world.areaLatency = dict(settings.get("areaLatency", {}))
+	conf = sys.modules["config"].conf["lion"]
+	conf.clear()
+	conf.update(sys.modules["config"].conf.defaults("lion"))
+	conf["interval"] = settings["interval"]
+	conf["target"] = settings["target"]
+	for key, value in settings.get("config", {}).items():
+		conf[key] = value
+	return lion.GlobalPlugin()
+
+
+def runScenario(lion, name, settings, seconds, recordPath=None, recordPixels=False):
+	world = nvdaStubs.world
+	world.reset()
+	plugin = startPlugin(lion, settings)
+	if recordPath:
+		plugin.startRecording(recordPath, storePixels=recordPixels)
+	cpuStart = time.process_time()
+	wallStart = time.perf_counter()
+	plugin.script_ReadLiveOcr(None)
+	time.sleep(seconds)
+	plugin.script_ReadLiveOcr(None)
+	elapsed = time.perf_counter() - wallStart
+	# Let in-flight recognitions finish so their CPU is accounted for
+	time.sleep(settings["latency"] + settings["cpu"] + 0.1)
+	nvdaStubs.drainSpeech()
+	cpu = time.process_time() - cpuStart
+	plugin.terminate()
+
+	captures = world.counters["captures"]
+	recognitions = world.counters["recognitions"]
+	addonCpu = max(0.0, cpu - recognitions * settings["cpu"])
+	latencies = speechLatencies(world.screen, world.spoken)
+	return {
+		"scenario": name,
+		"seconds": round(elapsed, 2),
+		"framesPerSec": round(captures / elapsed, 2),
+		"recognitionsPerSec": round(recognitions / elapsed, 2),
+		"cpuPerFrameMs": round(addonCpu / captures * 1000.0, 3) if captures else 0.0,
+		"spoken": sum(1 for _t, text in world.spoken if _UPDATE_RE.search(text)),
+		"maxBacklog": world.counters["maxBacklog"],
+		"latencyP50Ms": round(percentile(latencies, 50) * 1000.0, 1),
+		"latencyP95Ms": round(percentile(latencies, 95) * 1000.0, 1),
+		"perArea": {name.split(":", 1)[1]: round(count / elapsed, 2)
+			for name, count in world.counters.items() if name.startswith("recognitions:")},
+	}
+
+
+def compare(results, baselinePath, tolerance):
+	"""Return a list of regression descriptions against a saved baseline."""
+	with open(baselinePath, "r", encoding="utf-8") as f:
+		baseline = {r["scenario"]: r for r in json.load(f)}
+	regressions = []
+	for result in results:
+		base = baseline.get(result["scenario"])
+		if not base:
+			continue
+		for metric in LOWER_IS_BETTER:
+			if base[metric] and result[metric] > base[metric] * (1.0 + tolerance):
+				regressions.append(f"{result['scenario']}.{metric}: {base[metric]} -> {result[metric]}")
+	return regressions
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--scenario", choices=sorted(SCENARIOS), action="append",
+		help="scenario to run (repeatable, default: all)")
+	parser.add_argument("--seconds", type=float, default=5.0, help="run time per scenario")
+	parser.add_argument("--json", help="write results to this JSON file")
+	parser.add_argument("--record", help="append a session recording of the runs to this file "
+		"(replay it with replaySession.py)")
+	parser.add_argument("--record-pixels", action="store_true",
+		help="store captured pixels in the recording (needed by benchBackends.py)")
+	parser.add_argument("--compare", help="baseline JSON file to check for regressions")
+	parser.add_argument("--tolerance", type=float, default=0.25,
+		help="allowed relative worsening before a metric counts as a regression")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	results = []
+	for name in args.scenario or sorted(SCENARIOS):
+		result = runScenario(lion, name, SCENARIOS[name], args.seconds, args.record, args.record_pixels)
+		results.append(result)
+		print(f"{name:13} fps={result['framesPerSec']:7.2f} rec/s={result['recognitionsPerSec']:7.2f} "
+			f"cpu/frame={result['cpuPerFrameMs']:7.3f}ms spoken={result['spoken']:4} "
+			f"backlog={result['maxBacklog']:3} "
+			f"latency p50={result['latencyP50Ms']:7.1f}ms p95={result['latencyP95Ms']:7.1f}ms")
+		if len(result["perArea"]) > 1:
+			print(" " * 14 + "rec/s per area: " + ", ".join(
+				f"{area}={rate}" for area, rate in sorted(result["perArea"].items())))
+
+	if args.json:
+		with open(args.json, "w", encoding="utf-8") as f:
+			json.dump(results, f, indent=2)
+	if args.compare:
+		regressions = compare(results, args.compare, args.tolerance)
+		for line in regressions:
+			print("REGRESSION " + line)
+		return 1 if regressions else 0
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
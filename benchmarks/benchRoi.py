@@ -0,0 +1,89 @@
+"""
+Headless check of LION's region of interest learning.
+
+Scans the whole fake screen, whose text occupies only its top left corner,
+learns the changing region, applies the proposed crop and compares the
+recognized area before and after. Fails if the learned crop does not cover
+every word box of the changing text.
+
+Usage:
+	python benchmarks/benchRoi.py --learn 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+import benchOcrLoop  # noqa: E402
+
+
+def recognizedAreas(world):
+	"""{(width, height): recognitions} from the fake engine counters."""
+	areas = {}
+	for name, count in world.counters.items():
+		if name.startswith("recognitions:"):
+			width, height = name.split(":", 1)[1].split("x")
+			areas[(int(width), int(height))] = count
+	return areas
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--learn", type=float, default=3.0, help="learning window in seconds")
+	parser.add_argument("--scan", type=float, default=2.0, help="seconds scanned before and after")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	world = nvdaStubs.world
+	world.reset()
+	settings = {"interval": 0.1, "target": 1, "latency": 0.02, "cpu": 0.0, "churn": 0.3,
+		"config": {"roiLearnSeconds": args.learn}}
+	plugin = benchOcrLoop.startPlugin(lion, settings)
+	failures = []
+
+	def check(ok, message):
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+
+	plugin.script_ReadLiveOcr(None)
+	time.sleep(args.scan)
+	before = recognizedAreas(world)
+	plugin.script_learnRegion(None)
+	deadline = time.perf_counter() + args.learn + 5.0
+	while plugin._roiProposal is None and time.perf_counter() < deadline:
+		time.sleep(0.05)
+	check(plugin._roiProposal is not None, f"crop proposed: {plugin._roiProposal}")
+	if plugin._roiProposal:
+		crop = plugin._roiProposal[1]
+		screen = nvdaStubs.RectLTWH(0, 0, world.screen.width, world.screen.height)
+		kept = plugin.cropRectLTWH(screen, crop)
+		# Every word the screen can show must stay inside the crop
+		words = [word for line in nvdaStubs.FakeResult(world.screen.textFor(123)).data for word in line]
+		uncovered = [word["text"] for word in words
+			if word["x"] < kept.left or word["y"] < kept.top
+			or word["x"] + word["width"] > kept.left + kept.width
+			or word["y"] + word["height"] > kept.top + kept.height]
+		check(not uncovered, f"crop {tuple(kept)} covers all changing words {uncovered or ''}")
+		plugin.script_learnRegion(None)
+		check(all(sys.modules["config"].conf["lion"][key] == value for key, value in crop.items()), "crop applied")
+		world.counters.clear()
+		time.sleep(args.scan)
+		after = recognizedAreas(world)
+		beforePixels = max(w * h for w, h in before) if before else 0
+		afterPixels = max(w * h for w, h in after) if after else 0
+		check(0 < afterPixels < beforePixels,
+			f"recognized area {beforePixels} -> {afterPixels} pixels "
+			f"({afterPixels * 100.0 / max(1, beforePixels):.1f}%)")
+	plugin.script_ReadLiveOcr(None)
+	plugin.terminate()
+	nvdaStubs.drainSpeech()
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,76 @@
+"""
+Measure what loading LION costs at NVDA startup.
+
+Each run starts a fresh Python process that installs the stand-in NVDA
+modules, imports the plugin package and creates the GlobalPlugin, reporting
+the plugin's own load times (module import and __init__). It also checks that
+loading does no work that can wait for first use: the settings GUI is not
+imported, the profiles directory is not created or listed and the screen size
+is not read.
+
+Usage:
+	python benchmarks/benchStartup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CHILD = """
+import json, os, sys
+sys.path.insert(0, {benchDir!r})
+import nvdaStubs
+listed = []
+realListdir = os.listdir
+os.listdir = lambda path=".": listed.append(path) or realListdir(path)
+lion = nvdaStubs.install()
+plugin = lion.GlobalPlugin()
+print(json.dumps({{
+	"import": plugin.loadTimes["import"],
+	"init": plugin.loadTimes["init"],
+	"guiImported": "lion.lionGui" in sys.modules,
+	"profilesDirCreated": os.path.exists(lion.PROFILES_DIR),
+	"profilesListed": any("profiles" in str(path) for path in listed),
+	"screenReads": nvdaStubs.world.counters["getSystemMetrics"],
+}}))
+plugin.terminate()
+"""
+
+
+def runOnce():
+	output = subprocess.run([sys.executable, "-c", CHILD.format(benchDir=BENCH_DIR)],
+		check=True, capture_output=True, text=True).stdout
+	return json.loads(output.strip().splitlines()[-1])
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("--runs", type=int, default=5, help="fresh processes to measure")
+	args = parser.parse_args(argv)
+
+	results = [runOnce() for _ in range(args.runs)]
+	imports = sorted(result["import"] * 1000.0 for result in results)
+	inits = sorted(result["init"] * 1000.0 for result in results)
+	print(f"import: median {imports[len(imports) // 2]:.1f} ms, min {imports[0]:.1f} ms, max {imports[-1]:.1f} ms")
+	print(f"init:   median {inits[len(inits) // 2]:.1f} ms, min {inits[0]:.1f} ms, max {inits[-1]:.1f} ms")
+	failures = []
+	for name, message in (
+		("guiImported", "settings GUI not imported"),
+		("profilesDirCreated", "profiles directory not created"),
+		("profilesListed", "profiles directory not listed"),
+		("screenReads", "screen size not read"),
+	):
+		ok = not any(result[name] for result in results)
+		print(f"{'ok  ' if ok else 'FAIL'} {message}")
+		if not ok:
+			failures.append(message)
+	print("PASS" if not failures else "FAIL")
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,652 @@
+"""
+Stand-in NVDA modules for running the LION scan loop headless.
+
+install() registers minimal fake versions of the NVDA modules imported by the
+addon (api, config, contentRecog, screenBitmap, winGDI, queueHandler, ui, wx, ...) in
+sys.modules, then imports the real plugin package from addon/globalPlugins.
+The fakes are driven by a FakeWorld holding a synthetic screen whose text
+changes at known instants, a fake OCR engine with configurable latency and
+CPU cost, and a speech log stamped when announcements are dequeued.
+
+Only the behaviour the addon relies on is modelled; this is not a general
+NVDA emulation layer.
+"""
+
+import builtins
+import collections
+import ctypes
+import logging
+import os
+import queue
+import re
+import sys
+import tempfile
+import threading
+import time
+import types
+import zlib
+
+
+ADDON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "addon", "globalPlugins")
+
+
+_WORDS = (
+	"alpha", "quartz", "meadow", "signal", "copper", "lantern", "orbit", "velvet", "harbor", "puzzle",
+	"thunder", "maple", "crystal", "engine", "saddle", "violet", "summit", "ripple", "cobalt", "falcon",
+	"ember", "glacier", "nectar", "pixel", "rocket", "timber", "walnut", "zephyr", "bramble", "cinder",
+)
+
+# What OCR makes of icons and small graphics
+_ICON_GLYPHS = ("@", "%", "|l", "~", "&", "=", "oO", "#", "*", "I")
+
+
+class RectLTWH(collections.namedtuple("RectLTWH", ("left", "top", "width", "height"))):
+	"""Stand-in for locationHelper.RectLTWH."""
+
+
+class FakeScreen:
+	"""Synthetic screen whose text changes every churnInterval seconds.
+
+	Each change produces a new numbered line so spoken text can be mapped back
+	to the instant it appeared on screen. With clock=True a last line shows the
+	seconds elapsed as a clock (recurring noise for the text filters). With
+	reveal > 0 each change is rendered progressively, one more line every
+	reveal / lines seconds (an animation or a slowly painting window).
+	"""
+
+	def __init__(self, width=1920, height=1080, churnInterval=1.0, lineCount=3, static=False, clock=False,
+			reveal=0.0):
+		self.width = width
+		self.height = height
+		self.churnInterval = churnInterval
+		self.lineCount = lineCount
+		self.static = static
+		self.clock = clock
+		self.reveal = reveal
+		self._start = time.perf_counter()
+		self._forced = None  # (text, changeTime) set by setText()
+		self._lock = threading.Lock()
+
+	def generation(self, now=None):
+		if self.static or not self.churnInterval:
+			return 0
+		now = time.perf_counter() if now is None else now
+		return int((now - self._start) / self.churnInterval)
+
+	def changeTime(self, generation):
+		"""Instant at which the given generation appeared on screen."""
+		return self._start + generation * self.churnInterval
+
+	def textFor(self, generation):
+		"""Text shown by a generation; consecutive generations share few characters."""
+		lines = []
+		for n in range(self.lineCount):
+			words = [_WORDS[(generation * 7 + n * 3 + i * 11) % len(_WORDS)] for i in range(6)]
+			lines.append(" ".join(words))
+		lines.append(f"update number {generation}")
+		return "\n".join(lines)
+
+	def setText(self, text):
+		"""Replace the screen content now (used by latency validation scenarios)."""
+		with self._lock:
+			self._forced = (text, time.perf_counter())
+
+	def snapshot(self):
+		"""Return (text, changeTime) of what is on screen right now."""
+		with self._lock:
+			if self._forced is not None:
+				return self._forced
+		now = time.perf_counter()
+		generation = self.generation(now)
+		text = self.textFor(generation)
+		if self.reveal:
+			lines = text.split("\n")
+			shown = 1 + int((now - self.changeTime(generation)) / self.reveal * len(lines))
+			text = "\n".join(lines[-shown:])
+		if self.clock:
+			elapsed = int(time.perf_counter() - self._start)
+			text += f"\nelapsed {elapsed // 3600:02}:{elapsed // 60 % 60:02}:{elapsed % 60:02}"
+		return text, self.changeTime(generation)
+
+
+class FakeFrame(bytearray):
+	"""Captured pixels: a buffer starting with the screen text, plus capture metadata.
+
+	Every row starts with a non-zero byte, so the rows of a frame copied into a
+	mosaic can be told from blank separator rows. With allocate=False only the
+	text bytes are stored, to keep runs cheap. Every new frame is counted in
+	world.counters["frameAllocations"].
+	"""
+
+	def __init__(self, width, height, text, changeTime, allocate=True):
+		encoded = text.encode("utf-8")
+		super().__init__(max(width * height * 4, len(encoded)) if allocate else len(encoded))
+		world.counters["frameAllocations"] += 1
+		self.width = width
+		self.height = height
+		self.allocated = allocate
+		self._markRows()
+		self[:len(encoded)] = encoded
+		self.text = text
+		self.changeTime = changeTime
+		self.captureTime = time.perf_counter()
+
+	def _markRows(self):
+		if self.allocated and self.width > 0 and self.height > 0:
+			self[:self.width * self.height * 4:self.width * 4] = b"\x01" * self.height
+
+	def fill(self, text, changeTime):
+		"""Capture again into this frame (GetDIBits into an existing buffer)."""
+		encoded = text.encode("utf-8")
+		if not self.allocated:
+			self[:] = encoded
+		else:
+			oldLength = len(self.text.encode("utf-8"))
+			self[:oldLength] = bytes(oldLength)
+			self._markRows()
+			self[:len(encoded)] = encoded
+		self.text = text
+		self.changeTime = changeTime
+		self.captureTime = time.perf_counter()
+
+
+class FakeTextInfo:
+	def __init__(self, text):
+		self.text = text
+
+
+class FakeResult:
+	"""Stand-in for contentRecog.LinesWordsResult.
+
+	data lays the words out in a fixed grid from the top left corner of the
+	frame: LINE_HEIGHT pixels per line, CHAR_WIDTH pixels per character.
+	Icon words (recognized graphics) follow as a last line of short boxes
+	with a low "confidence". A mosaic result has one block per area instead,
+	(top, height, text), each laid out from its top with lines squeezed to fit
+	its height.
+	"""
+
+	LINE_HEIGHT = 30
+	CHAR_WIDTH = 12
+	ICON_HEIGHT = 8
+	ICON_CONFIDENCE = 0.2
+
+	def __init__(self, text, icons=(), blocks=None):
+		self.blocks = blocks if blocks is not None else [(0, None, text)]
+		self.icons = tuple(icons)
+
+	@property
+	def text(self):
+		text = "\n".join(blockText for _top, _height, blockText in self.blocks)
+		if self.icons:
+			return text + "\n" + " ".join(self.icons)
+		return text
+
+	@property
+	def data(self):
+		lines = []
+		bottom = 0
+		for top, height, text in self.blocks:
+			textLines = text.split("\n")
+			pitch = self.LINE_HEIGHT
+			if height is not None:
+				pitch = max(3, min(pitch, height // len(textLines)))
+			for row, line in enumerate(textLines):
+				words = []
+				x = 10
+				for word in line.split():
+					width = len(word) * self.CHAR_WIDTH
+					words.append({"x": x, "y": top + row * pitch + pitch // 3, "width": width,
+						"height": pitch - pitch // 3, "text": word})
+					x += width + self.CHAR_WIDTH
+				lines.append(words)
+			bottom = top + len(textLines) * pitch
+		if self.icons:
+			y = bottom + 10
+			lines.append([{"x": 10 + i * 3 * self.CHAR_WIDTH, "y": y, "width": self.CHAR_WIDTH * 2,
+				"height": self.ICON_HEIGHT, "text": icon, "confidence": self.ICON_CONFIDENCE}
+				for i, icon in enumerate(self.icons)])
+		return lines
+
+	def makeTextInfo(self, obj, position):
+		return FakeTextInfo(self.text)
+
+
+class FakeEngine:
+	"""OCR engine worker threads: each job waits `latency` seconds and burns `cpu` seconds.
+
+	world.areaLatency maps a frame size (width, height) to a latency overriding
+	world.recognizeLatency, to model one target being slow to recognize.
+	"""
+
+	def __init__(self, world, workers=4):
+		self.world = world
+		self._jobs = queue.Queue()
+		for _i in range(workers):
+			threading.Thread(target=self._run, daemon=True).start()
+
+	def submit(self, frame, onResult, imgInfo=None):
+		world = self.world
+		world.counters["recognizeCalls"] += 1
+		self._jobs.put((world.epoch, frame, onResult, imgInfo, _frameStamp(frame)))
+		backlog = self._jobs.qsize()
+		if backlog > world.counters["maxBacklog"]:
+			world.counters["maxBacklog"] = backlog
+
+	def clear(self):
+		"""Drop queued jobs (a job already being processed still completes)."""
+		with self._jobs.mutex:
+			self._jobs.queue.clear()
+
+	def _run(self):
+		while True:
+			epoch, frame, onResult, imgInfo, stamp = self._jobs.get()
+			world = self.world
+			if epoch != world.epoch:
+				# Job left over from a previous run
+				continue
+			if world.recognizeCpu:
+				end = time.thread_time() + world.recognizeCpu
+				while time.thread_time() < end:
+					pass
+			size = (getattr(frame, "width", 0), getattr(frame, "height", 0))
+			mosaic = not hasattr(frame, "text") and imgInfo is not None
+			if mosaic:
+				size = (imgInfo.recogWidth, imgInfo.recogHeight)
+			latency = world.areaLatency.get(size, world.recognizeLatency)
+			if latency:
+				time.sleep(latency)
+			if epoch != world.epoch:
+				continue
+			if _frameStamp(frame) != stamp:
+				# The caller reused the buffer before the recognizer was done with it
+				world.counters["overwrittenFrames"] += 1
+			world.counters["recognitions"] += 1
+			world.counters[f"recognitions:{size[0]}x{size[1]}"] += 1
+			try:
+				if mosaic:
+					onResult(FakeResult(None, blocks=world.recognizedBlocks(frame, *size)))
+				else:
+					onResult(FakeResult(world.recognizedText(frame), world.iconWords()))
+			except Exception:
+				logging.getLogger("nvdaStubs").exception("recognizer callback failed")
+
+
+def _frameStamp(frame):
+	"""What identifies a frame's content: capture time, or a checksum of raw pixels."""
+	captureTime = getattr(frame, "captureTime", None)
+	return captureTime if captureTime is not None else zlib.crc32(memoryview(frame).cast("B"))
+
+
+class FakeWorld:
+	"""Shared state behind the stand-in modules."""
+
+	def __init__(self):
+		self.screen = FakeScreen()
+		self.recognizeLatency = 0.05
+		self.recognizeCpu = 0.0
+		self.areaLatency = {}  # (width, height) -> recognition latency
+		self.allocateFrames = True
+		self.ocrNoise = 0.0  # probability of a one-character recognition error
+		self.iconNoise = 0  # garbage words recognized from icons, different every frame
+		self.counters = collections.Counter()
+		self.spoken = []  # (dequeueTime, text)
+		self.keepSpeech = True  # False: only count announcements (long runs)
+		self.configPath = tempfile.mkdtemp(prefix="lionBench")
+		self.engine = None
+		self.epoch = 0
+		self._noiseState = 0
+
+	def reset(self):
+		"""Start a new run: forget counters and speech, drop queued recognitions."""
+		self.epoch += 1
+		if self.engine:
+			self.engine.clear()
+		self.counters.clear()
+		del self.spoken[:]
+
+	def recognizedText(self, frame):
+		text = getattr(frame, "text", None)
+		if text is None:
+			# Raw pixels (e.g. decoded from a recording): the text leads the buffer
+			text = bytes(frame).split(b"\0", 1)[0].decode("utf-8", "replace")
+		return self._addNoise(text)
+
+	def recognizedBlocks(self, pixels, width, height):
+		"""Read a mosaic: (top, height, text) of each run of marked rows (see FakeFrame).
+
+		An area's text must fit in its first row to be read back whole.
+		"""
+		data = memoryview(pixels).cast("B")
+		stride = width * 4
+		blocks = []
+		row = 0
+		while row < height:
+			if not data[row * stride]:
+				row += 1
+				continue
+			top = row
+			while row < height and data[row * stride]:
+				row += 1
+			text = bytes(data[top * stride:(top + 1) * stride]).split(b"\0", 1)[0]
+			blocks.append((top, row - top, self._addNoise(text.decode("utf-8", "replace"))))
+		return blocks
+
+	def _addNoise(self, text):
+		if self.ocrNoise:
+			# Deterministic pseudo-random character substitution
+			self._noiseState = (self._noiseState * 1103515245 + 12345) & 0x7FFFFFFF
+			if (self._noiseState % 1000) / 1000.0 < self.ocrNoise and text:
+				pos = self._noiseState % len(text)
+				text = text[:pos] + "#" + text[pos + 1:]
+		return text
+
+	def iconWords(self):
+		"""Garbage recognized from icons: iconNoise short words, different every call."""
+		if not self.iconNoise:
+			return ()
+		self.counters["iconFrames"] += 1
+		n = self.counters["iconFrames"]
+		return tuple(_ICON_GLYPHS[(n + i) % len(_ICON_GLYPHS)] + _ICON_GLYPHS[(n * 3 + i) % len(_ICON_GLYPHS)]
+			for i in range(self.iconNoise))
+
+	def speak(self, text):
+		self.counters["spoken"] += 1
+		if self.keepSpeech:
+			self.spoken.append((time.perf_counter(), text))
+
+
+world = FakeWorld()
+
+
+class _EventQueue:
+	"""Single consumer thread standing in for NVDA's main event queue."""
+
+	def __init__(self):
+		self._queue = queue.Queue()
+		threading.Thread(target=self._run, daemon=True).start()
+
+	def put(self, func, args, kwargs):
+		self._queue.put((func, args, kwargs))
+
+	def qsize(self):
+		return self._queue.qsize()
+
+	def drain(self, timeout=5.0):
+		"""Block until every queued function has run."""
+		done = threading.Event()
+		self._queue.put((done.set, (), {}))
+		done.wait(timeout)
+
+	def _run(self):
+		while True:
+			func, args, kwargs = self._queue.get()
+			try:
+				func(*args, **kwargs)
+			except Exception:
+				logging.getLogger("nvdaStubs").exception("queued function failed")
+
+
+class _Anything:
+	"""Object accepting any attribute access, call or index (stands in for gui.mainFrame)."""
+
+	def __getattr__(self, name):
+		if name.startswith("__"):
+			raise AttributeError(name)
+		return self
+
+	def __call__(self, *args, **kwargs):
+		return self
+
+	def __getitem__(self, index):
+		return self
+
+
+class _StubModule(types.ModuleType):
+	"""Module returning a dummy class for any unknown attribute (used for wx)."""
+
+	def __getattr__(self, name):
+		if name.startswith("__"):
+			raise AttributeError(name)
+		value = type(name, (object,), {"__init__": lambda self, *a, **k: None})
+		setattr(self, name, value)
+		return value
+
+
+def _parseDefault(spec):
+	"""Extract the default value from a configobj validator spec string."""
+	match = re.match(r"(\w+)\((.*)\)$", spec)
+	kind, args = match.group(1), match.group(2)
+	default = re.search(r"default=(.*)$", args).group(1)
+	if kind == "integer":
+		return int(default)
+	if kind == "float":
+		return float(default)
+	if kind == "boolean":
+		return default == "True"
+	if kind.endswith("list"):
+		items = re.match(r"list\((.*)\)", default).group(1)
+		values = [v.strip().strip("'\"") for v in items.split(",") if v.strip()]
+		if kind == "int_list":
+			return [int(v) for v in values]
+		if kind == "float_list":
+			return [float(v) for v in values]
+		return values
+	return default.strip("'\"")
+
+
+class _ConfSection(dict):
+	pass
+
+
+class _Conf:
+	"""Stand-in for config.conf: sections materialize from spec defaults."""
+
+	def __init__(self):
+		self.spec = {}
+		self._sections = {}
+
+	def defaults(self, name):
+		"""Return a fresh dict of the spec defaults of a section."""
+		return {k: _parseDefault(v) for k, v in self.spec[name].items()}
+
+	def __getitem__(self, name):
+		section = self._sections.get(name)
+		if section is None:
+			section = _ConfSection({k: _parseDefault(v) for k, v in self.spec[name].items()})
+			self._sections[name] = section
+		return section
+
+
+def _module(name, **attrs):
+	module = types.ModuleType(name)
+	module.__dict__.update(attrs)
+	sys.modules[name] = module
+	return module
+
+
+def _script(**kwargs):
+	def decorator(func):
+		func.__doc__ = kwargs.get("description", func.__doc__)
+		return func
+	return decorator
+
+
+def _createRecognizer(**kwargs):
+	class UwpOcr:
+		def __init__(self, language=None):
+			self.language = language
+
+		def recognize(self, pixels, imgInfo, onResult):
+			world.engine.submit(pixels, onResult, imgInfo)
+
+		def cancel(self):
+			pass
+
+	return UwpOcr
+
+
+class RecogImageInfo:
+	def __init__(self, screenLeft, screenTop, screenWidth, screenHeight, resizeFactor):
+		self.screenLeft = screenLeft
+		self.screenTop = screenTop
+		self.screenWidth = screenWidth
+		self.screenHeight = screenHeight
+		self.resizeFactor = resizeFactor
+		self.recogWidth = int(screenWidth * resizeFactor)
+		self.recogHeight = int(screenHeight * resizeFactor)
+
+	@classmethod
+	def createFromRecognizer(cls, left, top, width, height, recognizer):
+		return cls(left, top, width, height, 1)
+
+
+class _FakeDC:
+	"""Device context handle: what was last blitted into it."""
+
+	def __init__(self):
+		self.content = ("", 0.0)
+
+
+def _stretchBlt(destDC, destX, destY, destW, destH, srcDC, srcX, srcY, srcW, srcH, rop):
+	world.counters["captures"] += 1
+	destDC.content = world.screen.snapshot()
+	return 1
+
+
+def _getDIBits(dc, bitmap, startLine, lines, buffer, bmInfo, usage):
+	buffer.fill(*dc.content)
+	return lines
+
+
+class ScreenBitmap:
+	"""Stand-in for screenBitmap.ScreenBitmap: the same GDI steps on fake handles.
+
+	captureImage allocates a new frame every call, like NVDA's; the device
+	contexts can be blitted and read into an existing frame with gdi32's
+	StretchBlt and GetDIBits, as the plugin does to reuse buffers.
+	"""
+
+	def __init__(self, width, height):
+		world.counters["screenBitmaps"] += 1
+		self.width = width
+		self.height = height
+		self._screenDC = _FakeDC()
+		self._memDC = _FakeDC()
+		self._memBitmap = self._memDC
+
+	def captureImage(self, x, y, w, h):
+		_stretchBlt(self._memDC, 0, 0, self.width, self.height, self._screenDC, x, y, w, h, 0)
+		return self._getColors()
+
+	def _getColors(self):
+		buffer = FakeFrame(self.width, self.height, "", 0.0, allocate=world.allocateFrames)
+		_getDIBits(self._memDC, self._memBitmap, 0, self.height, buffer, None, 0)
+		return buffer
+
+
+class _RGBQUAD(ctypes.Structure):
+	_fields_ = [("rgbBlue", ctypes.c_ubyte), ("rgbGreen", ctypes.c_ubyte), ("rgbRed", ctypes.c_ubyte),
+		("rgbReserved", ctypes.c_ubyte)]
+
+
+class _BITMAPINFOHEADER(ctypes.Structure):
+	_fields_ = [("biSize", ctypes.c_uint32), ("biWidth", ctypes.c_int32), ("biHeight", ctypes.c_int32),
+		("biPlanes", ctypes.c_uint16), ("biBitCount", ctypes.c_uint16), ("biCompression", ctypes.c_uint32),
+		("biSizeImage", ctypes.c_uint32), ("biXPelsPerMeter", ctypes.c_int32),
+		("biYPelsPerMeter", ctypes.c_int32), ("biClrUsed", ctypes.c_uint32), ("biClrImportant", ctypes.c_uint32)]
+
+
+class _BITMAPINFO(ctypes.Structure):
+	_fields_ = [("bmiHeader", _BITMAPINFOHEADER), ("bmiColors", _RGBQUAD * 1)]
+
+
+class _FakeObject:
+	def __init__(self, location):
+		self.location = location
+		self.appModule = types.SimpleNamespace(appName="benchapp")
+
+
+class _Win32Function:
+	"""Callable accepting ctypes restype/argtypes assignments."""
+
+	def __init__(self, func):
+		self._func = func
+		self.restype = None
+		self.argtypes = None
+
+	def __call__(self, *args):
+		return self._func(*args)
+
+
+def _getSystemMetrics(index):
+	world.counters["getSystemMetrics"] += 1
+	return world.screen.width if index == 0 else world.screen.height
+
+
+def install():
+	"""Register the stand-in modules and return the imported plugin package."""
+	if "lion" in sys.modules:
+		return sys.modules["lion"]
+	builtins.__dict__.setdefault("_", lambda s: s)
+	logger = logging.getLogger("nvda")
+
+	class GlobalPlugin:
+		def __init__(self):
+			pass
+
+		def terminate(self):
+			pass
+
+	_module("globalPluginHandler", GlobalPlugin=GlobalPlugin)
+	_module("addonHandler", initTranslation=lambda: None)
+	_module("scriptHandler", getLastScriptRepeatCount=lambda: 0, script=_script)
+	screenObj = _FakeObject(RectLTWH(0, 0, world.screen.width, world.screen.height))
+	windowObj = _FakeObject(RectLTWH(100, 100, 800, 600))
+	focusObj = _FakeObject(RectLTWH(200, 200, 300, 40))
+	_module("api",
+		getNavigatorObject=lambda: focusObj,
+		getForegroundObject=lambda: windowObj,
+		getFocusObject=lambda: focusObj,
+		getDesktopObject=lambda: screenObj,
+		copyToClip=lambda text, notify=False: True)
+	contentRecog = _module("contentRecog", RecogImageInfo=RecogImageInfo)
+	contentRecog.uwpOcr = _module("contentRecog.uwpOcr", UwpOcr=_createRecognizer(),
+		getLanguages=lambda: ["en-US"])
+	_module("screenBitmap", ScreenBitmap=ScreenBitmap)
+	_module("winGDI", RGBQUAD=_RGBQUAD, BITMAPINFOHEADER=_BITMAPINFOHEADER, BITMAPINFO=_BITMAPINFO,
+		SRCCOPY=0x00CC0020, BI_RGB=0, DIB_RGB_COLORS=0)
+	_module("logHandler", log=logger)
+	_module("gui", mainFrame=_Anything())
+	_module("tones", beep=lambda *a, **k: None)
+	_module("textInfos", POSITION_ALL="all")
+	_module("ui", message=lambda text, *a, **k: world.speak(text))
+	eventQueue = _EventQueue()
+	_module("queueHandler", eventQueue=eventQueue,
+		queueFunction=lambda q, func, *args, **kwargs: q.put(func, args, kwargs))
+	_module("config", conf=_Conf())
+	wx = _StubModule("wx")
+	sys.modules["wx"] = wx
+	_module("locationHelper", RectLTWH=RectLTWH)
+	_module("globalVars", appArgs=types.SimpleNamespace(configPath=world.configPath))
+	if not hasattr(ctypes, "windll"):
+		# Idle/lock probes report a present user on an unlocked desktop
+		user32 = types.SimpleNamespace(
+			GetSystemMetrics=_getSystemMetrics,
+			GetLastInputInfo=lambda info: 0,
+			OpenInputDesktop=_Win32Function(lambda flags, inherit, access: 1),
+			CloseDesktop=_Win32Function(lambda desktop: 1),
+			SystemParametersInfoW=lambda action, param, value, flags: 1)
+		kernel32 = types.SimpleNamespace(GetTickCount=lambda: int(time.monotonic() * 1000) & 0xFFFFFFFF)
+		gdi32 = types.SimpleNamespace(StretchBlt=_stretchBlt, GetDIBits=_getDIBits)
+		ctypes.windll = types.SimpleNamespace(user32=user32, kernel32=kernel32, gdi32=gdi32)
+
+	world.engine = FakeEngine(world)
+	sys.path.insert(0, os.path.normpath(ADDON_DIR))
+	import lion
+	return lion
+
+
+def drainSpeech(timeout=5.0):
+	"""Wait until all announcements queued so far have been spoken."""
+	sys.modules["queueHandler"].eventQueue.drain(timeout)
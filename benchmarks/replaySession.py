@@ -0,0 +1,101 @@
+"""
+Replay a LION session recording through the diff, anti-repeat and speech stages.
+
+Records are fed as fast as possible (no capture, no recognizer, no waiting on
+the recorded timestamps) into GlobalPlugin._processOcrText using the stand-in
+NVDA modules, so settings such as the similarity threshold can be tuned
+against real sessions.
+
+Usage:
+	python benchmarks/replaySession.py session.lionrec
+	python benchmarks/replaySession.py session.lionrec --threshold 0.7 --show
+	python benchmarks/replaySession.py session.lionrec --filter digits --filter "regex:\d+%"
+	python benchmarks/replaySession.py session.lionrec --stable-frames 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import nvdaStubs  # noqa: E402
+
+
+def replay(lion, records, threshold=None, config=None):
+	"""Feed records through a fresh plugin.
+
+	Args:
+		lion: Plugin package returned by nvdaStubs.install()
+		records: Iterable of recording dicts
+		threshold: Similarity threshold overriding the recorded one
+		config: Optional dict of config.conf["lion"] overrides applied before replay
+
+	Returns:
+		dict: Replay statistics
+	"""
+	world = nvdaStubs.world
+	world.reset()
+	conf = sys.modules["config"].conf["lion"]
+	for key, value in (config or {}).items():
+		conf[key] = value
+	plugin = lion.GlobalPlugin()
+	# Records are not replayed in real time: only the frame requirement applies
+	stabilityGate = lion.lionFilters.stabilityGateFromConfig({"stableFrames": conf["stableFrames"]})
+	fed = spoken = changed = 0
+	start = time.perf_counter()
+	for record in records:
+		text = record.get("text")
+		if text is None:
+			continue
+		fed += 1
+		key = (record["app"], record["target"])
+		decision = plugin._processOcrText(text, key, record["thr"] if threshold is None else threshold,
+			stabilityGate=stabilityGate)
+		spoken += decision
+		if "spoken" in record and record["spoken"] != decision:
+			changed += 1
+	elapsed = time.perf_counter() - start
+	nvdaStubs.drainSpeech()
+	plugin.terminate()
+	return {
+		"records": fed,
+		"spoken": spoken,
+		"changedDecisions": changed,
+		"microsPerRecord": elapsed / fed * 1e6 if fed else 0.0,
+		"announcements": [text for _t, text in world.spoken],
+	}
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+	parser.add_argument("recording", help="recording file written by LION")
+	parser.add_argument("--threshold", type=float, help="override the recorded similarity threshold")
+	parser.add_argument("--filter", action="append",
+		help="text filter rule replacing the default ones (repeatable, see lionFilters.py)")
+	parser.add_argument("--stable-frames", type=int,
+		help="speak changed text only once it was recognized in this many consecutive records")
+	parser.add_argument("--show", action="store_true", help="print every announcement")
+	args = parser.parse_args(argv)
+
+	lion = nvdaStubs.install()
+	records = list(lion.lionRecorder.readRecords(args.recording))
+	overrides = {}
+	if args.filter is not None:
+		overrides["filters"] = args.filter
+	if args.stable_frames is not None:
+		overrides["stableFrames"] = args.stable_frames
+	stats = replay(lion, records, args.threshold, overrides or None)
+	print(f"records={stats['records']} spoken={stats['spoken']} "
+		f"({stats['spoken'] * 100.0 / max(1, stats['records']):.1f}%) "
+		f"changedDecisions={stats['changedDecisions']} "
+		f"{stats['microsPerRecord']:.1f} us/record")
+	if args.show:
+		for text in stats["announcements"]:
+			print("---")
+			print(text)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())